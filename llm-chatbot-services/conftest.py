@@ -0,0 +1,9 @@
+"""Shared pytest fixtures for the LLM Chatbot Services"""
+
+import pytest
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run the async tests on asyncio, the event loop the services use"""
+    return "asyncio"
@@ -1,9 +1,31 @@
 """Dependency factory for the API Gateway"""
 
+import redis.asyncio as redis
+from shared import RetryBudget
 from config import AppConfig
 from app.services.proxy_client import ProxyClient
+from app.services.token_cache import TokenValidationCache
+from app.services.response_cache import ResponseCache
+from app.services.upstream_health import UpstreamHealthChecker
+from app.services.admission import AdmissionController
+from app.services.rate_limit import (
+    HybridRateLimiter,
+    RedisRateLimiter,
+    RateLimitPolicy,
+)
+from app.services.routing import RouteTable
 
 _app_config = AppConfig()
+_proxy_clients: dict[str, ProxyClient] = {}
+_route_table = RouteTable.from_config(_app_config)
+# One budget for every upstream so hedging cannot add up across them
+_hedge_budget = RetryBudget(
+    ratio=_app_config.PROXY_HEDGE_BUDGET_RATIO,
+    min_retries_per_sec=_app_config.PROXY_HEDGE_BUDGET_MIN_PER_SEC,
+)
+_token_validation_cache = TokenValidationCache(_app_config)
+_upstream_health_checker = UpstreamHealthChecker(_app_config)
+_admission_controller = AdmissionController.from_config(_app_config)
 
 
 def get_app_config() -> AppConfig:
@@ -11,6 +33,69 @@ def get_app_config() -> AppConfig:
     return _app_config
 
 
-def get_proxy_client(base_url: str) -> ProxyClient:
-    """Get the proxy client"""
-    return ProxyClient(base_url)
+def get_route_table() -> RouteTable:
+    """Get the route table"""
+    return _route_table
+
+
+def get_proxy_client(name: str) -> ProxyClient:
+    """Get the shared proxy client for an upstream"""
+    if name not in _proxy_clients:
+        _proxy_clients[name] = ProxyClient(
+            name,
+            _app_config.UPSTREAM_URLS[name],
+            _app_config,
+            hedge_budget=_hedge_budget,
+        )
+    return _proxy_clients[name]
+
+
+def get_proxy_clients() -> list[ProxyClient]:
+    """Get every proxy client created so far"""
+    return list(_proxy_clients.values())
+
+
+def get_token_validation_cache() -> TokenValidationCache:
+    """Get the token validation cache"""
+    return _token_validation_cache
+
+
+def get_upstream_health_checker() -> UpstreamHealthChecker:
+    """Get the upstream health checker"""
+    return _upstream_health_checker
+
+
+def get_admission_controller() -> AdmissionController:
+    """Get the admission controller"""
+    return _admission_controller
+
+
+def get_rate_limiter(
+    redis_client: redis.Redis,
+) -> HybridRateLimiter | RedisRateLimiter:
+    """Get the rate limiter for the configured algorithm"""
+    if _app_config.RATE_LIMIT_ALGORITHM == "hybrid":
+        return HybridRateLimiter(
+            redis_client,
+            sync_interval=_app_config.RATE_LIMIT_SYNC_INTERVAL_IN_MS / 1000,
+            sync_batch_size=_app_config.RATE_LIMIT_SYNC_BATCH_SIZE,
+        )
+    return RedisRateLimiter(redis_client, _app_config.RATE_LIMIT_ALGORITHM)
+
+
+def get_ip_rate_limit_policy() -> RateLimitPolicy:
+    """Get the per client IP budget enforced before authentication"""
+    return RateLimitPolicy(
+        name="ip",
+        limit=_app_config.RATE_LIMIT_IP_LIMIT,
+        window=_app_config.RATE_LIMIT_IP_WINDOW_IN_SECS,
+        key="ip",
+    )
+
+
+def get_response_cache(redis_client: redis.Redis) -> ResponseCache:
+    """Get the response cache, backed by Redis when configured"""
+    return ResponseCache(
+        _app_config,
+        redis_client if _app_config.RESPONSE_CACHE_REDIS_ENABLED else None,
+    )
@@ -0,0 +1,19 @@
+"""Module for the role dependencies"""
+
+from fastapi import HTTPException, Request, status
+
+
+def require_role(required_role: str):
+    """Require a role"""
+
+    def role_dependency(request: Request) -> dict:
+        """Role dependency"""
+        user = getattr(request.state, "user", None)
+        if user is None or user.get("role") != required_role:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"User does not have required role: {required_role}",
+            )
+        return user
+
+    return role_dependency
@@ -1,28 +1,112 @@
 """Module for the api-gateway service"""
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from redis.asyncio import Redis
-from shared import get_logger, RedisClient
-from app.dependencies.dependency_factory import get_app_config
-from app.routes import (
-    health_router,
-    auth_proxy_router,
-    chatbot_proxy_router,
-    conversation_proxy_router,
+from shared import (
+    get_logger,
+    set_tracer,
+    InstrumentationMiddleware,
+    RedisClient,
+    Tracer,
+    TracingMiddleware,
+    metrics_router,
 )
+from app.dependencies.dependency_factory import (
+    get_app_config,
+    get_proxy_client,
+    get_proxy_clients,
+    get_token_validation_cache,
+    get_rate_limiter,
+    get_ip_rate_limit_policy,
+    get_response_cache,
+    get_upstream_health_checker,
+    get_admission_controller,
+    get_route_table,
+)
+from app.routes import health_router, build_proxy_router, admin_router
 from app.middleware.auth_middleware import AuthMiddleware
+from app.middleware.route_resolver import RouteResolverMiddleware
 from app.middleware.rate_limiter import RedisRateLimitMiddleware
+from app.middleware.response_cache import ResponseCacheMiddleware
+from app.middleware.admission import AdmissionControlMiddleware
+from app.middleware.compression import CompressionMiddleware
+from app.services.token_revocation_listener import TokenRevocationListener
+from app.services.compression import ResponseCompressor
 
 logger = get_logger(service_name="api_gateway")
 app_config = get_app_config()
+tracer = Tracer.from_config("api_gateway", app_config)
+set_tracer(tracer)
 redis_client = RedisClient(app_config).get_redis_client()
+token_revocation_listener = TokenRevocationListener(
+    redis_client, get_token_validation_cache()
+)
+rate_limiter = get_rate_limiter(redis_client)
+
+
+@asynccontextmanager
+async def lifespan(_fastapi_app: FastAPI):
+    """Lifespan for the application"""
+    await tracer.start()
+    logger.info("Opening upstream connection pools")
+    for proxy_client in get_proxy_clients():
+        await proxy_client.start()
+    await token_revocation_listener.start()
+    await rate_limiter.start()
+    await get_upstream_health_checker().start()
+    yield
+    await get_upstream_health_checker().close()
+    await rate_limiter.stop()
+    await token_revocation_listener.stop()
+    logger.info("Closing upstream connection pools")
+    for proxy_client in get_proxy_clients():
+        await proxy_client.close()
+    await tracer.stop()
 
 
-app = FastAPI()
-app.add_middleware(AuthMiddleware, app_config=app_config)
+app = FastAPI(lifespan=lifespan)
+# Innermost so cache hits are still authenticated and rate limited
+if app_config.RESPONSE_CACHE_ENABLED:
+    app.add_middleware(
+        ResponseCacheMiddleware, response_cache=get_response_cache(redis_client)
+    )
+# Inside the rate limiter so over-limit clients never take a queue slot
+if app_config.ADMISSION_CONTROL_ENABLED:
+    app.add_middleware(
+        AdmissionControlMiddleware, admission_controller=get_admission_controller()
+    )
+# Added first so it runs inside auth and can key budgets by the user
+app.add_middleware(RedisRateLimitMiddleware, rate_limiter=rate_limiter)
+app.add_middleware(
+    AuthMiddleware,
+    app_config=app_config,
+    auth_client=get_proxy_client("auth"),
+    token_cache=get_token_validation_cache(),
+)
+# Outside auth so requests with missing or forged tokens still spend a per
+# IP budget before the gateway verifies them
+app.add_middleware(
+    RedisRateLimitMiddleware,
+    rate_limiter=rate_limiter,
+    policy=get_ip_rate_limit_policy(),
+)
+# Outside auth so one lookup serves the auth, rate limit, cache and proxy policies
+app.add_middleware(RouteResolverMiddleware, route_table=get_route_table())
+# Outside the cache so bodies are stored once, uncompressed, and every
+# response including auth and rate limit errors is negotiated
+if app_config.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware, compressor=ResponseCompressor.from_config(app_config)
+    )
+# Outside the rest so the request time covers every other middleware
 app.add_middleware(
-    RedisRateLimitMiddleware, redis_client=redis_client, limit=100, window=60
+    InstrumentationMiddleware,
+    service_name="api_gateway",
+    server_timing=app_config.SERVER_TIMING_ENABLED,
 )
+# Outermost so the server span is the parent of every span of the request
+app.add_middleware(TracingMiddleware)
 
 
 logger.info("API Gateway service is up and running.")
@@ -35,9 +119,10 @@ def read_root():
 
 
 app.include_router(health_router)
-app.include_router(auth_proxy_router)
-app.include_router(chatbot_proxy_router)
-app.include_router(conversation_proxy_router)
+app.include_router(metrics_router)
+app.include_router(admin_router)
+# Last so the gateway's own endpoints take precedence over proxied prefixes
+app.include_router(build_proxy_router(get_route_table()))
 
 
 # Setup Redis client
@@ -0,0 +1,67 @@
+"""Admission control middleware"""
+
+import time
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from shared import time_stage
+from app.middleware.asgi_utils import get_normalized_path
+from app.services.admission import AdmissionController, AdmissionRejected
+
+# Upstream answers that signal overload and shrink the limit like slow ones
+OVERLOAD_STATUS_CODES = {502, 503, 504}
+
+
+class AdmissionControlMiddleware:
+    """Admits requests through the admission controller, shedding with 503"""
+
+    def __init__(self, app: ASGIApp, admission_controller: AdmissionController):
+        """Initialize the admission control middleware"""
+        self.app = app
+        self.admission_controller = admission_controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Admit, queue or shed the request"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route_class = self.admission_controller.resolve(get_normalized_path(scope))
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            with time_stage("admission"):
+                await self.admission_controller.acquire(route_class)
+        except AdmissionRejected as e:
+            response = JSONResponse(
+                status_code=503,
+                content={
+                    "detail": "Gateway is overloaded. Try again in a few seconds."
+                },
+                headers={"Retry-After": str(e.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        admitted_at = time.monotonic()
+        latency = None
+        dropped = True
+
+        async def send_and_observe(message: Message):
+            nonlocal latency, dropped
+            if message["type"] == "http.response.start":
+                # Time to the first byte, so long streams do not read as slow
+                latency = time.monotonic() - admitted_at
+                dropped = message["status"] in OVERLOAD_STATUS_CODES
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_observe)
+        finally:
+            self.admission_controller.release(
+                route_class,
+                admitted_at,
+                latency if latency is not None else time.monotonic() - admitted_at,
+                dropped,
+            )
@@ -0,0 +1,33 @@
+"""Helpers for the gateway's ASGI middlewares"""
+
+from starlette.types import Scope
+
+
+def get_header(scope: Scope, name: bytes) -> str | None:
+    """Get a request header from the scope by its lowercase name"""
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+def get_client_ip(scope: Scope) -> str:
+    """Get the client IP, preferring the X-Forwarded-For header"""
+    forwarded_for = get_header(scope, b"x-forwarded-for")
+    if forwarded_for:
+        return forwarded_for
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def get_normalized_path(scope: Scope) -> str:
+    """Get the request path without a trailing slash"""
+    return scope["path"].rstrip("/")
+
+
+def encode_headers(headers: dict[str, str]) -> list[tuple[bytes, bytes]]:
+    """Encode headers into the raw ASGI form"""
+    return [
+        (key.lower().encode("latin-1"), value.encode("latin-1"))
+        for key, value in headers.items()
+    ]
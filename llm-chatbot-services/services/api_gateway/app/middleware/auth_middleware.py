@@ -1,66 +1,121 @@
 """Auth middleware"""
 
-from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
 import httpx
+from jose import jwt
+from starlette.types import ASGIApp, Receive, Scope, Send
 from config import AppConfig
-from shared import get_logger
-from starlette.datastructures import URL
-from app.middleware.public_path import public_paths
+from shared import get_logger, time_stage
+from app.middleware.asgi_utils import get_header
+from app.middleware.route_resolver import get_gateway_route
+from app.services.proxy_client import ProxyClient
+from app.services.circuit_breaker import CircuitOpenError
+from app.services.jwks_client import JWKSClient, JWKSUnavailableError
+from app.services.token_verifier import TokenVerifier
+from app.services.token_cache import TokenValidationCache
+from app.services.single_flight import SingleFlight
 
 logger = get_logger(service_name="api_gateway")
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
+class AuthMiddleware:
     """Auth middleware"""
 
-    def __init__(self, app, app_config: AppConfig):
-        super().__init__(app)
+    def __init__(
+        self,
+        app: ASGIApp,
+        app_config: AppConfig,
+        auth_client: ProxyClient,
+        token_cache: TokenValidationCache,
+    ):
+        self.app = app
         self.app_config = app_config
-        self._public_paths = public_paths
+        self.auth_client = auth_client
+        self.token_cache = token_cache
+        self._in_flight_validations = SingleFlight("token_validation")
+        self._token_verifier = None
+        if app_config.AUTH_LOCAL_JWT_VERIFICATION_ENABLED:
+            self._token_verifier = TokenVerifier(
+                JWKSClient(auth_client, app_config), app_config
+            )
 
-    async def dispatch(self, request: Request, call_next):
-        """Dispatch the request"""
-        if self._is_bypass_path(request):
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Authenticate the request"""
+        if scope["type"] != "http" or get_gateway_route(scope).is_public:
+            await self.app(scope, receive, send)
+            return
 
-        token = self._extract_token(request)
-        is_valid = await self._validate_token(token)
+        token = self._extract_token(scope)
+        try:
+            with time_stage("auth"):
+                claims = await self._validate_token(token)
+        except (httpx.RequestError, JWKSUnavailableError, CircuitOpenError) as e:
+            logger.error(f"Auth-service unreachable: {e}")
+            response = JSONResponse(
+                status_code=503,
+                content={"detail": "Authentication service unavailable"},
+            )
+            await response(scope, receive, send)
+            return
 
-        if not is_valid:
-            return JSONResponse(status_code=401, content={"detail": "Invalid token"})
+        if claims is None:
+            response = JSONResponse(
+                status_code=401, content={"detail": "Invalid token"}
+            )
+            await response(scope, receive, send)
+            return
 
-        return await call_next(request)
+        scope.setdefault("state", {})["user"] = claims
+        await self.app(scope, receive, send)
 
-    def _extract_token(self, request: Request) -> str:
+    def _extract_token(self, scope: Scope) -> str:
         """Extract the token from the Authorization header"""
-        auth_header = request.headers.get("Authorization")
+        auth_header = get_header(scope, b"authorization")
         if not auth_header or not auth_header.startswith("Bearer "):
             return None
         return auth_header.split(" ")[1]
 
-    async def _validate_token(self, token: str) -> bool:
-        """Validate the token"""
+    async def _validate_token(self, token: str) -> dict | None:
+        """Validate the token and return its claims"""
         if not token:
-            return False
-        try:
-            async with httpx.AsyncClient() as client:
-                logger.info(f"URL: {self.app_config.AUTH_SERVICE_URL}/me")
-                response = await client.get(
-                    f"{self.app_config.AUTH_SERVICE_URL}/me",
-                    headers={"Authorization": f"Bearer {token}"},
-                    timeout=3.0,
-                )
-                return response.status_code == 200
-        except httpx.RequestError as e:
-            logger.error(f"Auth-service unreachable: {e}")
-            return JSONResponse(
-                status_code=503,
-                content={"detail": "Authentication service unavailable"},
+            return None
+
+        claims = self.token_cache.get(token)
+        if claims is None:
+            claims = await self._in_flight_validations.do(
+                token, lambda: self._verify_and_cache_token(token)
             )
 
-    def _is_bypass_path(self, request: Request) -> bool:
-        """Check if the path is a bypass path"""
-        normalized_path = str(URL(request.url.path).path.rstrip("/"))
-        return (request.method, normalized_path) in self._public_paths
+        if claims is not None and self.token_cache.is_revoked(claims):
+            return None
+        return claims
+
+    async def _verify_and_cache_token(self, token: str) -> dict | None:
+        """Verify the token and cache the claims if it is valid"""
+        claims = await self._verify_token(token)
+        if claims is not None:
+            self.token_cache.set(token, claims)
+        return claims
+
+    async def _verify_token(self, token: str) -> dict | None:
+        """Verify the token locally or with the auth service"""
+        if self._token_verifier is not None:
+            return await self._token_verifier.verify(token)
+        return await self._validate_token_with_auth_service(token)
+
+    async def _validate_token_with_auth_service(self, token: str) -> dict | None:
+        """Validate the token by calling the auth service /me endpoint"""
+        response = await self.auth_client.send(
+            "GET",
+            "/me",
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=3.0,
+        )
+        if response.status_code != 200:
+            return None
+        user = response.json()["user"]
+        return {
+            **jwt.get_unverified_claims(token),
+            "sub": user["email"],
+            "role": user["role"],
+        }
@@ -0,0 +1,146 @@
+"""Response compression middleware"""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.middleware.asgi_utils import get_header
+from app.services.compression import (
+    ResponseCompressor,
+    COMPRESSION_BYTES,
+    COMPRESSION_RESPONSES,
+)
+
+# Statuses that never carry a body
+BODYLESS_STATUSES = {204, 304}
+
+
+class CompressionMiddleware:
+    """Compresses response bodies with the coding negotiated from Accept-Encoding
+
+    Bodies the upstream already encoded are passed through untouched, as are
+    bodies below the size threshold. Every chunk is flushed through the
+    encoder as it arrives, so streamed responses are never held back.
+    """
+
+    def __init__(self, app: ASGIApp, compressor: ResponseCompressor):
+        """Initialize the compression middleware"""
+        self.app = app
+        self.compressor = compressor
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Compress the response if the client and content type allow it"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self.compressor.negotiate(get_header(scope, b"accept-encoding"))
+        start_message: Message | None = None
+        encoder = None
+        passthrough = False
+
+        async def send_compressed(message: Message):
+            nonlocal start_message, encoder, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = message.get("headers", [])
+                levels = self._get_levels(message["status"], headers)
+                if levels is None:
+                    passthrough = True
+                    await send(message)
+                    return
+
+                # Compressible, so caches must key the response by coding
+                message = {**message, "headers": _add_vary(headers)}
+                level = levels.get(encoding) if encoding is not None else None
+                content_length = _get_content_length(headers)
+                if level is None or (
+                    content_length is not None
+                    and content_length < self.compressor.min_size
+                ):
+                    passthrough = True
+                    await send(message)
+                    return
+                start_message = message
+                encoder = self.compressor.create_encoder(encoding, level)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if start_message is not None:
+                if not more_body and len(body) < self.compressor.min_size:
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+                await send(_encoded_start(start_message, encoding))
+                start_message = None
+                COMPRESSION_RESPONSES.labels(encoding).inc()
+
+            if not body and more_body:
+                return
+            compressed = encoder.compress(body)
+            if not more_body:
+                compressed += encoder.finish()
+            COMPRESSION_BYTES.labels(encoding, "in").inc(len(body))
+            COMPRESSION_BYTES.labels(encoding, "out").inc(len(compressed))
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": compressed,
+                    "more_body": more_body,
+                }
+            )
+
+        await self.app(scope, receive, send_compressed)
+
+    def _get_levels(
+        self, status: int, headers: list[tuple[bytes, bytes]]
+    ) -> dict[str, int] | None:
+        """Get the levels of a response, None when it must be sent as it is"""
+        if status < 200 or status in BODYLESS_STATUSES:
+            return None
+        content_type = None
+        for key, value in headers:
+            if key == b"content-encoding":
+                return None
+            if key == b"cache-control" and b"no-transform" in value.lower():
+                return None
+            if key == b"content-type":
+                content_type = value.decode("latin-1")
+        return self.compressor.get_levels(content_type)
+
+
+def _get_content_length(headers: list[tuple[bytes, bytes]]) -> int | None:
+    """Get the Content-Length of a response if it declared one"""
+    for key, value in headers:
+        if key == b"content-length" and value.isdigit():
+            return int(value)
+    return None
+
+
+def _add_vary(headers: list[tuple[bytes, bytes]]) -> list[tuple[bytes, bytes]]:
+    """Add Accept-Encoding to the Vary header"""
+    for key, value in headers:
+        if key == b"vary" and (
+            b"accept-encoding" in value.lower() or value.strip() == b"*"
+        ):
+            return headers
+    return [*headers, (b"vary", b"Accept-Encoding")]
+
+
+def _encoded_start(message: Message, encoding: str) -> Message:
+    """Rewrite the response start for an encoded body
+
+    The length is no longer known and a strong ETag no longer describes the
+    bytes sent, so the tag is weakened as it still names the same content.
+    """
+    headers = []
+    for key, value in message["headers"]:
+        if key == b"content-length":
+            continue
+        if key == b"etag" and not value.startswith(b"W/"):
+            value = b"W/" + value
+        headers.append((key, value))
+    headers.append((b"content-encoding", encoding.encode("latin-1")))
+    return {**message, "headers": headers}
@@ -1,48 +1,96 @@
 """Rate limiter middleware"""
 
-import time
-import redis.asyncio as redis
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
 from fastapi.responses import JSONResponse
-from shared import get_logger
+from prometheus_client import Counter
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from shared import get_logger, time_stage
+from app.middleware.asgi_utils import encode_headers, get_client_ip
+from app.middleware.route_resolver import get_gateway_route
+from app.services.rate_limit import (
+    HybridRateLimiter,
+    RedisRateLimiter,
+    RateLimitPolicy,
+)
 
+RATE_LIMIT_REJECTIONS = Counter(
+    "gateway_rate_limit_rejections_total",
+    "Requests rejected by the rate limiter",
+    ["policy"],
+)
 
-class RedisRateLimitMiddleware(BaseHTTPMiddleware):
-    """Rate limiter middleware"""
+
+class RedisRateLimitMiddleware:
+    """Rate limiter middleware
+
+    Enforces the route's policy, or the given policy on every route the
+    route table does not exempt. A fixed policy only adds its headers to
+    rejections, so they do not clash with the route's.
+    """
 
     def __init__(
-        self, app, redis_client: redis.Redis, limit: int = 100, window: int = 60
+        self,
+        app: ASGIApp,
+        rate_limiter: HybridRateLimiter | RedisRateLimiter,
+        policy: RateLimitPolicy | None = None,
     ):
         """Initialize the rate limiter middleware"""
-        super().__init__(app)
-        self.redis = redis_client
-        self.limit = limit
-        self.window = window
+        self.app = app
+        self.rate_limiter = rate_limiter
+        self.policy = policy
         self.logger = get_logger(service_name="api_gateway")
 
-    async def dispatch(self, request: Request, call_next):
-        """Dispatch the request"""
-        self.logger.info(f"Dispatching request: {request.method} {request.url}")
-        ip = self._get_ip(request)
-        key = f"ratelimit:{ip}"
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Rate limit the request"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        current_ts = int(time.time())
+        self.logger.info(f"Dispatching request: {scope['method']} {scope['path']}")
+        policy = get_gateway_route(scope).rate_limit
+        if policy.cost == 0:
+            await self.app(scope, receive, send)
+            return
+        if self.policy is not None:
+            policy = self.policy
 
-        pipe = self.redis.pipeline()
-        pipe.zadd(key, {str(current_ts): current_ts})
-        pipe.zremrangebyscore(key, 0, current_ts - self.window)
-        pipe.zcard(key)
-        pipe.expire(key, self.window + 1)
-        _, _, count, _ = await pipe.execute()
+        try:
+            with time_stage("rate_limit"):
+                result = await self.rate_limiter.hit(
+                    f"{policy.name}:{self._get_client_key(scope, policy)}",
+                    policy.limit,
+                    policy.window,
+                    policy.cost,
+                )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.logger.error(f"Rate limiter unavailable, allowing request: {e}")
+            await self.app(scope, receive, send)
+            return
 
-        if count > self.limit:
-            return JSONResponse(
+        if not result.allowed:
+            RATE_LIMIT_REJECTIONS.labels(policy=policy.name).inc()
+            response = JSONResponse(
                 status_code=429,
-                content={"detail": f"Rate limit exceeded. Try again in a few seconds."},
+                content={"detail": "Rate limit exceeded. Try again in a few seconds."},
+                headers=result.headers(),
             )
+            await response(scope, receive, send)
+            return
+        if self.policy is not None:
+            await self.app(scope, receive, send)
+            return
+
+        rate_limit_headers = encode_headers(result.headers())
+
+        async def send_with_rate_limit_headers(message: Message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *rate_limit_headers]
+            await send(message)
 
-        return await call_next(request)
+        await self.app(scope, receive, send_with_rate_limit_headers)
 
-    def _get_ip(self, request: Request):
-        return request.headers.get("X-Forwarded-For", request.client.host)
+    def _get_client_key(self, scope: Scope, policy: RateLimitPolicy) -> str:
+        """Key the budget by the authenticated user, falling back to the client IP"""
+        user = scope.get("state", {}).get("user")
+        if policy.key == "user" and user is not None:
+            return f"user:{user['sub']}"
+        return f"ip:{get_client_ip(scope)}"
@@ -0,0 +1,157 @@
+"""Response cache middleware"""
+
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.middleware.asgi_utils import get_header, get_normalized_path
+from app.middleware.route_resolver import get_gateway_route
+from app.services.response_cache import (
+    CachedResponse,
+    ResponseCache,
+    RESPONSE_CACHE_REQUESTS,
+)
+
+INVALIDATING_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+# Headers carried over to a 304 so clients can refresh their stored copy
+NOT_MODIFIED_HEADERS = {b"etag", b"cache-control", b"vary", b"expires"}
+
+
+class ResponseCacheMiddleware:
+    """Serves configured GET routes from the response cache
+
+    Entries are keyed by the authenticated user, so the middleware must run
+    inside auth. Writes by a user drop the user's entries once the upstream
+    starts responding.
+    """
+
+    def __init__(self, app: ASGIApp, response_cache: ResponseCache):
+        """Initialize the response cache middleware"""
+        self.app = app
+        self.response_cache = response_cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Serve the request from the cache or cache its response"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        user = scope.get("state", {}).get("user")
+        owner = user["sub"] if user is not None else "anonymous"
+        if scope["method"] in INVALIDATING_METHODS and user is not None:
+            await self.app(scope, receive, self._invalidate_on_response(owner, send))
+            return
+
+        if not self.response_cache.is_cacheable(
+            scope["method"], get_gateway_route(scope)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        key = f"{get_normalized_path(scope)}?{scope['query_string'].decode('latin-1')}"
+        if_none_match = get_header(scope, b"if-none-match")
+        cached = await self.response_cache.get(owner, key)
+        if cached is not None:
+            RESPONSE_CACHE_REQUESTS.labels(result="hit").inc()
+            await self._send_cached(cached, if_none_match, b"HIT", send)
+            return
+
+        RESPONSE_CACHE_REQUESTS.labels(result="miss").inc()
+        started_at = time.monotonic()
+        start_message: Message | None = None
+        body_parts: list[bytes] = []
+        body_size = 0
+        passthrough = False
+
+        async def send_and_cache(message: Message):
+            nonlocal start_message, body_size, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                if message["status"] != 200 or not self._is_storable(message):
+                    passthrough = True
+                    await send(message)
+                    return
+                start_message = message
+                return
+
+            body_parts.append(message.get("body", b""))
+            body_size += len(body_parts[-1])
+            if message.get("more_body", False):
+                if body_size > self.response_cache.max_body_size:
+                    passthrough = True
+                    await send(start_message)
+                    await send(
+                        {
+                            "type": "http.response.body",
+                            "body": b"".join(body_parts),
+                            "more_body": True,
+                        }
+                    )
+                return
+
+            response = CachedResponse.from_upstream(
+                start_message["status"],
+                start_message.get("headers", []),
+                b"".join(body_parts),
+            )
+            if body_size <= self.response_cache.max_body_size:
+                await self.response_cache.set(owner, key, response, started_at)
+            await self._send_cached(response, if_none_match, b"MISS", send)
+
+        await self.app(scope, receive, send_and_cache)
+
+    def _invalidate_on_response(self, owner: str, send: Send) -> Send:
+        """Wrap send to drop the owner's entries when the response starts"""
+
+        async def send_and_invalidate(message: Message):
+            if message["type"] == "http.response.start":
+                await self.response_cache.invalidate(owner)
+            await send(message)
+
+        return send_and_invalidate
+
+    @staticmethod
+    def _is_storable(message: Message) -> bool:
+        """Check the upstream did not opt out of caching or send a stream"""
+        for key, value in message.get("headers", []):
+            if key == b"set-cookie":
+                return False
+            if key == b"cache-control" and b"no-store" in value.lower():
+                return False
+            if key == b"content-type" and value.startswith(b"text/event-stream"):
+                return False
+        return True
+
+    @staticmethod
+    async def _send_cached(
+        response: CachedResponse, if_none_match: str | None, status: bytes, send: Send
+    ):
+        """Send a cached response, or a bodyless 304 when the client has it"""
+        headers = [
+            (key.encode("latin-1"), value.encode("latin-1"))
+            for key, value in response.headers
+        ]
+        if response.matches(if_none_match):
+            headers = [
+                (key, value) for key, value in headers if key in NOT_MODIFIED_HEADERS
+            ]
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [*headers, (b"x-cache", status)],
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status,
+                "headers": [*headers, (b"x-cache", status)],
+            }
+        )
+        await send({"type": "http.response.body", "body": response.body})
@@ -0,0 +1,31 @@
+"""Route resolver middleware"""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.middleware.asgi_utils import get_normalized_path
+from app.services.routing import GatewayRoute, RouteTable
+
+
+def get_gateway_route(scope: Scope) -> GatewayRoute:
+    """Get the route the resolver matched the request to"""
+    return scope["state"]["gateway_route"]
+
+
+class RouteResolverMiddleware:
+    """Looks the request up in the route table once for every later policy
+
+    Runs outside auth so auth, rate limiting, the response cache and the
+    proxy all read the same route from the scope state.
+    """
+
+    def __init__(self, app: ASGIApp, route_table: RouteTable):
+        """Initialize the route resolver middleware"""
+        self.app = app
+        self.route_table = route_table
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Resolve the route of the request"""
+        if scope["type"] == "http":
+            scope.setdefault("state", {})["gateway_route"] = self.route_table.resolve(
+                scope["method"], get_normalized_path(scope)
+            )
+        await self.app(scope, receive, send)
@@ -0,0 +1,35 @@
+"""Admin endpoints for the API Gateway"""
+
+from fastapi import APIRouter, Depends
+from app.dependencies.dependency_factory import (
+    get_admission_controller,
+    get_proxy_clients,
+)
+from app.dependencies.roles import require_role
+
+router = APIRouter(
+    prefix="/admin", tags=["Admin"], dependencies=[Depends(require_role("admin"))]
+)
+
+
+@router.get("/upstreams")
+async def upstreams() -> dict:
+    """Report the load and circuit breaker state of every upstream replica"""
+    return {
+        proxy_client.name: {
+            "strategy": proxy_client.load_balancer.strategy,
+            "hedging": (
+                proxy_client.hedger.snapshot() if proxy_client.hedger else None
+            ),
+            "endpoints": {
+                endpoint.url: endpoint.snapshot() for endpoint in proxy_client.endpoints
+            },
+        }
+        for proxy_client in get_proxy_clients()
+    }
+
+
+@router.get("/admission")
+async def admission() -> dict:
+    """Report the concurrency limit, load and queue of every route class"""
+    return get_admission_controller().snapshot()
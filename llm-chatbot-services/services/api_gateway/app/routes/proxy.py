@@ -0,0 +1,47 @@
+"""Proxy endpoints for the API Gateway"""
+
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import JSONResponse
+from shared import get_logger
+from app.dependencies.dependency_factory import get_proxy_client
+from app.middleware.route_resolver import get_gateway_route
+from app.services.routing import RouteTable
+
+logger = get_logger(service_name="api_gateway")
+
+PROXY_METHODS = ["GET", "POST", "PUT", "DELETE", "PATCH"]
+
+
+async def proxy(request: Request) -> Response:
+    """Proxy the request to the upstream of its route"""
+    route = get_gateway_route(request.scope)
+    if route.upstream is None:
+        return JSONResponse(status_code=404, content={"detail": "Not Found"})
+
+    path = route.get_upstream_path(request.scope["path"])
+    logger.info(f"Forwarding request to {route.upstream} service: {path}")
+    return await get_proxy_client(route.upstream).proxy_request(
+        request,
+        path,
+        timeout=route.timeout,
+        max_retries=route.max_retries,
+    )
+
+
+def build_proxy_router(route_table: RouteTable) -> APIRouter:
+    """Build one catch-all route per prefix that names an upstream"""
+    router = APIRouter()
+    prefixes = route_table.upstream_prefixes()
+    # Longest first so the request metrics are labelled by the closest prefix
+    for prefix in sorted(prefixes, key=len, reverse=True):
+        upstream = prefixes[prefix]
+        # Creates the client now so the lifespan opens its connection pool
+        get_proxy_client(upstream)
+        router.add_api_route(
+            f"{prefix.rstrip('/')}/{{full_path:path}}",
+            proxy,
+            methods=PROXY_METHODS,
+            tags=[f"{upstream.capitalize()} Proxy"],
+            name=f"{upstream}_proxy",
+        )
+    return router
@@ -0,0 +1,12 @@
+"""Admission control for the api-gateway service"""
+
+from .aimd_limit import AIMDLimit
+from .route_class import AdmissionRouteClass
+from .admission_controller import AdmissionController, AdmissionRejected
+
+__all__ = [
+    "AIMDLimit",
+    "AdmissionRouteClass",
+    "AdmissionController",
+    "AdmissionRejected",
+]
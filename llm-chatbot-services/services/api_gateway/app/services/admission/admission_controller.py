@@ -0,0 +1,220 @@
+"""Admission control for the api-gateway service"""
+
+import asyncio
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from prometheus_client import Counter, Gauge
+from config import AppConfig
+from app.services.admission.aimd_limit import AIMDLimit
+from app.services.admission.route_class import (
+    AdmissionRouteClass,
+    DEFAULT_ADMISSION_ROUTE_CLASSES,
+)
+
+ADMISSION_LIMIT = Gauge(
+    "gateway_admission_limit",
+    "Current adaptive concurrency limit",
+    ["route_class"],
+)
+ADMISSION_IN_FLIGHT = Gauge(
+    "gateway_admission_in_flight",
+    "Requests currently admitted",
+    ["route_class"],
+)
+ADMISSION_QUEUE_DEPTH = Gauge(
+    "gateway_admission_queue_depth",
+    "Requests waiting for admission",
+    ["route_class"],
+)
+ADMISSION_SHED = Counter(
+    "gateway_admission_shed_total",
+    "Requests shed by admission control",
+    ["route_class", "reason"],
+)
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is shed instead of admitted"""
+
+    def __init__(self, route_class: str, reason: str, retry_after: float):
+        super().__init__(f"Request to {route_class} shed: {reason}")
+        self.route_class = route_class
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+@dataclass
+class _RouteClassState:
+    """Limit, admitted requests and waiters of one route class"""
+
+    route_class: AdmissionRouteClass
+    limit: AIMDLimit
+    in_flight: int = 0
+    waiters: deque[asyncio.Future] = field(default_factory=deque)
+
+
+class AdmissionController:
+    """Admits requests under per-route-class adaptive concurrency limits
+
+    A request over its class limit waits in a queue shared by all classes,
+    bounded by max_queue_size, for at most queue_timeout seconds. A slot
+    freed in a class goes to that class's oldest waiter. When the queue is
+    full, a request evicts the newest waiter of a lower priority class, or
+    is shed itself if there is none, so cheap high priority routes keep
+    being served while a slow class backs up.
+    """
+
+    def __init__(
+        self,
+        route_classes: list[AdmissionRouteClass],
+        max_queue_size: int,
+        queue_timeout: float,
+        backoff_ratio: float,
+    ):
+        """Initialize the admission controller"""
+        self.max_queue_size = max_queue_size
+        self.queue_timeout = queue_timeout
+        self.retry_after = max(1, math.ceil(queue_timeout))
+        # Longest prefix first
+        self._route_classes = sorted(
+            route_classes,
+            key=lambda route_class: len(route_class.path_prefix),
+            reverse=True,
+        )
+        self._states: dict[str, _RouteClassState] = {}
+        for route_class in route_classes:
+            state = _RouteClassState(
+                route_class=route_class,
+                limit=AIMDLimit(
+                    route_class.initial_limit,
+                    route_class.min_limit,
+                    route_class.max_limit,
+                    route_class.latency_threshold,
+                    backoff_ratio,
+                ),
+            )
+            self._states[route_class.name] = state
+            self._register_metrics(state)
+        self._queued = 0
+
+    @classmethod
+    def from_config(cls, app_config: AppConfig) -> "AdmissionController":
+        """Build the controller from config, falling back to the built-in classes"""
+        entries = app_config.ADMISSION_ROUTE_CLASSES or DEFAULT_ADMISSION_ROUTE_CLASSES
+        return cls(
+            [AdmissionRouteClass.from_dict(entry) for entry in entries],
+            max_queue_size=app_config.ADMISSION_MAX_QUEUE_SIZE,
+            queue_timeout=app_config.ADMISSION_QUEUE_TIMEOUT_IN_SECS,
+            backoff_ratio=app_config.ADMISSION_BACKOFF_RATIO,
+        )
+
+    def resolve(self, path: str) -> AdmissionRouteClass | None:
+        """Get the route class of a request path, None when it bypasses admission"""
+        for route_class in self._route_classes:
+            if route_class.matches(path):
+                return route_class
+        return None
+
+    async def acquire(self, route_class: AdmissionRouteClass) -> None:
+        """Wait for a slot in the route class or raise AdmissionRejected"""
+        state = self._states[route_class.name]
+        if state.in_flight < state.limit.limit and not state.waiters:
+            state.in_flight += 1
+            return
+
+        if self._queued >= self.max_queue_size and not self._evict_below(
+            route_class.priority
+        ):
+            self._shed(route_class.name, "queue_full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        state.waiters.append(waiter)
+        self._queued += 1
+        try:
+            await asyncio.wait({waiter}, timeout=self.queue_timeout)
+        except asyncio.CancelledError:
+            self._abandon(state, waiter)
+            raise
+
+        if not waiter.done():
+            self._remove_waiter(state, waiter)
+            self._shed(route_class.name, "timeout")
+        waiter.result()
+
+    def release(
+        self,
+        route_class: AdmissionRouteClass,
+        admitted_at: float,
+        latency: float,
+        dropped: bool,
+        observed: bool = True,
+    ) -> None:
+        """Free the slot of a finished request and feed its latency to the limit"""
+        state = self._states[route_class.name]
+        if observed:
+            state.limit.on_sample(admitted_at, latency, dropped, state.in_flight)
+        state.in_flight -= 1
+        while state.waiters and state.in_flight < state.limit.limit:
+            waiter = state.waiters.popleft()
+            self._queued -= 1
+            state.in_flight += 1
+            waiter.set_result(None)
+
+    def snapshot(self) -> dict:
+        """Describe every route class for the admin endpoint"""
+        return {
+            name: {
+                "priority": state.route_class.priority,
+                "limit": round(state.limit.limit, 2),
+                "in_flight": state.in_flight,
+                "queued": len(state.waiters),
+            }
+            for name, state in self._states.items()
+        }
+
+    def _evict_below(self, priority: int) -> bool:
+        """Shed the newest waiter of the lowest priority class below priority"""
+        candidates = [
+            state
+            for state in self._states.values()
+            if state.waiters and state.route_class.priority > priority
+        ]
+        if not candidates:
+            return False
+
+        state = max(candidates, key=lambda state: state.route_class.priority)
+        waiter = state.waiters.pop()
+        self._queued -= 1
+        ADMISSION_SHED.labels(state.route_class.name, "evicted").inc()
+        waiter.set_exception(
+            AdmissionRejected(state.route_class.name, "evicted", self.retry_after)
+        )
+        return True
+
+    def _remove_waiter(self, state: _RouteClassState, waiter: asyncio.Future) -> None:
+        """Drop a waiter that gave up before it was admitted or evicted"""
+        state.waiters.remove(waiter)
+        self._queued -= 1
+        waiter.cancel()
+
+    def _abandon(self, state: _RouteClassState, waiter: asyncio.Future) -> None:
+        """Clean up after a waiter whose request was cancelled"""
+        if not waiter.done():
+            self._remove_waiter(state, waiter)
+        elif waiter.exception() is None:
+            # Admitted just before the cancellation, hand the slot on
+            self.release(state.route_class, 0.0, 0.0, dropped=False, observed=False)
+
+    def _shed(self, route_class: str, reason: str) -> None:
+        """Count and raise a rejection"""
+        ADMISSION_SHED.labels(route_class, reason).inc()
+        raise AdmissionRejected(route_class, reason, self.retry_after)
+
+    @staticmethod
+    def _register_metrics(state: _RouteClassState) -> None:
+        """Expose the state of a route class as gauges"""
+        name = state.route_class.name
+        ADMISSION_LIMIT.labels(name).set_function(lambda: state.limit.limit)
+        ADMISSION_IN_FLIGHT.labels(name).set_function(lambda: state.in_flight)
+        ADMISSION_QUEUE_DEPTH.labels(name).set_function(lambda: len(state.waiters))
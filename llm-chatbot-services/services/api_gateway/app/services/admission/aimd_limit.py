@@ -0,0 +1,44 @@
+"""Adaptive concurrency limit for the api-gateway service"""
+
+import time
+
+
+class AIMDLimit:
+    """Concurrency limit with additive increase and multiplicative decrease
+
+    A response faster than the latency threshold grows the limit by
+    1 / limit, so a fully used limit grows by about one per round of
+    requests. A slower or failed response shrinks it by backoff_ratio.
+    Only requests admitted after the last decrease can shrink it again, so
+    one burst of slow responses counts once, and the limit only grows while
+    at least half of it is in use.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        latency_threshold: float,
+        backoff_ratio: float,
+    ):
+        """Initialize the limit"""
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_threshold = latency_threshold
+        self.backoff_ratio = backoff_ratio
+        self._decreased_at = float("-inf")
+
+    def on_sample(
+        self, admitted_at: float, latency: float, dropped: bool, in_flight: int
+    ) -> None:
+        """Adjust the limit after a request admitted at admitted_at finished"""
+        if dropped or latency > self.latency_threshold:
+            if admitted_at >= self._decreased_at:
+                self.limit = max(float(self.min_limit), self.limit * self.backoff_ratio)
+                self._decreased_at = time.monotonic()
+            return
+
+        if in_flight * 2 >= self.limit:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
@@ -0,0 +1,86 @@
+"""Admission route classes for the api-gateway service"""
+
+from dataclasses import dataclass
+from shared import ConfigError
+
+# Lower priority values are admitted first and shed last. Routes outside
+# every class, such as health checks and metrics, bypass admission control.
+DEFAULT_ADMISSION_ROUTE_CLASSES = [
+    {
+        "name": "auth",
+        "path_prefix": "/auth",
+        "priority": 0,
+        "initial_limit": 50,
+        "min_limit": 10,
+        "max_limit": 200,
+        "latency_threshold": 1.0,
+    },
+    {
+        "name": "conversation",
+        "path_prefix": "/conversation",
+        "priority": 1,
+        "initial_limit": 50,
+        "min_limit": 10,
+        "max_limit": 200,
+        "latency_threshold": 1.0,
+    },
+    {
+        "name": "chatbot",
+        "path_prefix": "/chatbot",
+        "priority": 2,
+        "initial_limit": 20,
+        "min_limit": 2,
+        "max_limit": 100,
+        "latency_threshold": 15.0,
+    },
+]
+
+
+@dataclass(frozen=True)
+class AdmissionRouteClass:
+    """Routes sharing one adaptive concurrency limit"""
+
+    name: str
+    path_prefix: str
+    priority: int
+    initial_limit: int
+    min_limit: int
+    max_limit: int
+    latency_threshold: float
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "AdmissionRouteClass":
+        """Build a route class from its config entry"""
+        try:
+            route_class = cls(
+                name=str(data["name"]),
+                path_prefix="/" + str(data["path_prefix"]).strip("/"),
+                priority=int(data.get("priority", 0)),
+                initial_limit=int(data["initial_limit"]),
+                min_limit=int(data.get("min_limit", 1)),
+                max_limit=int(data["max_limit"]),
+                latency_threshold=float(data["latency_threshold"]),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise ConfigError(f"Invalid admission route class {data}: {e}") from e
+
+        if not (
+            0
+            < route_class.min_limit
+            <= route_class.initial_limit
+            <= route_class.max_limit
+        ):
+            raise ConfigError(
+                f"Admission route class {route_class.name} needs 0 < min_limit <= initial_limit <= max_limit"
+            )
+        if route_class.latency_threshold <= 0:
+            raise ConfigError(
+                f"Admission route class {route_class.name} latency_threshold must be positive"
+            )
+        return route_class
+
+    def matches(self, path: str) -> bool:
+        """Check if the request path belongs to the class"""
+        if self.path_prefix == "/":
+            return True
+        return path == self.path_prefix or path.startswith(f"{self.path_prefix}/")
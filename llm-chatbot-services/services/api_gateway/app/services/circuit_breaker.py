@@ -0,0 +1,184 @@
+"""Circuit breaker for the api-gateway upstreams"""
+
+import time
+from collections import deque
+from enum import Enum
+from prometheus_client import Counter, Gauge
+from shared import get_logger
+
+logger = get_logger(service_name="api_gateway")
+
+CIRCUIT_BREAKER_STATE = Gauge(
+    "gateway_circuit_breaker_state",
+    "Circuit breaker state per upstream (0 closed, 1 half-open, 2 open)",
+    ["upstream"],
+)
+CIRCUIT_BREAKER_TRANSITIONS = Counter(
+    "gateway_circuit_breaker_transitions_total",
+    "Circuit breaker state transitions per upstream",
+    ["upstream", "state"],
+)
+CIRCUIT_BREAKER_REJECTIONS = Counter(
+    "gateway_circuit_breaker_rejections_total",
+    "Calls rejected because the upstream circuit was open",
+    ["upstream"],
+)
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states"""
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+
+_STATE_VALUES = {
+    CircuitState.CLOSED: 0,
+    CircuitState.HALF_OPEN: 1,
+    CircuitState.OPEN: 2,
+}
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open"""
+
+    def __init__(self, upstream: str, retry_after: float):
+        super().__init__(f"Circuit for {upstream} is open")
+        self.upstream = upstream
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Closed, open and half-open circuit over the last window_size calls
+
+    The circuit opens when, over at least minimum_calls calls, the failure
+    rate reaches failure_rate_threshold or the latency_percentile of call
+    durations exceeds latency_threshold. The percentile check is kept as a
+    running count of slow calls: the percentile is above the threshold
+    exactly when more than 1 - latency_percentile of the calls are slow.
+    After open_duration a few half-open probe calls decide whether to
+    close again or reopen.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window_size: int = 50,
+        minimum_calls: int = 20,
+        failure_rate_threshold: float = 0.5,
+        latency_percentile: float = 0.95,
+        latency_threshold: float = 30.0,
+        open_duration: float = 30.0,
+        half_open_max_calls: int = 3,
+    ):
+        """Initialize the circuit breaker"""
+        self.name = name
+        self.window_size = window_size
+        self.minimum_calls = minimum_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.latency_percentile = latency_percentile
+        self.latency_threshold = latency_threshold
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+        self.state = CircuitState.CLOSED
+        self._calls: deque[tuple[bool, bool]] = deque()
+        self._failures = 0
+        self._slow_calls = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._half_open_successes = 0
+        CIRCUIT_BREAKER_STATE.labels(upstream=name).set(_STATE_VALUES[self.state])
+
+    def is_available(self) -> bool:
+        """Check, without side effects, whether a call would be admitted"""
+        if self.state == CircuitState.OPEN:
+            return time.monotonic() >= self._opened_at + self.open_duration
+        if self.state == CircuitState.HALF_OPEN:
+            return self._half_open_calls < self.half_open_max_calls
+        return True
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit starts probing again"""
+        if self.state != CircuitState.OPEN:
+            return 0.0
+        return max(self._opened_at + self.open_duration - time.monotonic(), 0.0)
+
+    def before_call(self):
+        """Admit a call or raise CircuitOpenError"""
+        if self.state == CircuitState.OPEN:
+            retry_after = self._opened_at + self.open_duration - time.monotonic()
+            if retry_after > 0:
+                CIRCUIT_BREAKER_REJECTIONS.labels(upstream=self.name).inc()
+                raise CircuitOpenError(self.name, retry_after)
+            self._transition(CircuitState.HALF_OPEN)
+
+        if self.state == CircuitState.HALF_OPEN:
+            if self._half_open_calls >= self.half_open_max_calls:
+                CIRCUIT_BREAKER_REJECTIONS.labels(upstream=self.name).inc()
+                raise CircuitOpenError(self.name, self.open_duration)
+            self._half_open_calls += 1
+
+    def record(self, success: bool, duration: float):
+        """Record the outcome of an admitted call"""
+        slow = duration >= self.latency_threshold
+        if self.state == CircuitState.HALF_OPEN:
+            if not success or slow:
+                self._transition(CircuitState.OPEN)
+                return
+            self._half_open_successes += 1
+            if self._half_open_successes >= self.half_open_max_calls:
+                self._transition(CircuitState.CLOSED)
+            return
+
+        if self.state == CircuitState.OPEN:
+            return
+
+        self._calls.append((success, slow))
+        self._failures += not success
+        self._slow_calls += slow
+        if len(self._calls) > self.window_size:
+            old_success, old_slow = self._calls.popleft()
+            self._failures -= not old_success
+            self._slow_calls -= old_slow
+
+        if len(self._calls) >= self.minimum_calls and self._should_open():
+            self._transition(CircuitState.OPEN)
+
+    def release(self):
+        """Give back an admitted call that ended without an outcome"""
+        if self.state == CircuitState.HALF_OPEN and self._half_open_calls > 0:
+            self._half_open_calls -= 1
+
+    def snapshot(self) -> dict:
+        """Describe the breaker for the admin endpoint"""
+        calls = len(self._calls)
+        return {
+            "state": self.state.value,
+            "calls": calls,
+            "failure_rate": self._failures / calls if calls else 0.0,
+            "slow_call_rate": self._slow_calls / calls if calls else 0.0,
+            "retry_after": round(self.retry_after(), 3),
+        }
+
+    def _should_open(self) -> bool:
+        """Check the failure rate and latency percentile of the window"""
+        calls = len(self._calls)
+        if self._failures / calls >= self.failure_rate_threshold:
+            return True
+        return self._slow_calls / calls > 1 - self.latency_percentile
+
+    def _transition(self, state: CircuitState):
+        """Move to a new state and reset the bookkeeping it needs"""
+        logger.warning(f"Circuit for {self.name}: {self.state.value} -> {state.value}")
+        self.state = state
+        self._half_open_calls = 0
+        self._half_open_successes = 0
+        if state == CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+        if state == CircuitState.CLOSED:
+            self._calls.clear()
+            self._failures = 0
+            self._slow_calls = 0
+        CIRCUIT_BREAKER_STATE.labels(upstream=self.name).set(_STATE_VALUES[state])
+        CIRCUIT_BREAKER_TRANSITIONS.labels(upstream=self.name, state=state.value).inc()
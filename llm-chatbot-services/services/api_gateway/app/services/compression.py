@@ -0,0 +1,179 @@
+"""Response compression for the api-gateway service"""
+
+import zlib
+from prometheus_client import Counter
+from config import AppConfig
+
+# brotli and zstd are native extensions, the gateway falls back to gzip
+# where their wheels are not installed
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSION_RESPONSES = Counter(
+    "gateway_compression_responses_total",
+    "Responses sent to clients by content coding",
+    ["encoding"],
+)
+COMPRESSION_BYTES = Counter(
+    "gateway_compression_bytes_total",
+    "Body bytes before and after compression",
+    ["encoding", "stage"],
+)
+
+# Levels per media type and coding. Media types missing from the table,
+# such as images, are sent as they are. "text/*" covers every text type
+# that has no entry of its own.
+DEFAULT_COMPRESSION_LEVELS = {
+    "application/json": {"zstd": 3, "br": 4, "gzip": 6},
+    "application/problem+json": {"zstd": 3, "br": 4, "gzip": 6},
+    "application/javascript": {"zstd": 3, "br": 4, "gzip": 6},
+    # Streams are flushed per chunk, so a cheap level keeps tokens flowing
+    "text/event-stream": {"zstd": 1, "br": 1, "gzip": 1},
+    "text/*": {"zstd": 3, "br": 4, "gzip": 6},
+}
+
+
+class GzipEncoder:
+    """Streaming gzip encoder"""
+
+    def __init__(self, level: int):
+        """Initialize the encoder"""
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk and flush it to a byte boundary"""
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        """End the stream"""
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliEncoder:
+    """Streaming brotli encoder"""
+
+    def __init__(self, level: int):
+        """Initialize the encoder"""
+        self._compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk and flush it to a byte boundary"""
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        """End the stream"""
+        return self._compressor.finish()
+
+
+class ZstdEncoder:
+    """Streaming zstd encoder"""
+
+    def __init__(self, level: int):
+        """Initialize the encoder"""
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk and flush it to a byte boundary"""
+        return self._compressor.compress(data) + self._compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+    def finish(self) -> bytes:
+        """End the stream"""
+        return self._compressor.flush()
+
+
+def _available_encoders() -> dict[str, type]:
+    """Get the encoders whose library is installed"""
+    encoders = {"gzip": GzipEncoder}
+    if brotli is not None:
+        encoders["br"] = BrotliEncoder
+    if zstandard is not None:
+        encoders["zstd"] = ZstdEncoder
+    return encoders
+
+
+class ResponseCompressor:
+    """Negotiates a content coding and level for gateway responses
+
+    Codings are tried in the configured order, so the gateway's preference
+    wins between codings the client accepts equally. brotli and zstd are
+    only offered when their libraries are installed.
+    """
+
+    def __init__(
+        self,
+        encodings: list[str],
+        levels: dict[str, dict[str, int]],
+        min_size: int,
+    ):
+        """Initialize the response compressor"""
+        available = _available_encoders()
+        self._encoders = {
+            encoding: available[encoding]
+            for encoding in encodings
+            if encoding in available
+        }
+        self._levels = {
+            media_type.lower(): by_encoding
+            for media_type, by_encoding in levels.items()
+        }
+        self.min_size = min_size
+
+    @classmethod
+    def from_config(cls, app_config: AppConfig) -> "ResponseCompressor":
+        """Build the compressor from config, falling back to the built-in levels"""
+        return cls(
+            app_config.COMPRESSION_ENCODINGS,
+            app_config.COMPRESSION_LEVELS or DEFAULT_COMPRESSION_LEVELS,
+            app_config.COMPRESSION_MIN_SIZE_IN_BYTES,
+        )
+
+    def negotiate(self, accept_encoding: str | None) -> str | None:
+        """Pick the coding for an Accept-Encoding header, None for identity"""
+        if not accept_encoding:
+            return None
+
+        weights: dict[str, float] = {}
+        for entry in accept_encoding.split(","):
+            coding, _, params = entry.strip().partition(";")
+            weight = 1.0
+            for param in params.split(";"):
+                name, _, value = param.strip().partition("=")
+                if name.lower() == "q":
+                    try:
+                        weight = float(value)
+                    except ValueError:
+                        weight = 0.0
+            weights[coding.strip().lower()] = weight
+
+        default = weights.get("*", 0.0)
+        best, best_weight = None, 0.0
+        for encoding in self._encoders:
+            weight = weights.get(encoding, default)
+            if weight > best_weight:
+                best, best_weight = encoding, weight
+        return best
+
+    def get_levels(self, content_type: str | None) -> dict[str, int] | None:
+        """Get the levels of a content type, None when it is not compressed"""
+        if not content_type:
+            return None
+        media_type = content_type.split(";", 1)[0].strip().lower()
+        levels = self._levels.get(media_type)
+        if levels is None:
+            levels = self._levels.get(media_type.split("/", 1)[0] + "/*")
+        return levels
+
+    def create_encoder(self, encoding: str, level: int):
+        """Create a streaming encoder for one response"""
+        return self._encoders[encoding](level)
@@ -0,0 +1,76 @@
+"""JWKS client for the api-gateway service"""
+
+import asyncio
+import time
+import httpx
+from shared import get_logger
+from config import AppConfig
+from app.services.proxy_client import ProxyClient
+from app.services.circuit_breaker import CircuitOpenError
+
+logger = get_logger(service_name="api_gateway")
+
+
+class JWKSUnavailableError(Exception):
+    """Raised when no signing keys could be loaded from the auth service"""
+
+
+class JWKSClient:
+    """Fetches and caches the public keys published by the auth service"""
+
+    def __init__(self, auth_client: ProxyClient, app_config: AppConfig):
+        """Initialize the JWKS client"""
+        self.auth_client = auth_client
+        self.jwks_path = app_config.AUTH_JWKS_PATH
+        self.cache_ttl = app_config.AUTH_JWKS_CACHE_TTL_IN_SECS
+        self.min_refresh_interval = app_config.AUTH_JWKS_MIN_REFRESH_INTERVAL_IN_SECS
+        self._keys: dict[str, dict] = {}
+        self._fetched_at = float("-inf")
+        self._last_attempt_at = float("-inf")
+        self._lock = asyncio.Lock()
+
+    async def get_keys(self, key_id: str | None) -> list[dict]:
+        """Get the keys a token signed with key_id may be verified against"""
+        if self._is_stale() or (key_id and key_id not in self._keys):
+            await self._refresh(force=not self._is_stale())
+
+        if not self._keys:
+            raise JWKSUnavailableError("No signing keys loaded from the auth service")
+        if key_id:
+            key = self._keys.get(key_id)
+            return [key] if key else []
+        return list(self._keys.values())
+
+    async def _refresh(self, force: bool) -> None:
+        """Refetch the key set, at most once per min_refresh_interval"""
+        async with self._lock:
+            now = time.monotonic()
+            if now - self._last_attempt_at < self.min_refresh_interval:
+                return
+            if not force and now - self._fetched_at < self.cache_ttl:
+                return
+            self._last_attempt_at = now
+
+            try:
+                logger.info(f"Fetching JWKS from auth service {self.jwks_path}")
+                response = await self.auth_client.send(
+                    "GET", self.jwks_path, timeout=3.0
+                )
+                response.raise_for_status()
+            except (httpx.HTTPError, CircuitOpenError) as e:
+                if not self._keys:
+                    raise JWKSUnavailableError(f"JWKS fetch failed: {e}") from e
+                logger.warning(f"JWKS refresh failed, keeping cached keys: {e}")
+                return
+
+            self._keys = {
+                key["kid"]: key
+                for key in response.json().get("keys", [])
+                if "kid" in key
+            }
+            self._fetched_at = time.monotonic()
+            logger.info(f"Loaded {len(self._keys)} signing key(s) from auth service")
+
+    def _is_stale(self) -> bool:
+        """Check if the cached key set is older than its ttl"""
+        return time.monotonic() - self._fetched_at >= self.cache_ttl
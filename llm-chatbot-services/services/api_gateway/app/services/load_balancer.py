@@ -0,0 +1,141 @@
+"""Load balancing across the replicas of a gateway upstream"""
+
+import bisect
+import hashlib
+import itertools
+import math
+import random
+from dataclasses import dataclass
+from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+LOAD_BALANCING_STRATEGIES = {"round_robin", "p2c", "ewma", "consistent_hash"}
+
+# Weight of the newest latency sample in the moving average
+EWMA_ALPHA = 0.3
+
+# Points per replica on the hash ring, enough to spread keys evenly
+HASH_RING_VIRTUAL_NODES = 100
+
+
+@dataclass
+class UpstreamEndpoint:
+    """One replica of an upstream and the load the gateway sees on it"""
+
+    url: str
+    circuit_breaker: CircuitBreaker | None = None
+    outstanding: int = 0
+    ewma_latency: float = 0.0
+
+    def is_available(self) -> bool:
+        """Check whether the replica is not ejected by its circuit breaker"""
+        return self.circuit_breaker is None or self.circuit_breaker.is_available()
+
+    def observe_latency(self, latency: float):
+        """Fold a response latency into the moving average"""
+        if self.ewma_latency == 0.0:
+            self.ewma_latency = latency
+        else:
+            self.ewma_latency += EWMA_ALPHA * (latency - self.ewma_latency)
+
+    def snapshot(self) -> dict:
+        """Describe the replica for the admin endpoint"""
+        return {
+            "outstanding": self.outstanding,
+            "ewma_latency": round(self.ewma_latency, 4),
+            "circuit_breaker": (
+                self.circuit_breaker.snapshot() if self.circuit_breaker else None
+            ),
+        }
+
+
+class LoadBalancer:
+    """Picks the replica for the next request
+
+    round_robin cycles through the replicas, p2c samples two replicas and
+    takes the one with fewer outstanding requests, and ewma does the same
+    with the latency moving average scaled by the outstanding requests.
+    consistent_hash sends a key to the same replica on a hash ring unless
+    that replica carries more than balance_factor times the average load,
+    in which case the key moves to the next replica on the ring; requests
+    without a key fall back to p2c. Replicas ejected by their circuit
+    breaker are skipped.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        endpoints: list[UpstreamEndpoint],
+        strategy: str,
+        balance_factor: float = 1.25,
+    ):
+        """Initialize the load balancer"""
+        if strategy not in LOAD_BALANCING_STRATEGIES:
+            raise ValueError(f"Invalid load balancing strategy: {strategy}")
+        self.name = name
+        self.endpoints = endpoints
+        self.strategy = strategy
+        self.balance_factor = balance_factor
+        self._round_robin = itertools.count()
+        self._ring = sorted(
+            (_hash(f"{endpoint.url}#{node}"), index)
+            for index, endpoint in enumerate(endpoints)
+            for node in range(HASH_RING_VIRTUAL_NODES)
+        )
+        self._ring_hashes = [point for point, _ in self._ring]
+
+    def select(
+        self, exclude: UpstreamEndpoint | None = None, key: str | None = None
+    ) -> UpstreamEndpoint:
+        """Pick a replica, avoiding exclude when another one is available"""
+        candidates = [
+            endpoint for endpoint in self.endpoints if endpoint.is_available()
+        ]
+        if not candidates:
+            raise CircuitOpenError(self.name, self._retry_after())
+        if exclude is not None and len(candidates) > 1 and exclude in candidates:
+            candidates.remove(exclude)
+        if len(candidates) == 1:
+            return candidates[0]
+
+        if self.strategy == "consistent_hash" and key is not None:
+            return self._select_by_hash(key, candidates)
+
+        if self.strategy == "round_robin":
+            return candidates[next(self._round_robin) % len(candidates)]
+
+        first, second = random.sample(candidates, 2)
+        return min(first, second, key=self._cost)
+
+    def _select_by_hash(
+        self, key: str, candidates: list[UpstreamEndpoint]
+    ) -> UpstreamEndpoint:
+        """Walk the ring from the key to the first candidate under the load bound"""
+        total_outstanding = sum(endpoint.outstanding for endpoint in candidates)
+        capacity = math.ceil(
+            self.balance_factor * (total_outstanding + 1) / len(candidates)
+        )
+        start = bisect.bisect(self._ring_hashes, _hash(key))
+        for offset in range(len(self._ring)):
+            endpoint = self.endpoints[self._ring[(start + offset) % len(self._ring)][1]]
+            if endpoint in candidates and endpoint.outstanding < capacity:
+                return endpoint
+        return min(candidates, key=lambda endpoint: endpoint.outstanding)
+
+    def _cost(self, endpoint: UpstreamEndpoint) -> float:
+        """Load of a replica as seen by the strategy"""
+        if self.strategy == "ewma":
+            return endpoint.ewma_latency * (endpoint.outstanding + 1)
+        return endpoint.outstanding
+
+    def _retry_after(self) -> float:
+        """Seconds until the first ejected replica is probed again"""
+        return min(
+            endpoint.circuit_breaker.retry_after()
+            for endpoint in self.endpoints
+            if endpoint.circuit_breaker is not None
+        )
+
+
+def _hash(value: str) -> int:
+    """Stable 64-bit position of a value on the hash ring"""
+    return int.from_bytes(hashlib.sha1(value.encode()).digest()[:8], "big")
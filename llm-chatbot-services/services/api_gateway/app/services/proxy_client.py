@@ -1,41 +1,494 @@
 """Proxy client for the api-gateway service"""
 
+import asyncio
+import math
+import random
+import time
+from typing import AsyncIterator, Awaitable, Callable
 import httpx
 from fastapi import Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from prometheus_client import Counter
+from starlette.background import BackgroundTask
 
-from shared import get_logger
+from shared import get_logger, time_stage, Hedger, RetryBudget
+from shared.tracing.http_client import TracingTransport
+from config import AppConfig
+from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.services.load_balancer import LoadBalancer, UpstreamEndpoint
 
 logger = get_logger(service_name="api_gateway")
 
+PROXY_RETRIES = Counter(
+    "gateway_proxy_retries_total",
+    "Upstream retries per upstream, by whether the retry budget allowed them",
+    ["upstream", "outcome"],
+)
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+HEDGEABLE_METHODS = frozenset({"GET", "HEAD"})
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+
+HOP_BY_HOP_HEADERS = frozenset(
+    {
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailers",
+        "transfer-encoding",
+        "upgrade",
+    }
+)
+
+
+class _RetryableStatusError(Exception):
+    """A hedged attempt answered with a retryable status code"""
+
+    def __init__(self, response: httpx.Response, endpoint: UpstreamEndpoint):
+        super().__init__(f"{response.status_code} from {endpoint.url}")
+        self.response = response
+        self.endpoint = endpoint
+
 
 class ProxyClient:
     """Proxy client for the api-gateway service"""
 
-    def __init__(self, base_url: str):
+    def __init__(
+        self,
+        name: str,
+        urls: list[str],
+        app_config: AppConfig,
+        hedge_budget: RetryBudget | None = None,
+    ):
         """Initialize the proxy client"""
-        self.base_url = base_url
+        self.name = name
+        self.app_config = app_config
+        self._client: httpx.AsyncClient | None = None
+        self.endpoints = [
+            UpstreamEndpoint(url, self._build_circuit_breaker(url)) for url in urls
+        ]
+        self.load_balancer = LoadBalancer(
+            name,
+            self.endpoints,
+            self._get_load_balancing_strategy(),
+            balance_factor=app_config.PROXY_HASH_BALANCE_FACTOR,
+        )
+        self.retry_budget = RetryBudget(
+            ratio=app_config.PROXY_RETRY_BUDGET_RATIO,
+            min_retries_per_sec=app_config.PROXY_RETRY_BUDGET_MIN_PER_SEC,
+        )
+        self.hedger = self._build_hedger(hedge_budget)
 
-    async def proxy_request(self, request: Request, path: str) -> Response:
-        """Proxy a request to the base_url"""
-        url = f"{self.base_url}{path}"
+    async def start(self) -> None:
+        """Open the long-lived upstream connection pool"""
+        if self._client is not None:
+            return
+        logger.info(f"Opening upstream connection pool for {self.name}")
+        self._client = httpx.AsyncClient(
+            transport=TracingTransport(
+                httpx.AsyncHTTPTransport(
+                    limits=self._build_limits(),
+                    http2=self.app_config.PROXY_HTTP2_ENABLED,
+                )
+            ),
+            timeout=self._build_timeout(),
+        )
+
+    async def close(self) -> None:
+        """Close the upstream connection pool"""
+        if self._client is None:
+            return
+        logger.info(f"Closing upstream connection pool for {self.name}")
+        await self._client.aclose()
+        self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get the pooled upstream client"""
+        if self._client is None:
+            raise RuntimeError(
+                f"Proxy client for {self.name} used before it was started"
+            )
+        return self._client
 
-        return await self._make_request(request, url)
+    async def proxy_request(
+        self,
+        request: Request,
+        path: str,
+        timeout: float | None = None,
+        max_retries: int | None = None,
+    ) -> Response:
+        """Proxy a request to one of the upstream replicas
 
-    async def _make_request(self, request: Request, url: str) -> Response:
-        """Make a request to the base_url"""
-        method = request.method
+        The read timeout and retry limit default to the proxy config and
+        can be overridden per route.
+        """
+        upstream_timeout = self._build_timeout(read=timeout)
+        if max_retries is None:
+            max_retries = self.app_config.PROXY_MAX_RETRIES
+        try:
+            # Up to the upstream's headers, a streamed body is relayed later
+            with time_stage("proxy"):
+                if self.app_config.PROXY_STREAMING_ENABLED:
+                    return await self._make_streaming_request(
+                        request, path, upstream_timeout, max_retries
+                    )
+                return await self._make_request(
+                    request, path, upstream_timeout, max_retries
+                )
+        except CircuitOpenError as e:
+            logger.warning(f"Failing fast for {self.name}{path}: {e}")
+            return JSONResponse(
+                status_code=503,
+                content={"detail": "Upstream service unavailable"},
+                headers={"Retry-After": str(max(math.ceil(e.retry_after), 1))},
+            )
+        except httpx.TimeoutException as e:
+            logger.error(f"Upstream timed out for {self.name}{path}: {e}")
+            return JSONResponse(
+                status_code=504, content={"detail": "Upstream service timed out"}
+            )
+        except httpx.RequestError as e:
+            logger.error(f"Upstream request failed for {self.name}{path}: {e}")
+            return JSONResponse(
+                status_code=502, content={"detail": "Upstream service unreachable"}
+            )
 
-        async with httpx.AsyncClient() as client:
-            proxy_response = await client.request(
-                method,
-                url,
+    async def send(
+        self,
+        method: str,
+        path: str,
+        headers: dict | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        """Send a gateway-originated request to one of the upstream replicas"""
+        endpoint = self.load_balancer.select()
+        upstream_request = self.client.build_request(
+            method,
+            f"{endpoint.url}{path}",
+            headers=headers,
+            timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+        )
+        return await self._send_to_endpoint(endpoint, upstream_request, stream=False)
+
+    async def _make_request(
+        self, request: Request, path: str, timeout: httpx.Timeout, max_retries: int
+    ) -> Response:
+        """Make a request to one of the upstream replicas"""
+        content = await request.body()
+        proxy_response, _ = await self._send_with_retries(
+            request.method,
+            self._get_affinity_key(request),
+            lambda endpoint: self.client.build_request(
+                request.method,
+                f"{endpoint.url}{path}",
                 headers=request.headers.raw,
                 params=request.query_params,
-                content=await request.body(),
-            )
+                content=content,
+                timeout=timeout,
+            ),
+            stream=False,
+            max_retries=max_retries,
+            retryable=request.method in IDEMPOTENT_METHODS,
+            hedgeable=request.method in HEDGEABLE_METHODS,
+        )
 
         return Response(
             content=proxy_response.content,
             status_code=proxy_response.status_code,
             headers=proxy_response.headers,
         )
+
+    async def _make_streaming_request(
+        self, request: Request, path: str, timeout: httpx.Timeout, max_retries: int
+    ) -> StreamingResponse:
+        """Stream the request to a replica and relay the response as it arrives"""
+        content = self._get_request_content(request)
+        proxy_response, endpoint = await self._send_with_retries(
+            request.method,
+            self._get_affinity_key(request),
+            lambda endpoint: self.client.build_request(
+                request.method,
+                f"{endpoint.url}{path}",
+                headers=self._filter_headers(request.headers.raw),
+                params=request.query_params,
+                content=content,
+                timeout=timeout,
+            ),
+            stream=True,
+            max_retries=max_retries,
+            # A streamed body is consumed by the first attempt
+            retryable=request.method in IDEMPOTENT_METHODS and content is None,
+            hedgeable=request.method in HEDGEABLE_METHODS and content is None,
+        )
+
+        close = self._close_streamed_response(proxy_response, endpoint)
+        response = StreamingResponse(
+            self._relay_response_body(proxy_response, close),
+            status_code=proxy_response.status_code,
+            background=BackgroundTask(close),
+        )
+        response.raw_headers = [
+            (name.lower(), value)
+            for name, value in self._filter_headers(proxy_response.headers.raw)
+        ]
+        return response
+
+    async def _send_with_retries(
+        self,
+        method: str,
+        affinity_key: str | None,
+        build_request: Callable[[UpstreamEndpoint], httpx.Request],
+        stream: bool,
+        max_retries: int,
+        retryable: bool,
+        hedgeable: bool = False,
+    ) -> tuple[httpx.Response, UpstreamEndpoint]:
+        """Send the request, retrying idempotent ones on another replica"""
+        self.retry_budget.deposit()
+        attempt = 0
+        endpoint = None
+        while True:
+            endpoint = self.load_balancer.select(exclude=endpoint, key=affinity_key)
+            try:
+                if (
+                    hedgeable
+                    and self.hedger is not None
+                    and self._has_other_replica(endpoint)
+                ):
+                    response, endpoint = await self._send_hedged(
+                        endpoint, build_request, stream
+                    )
+                else:
+                    response = await self._send_to_endpoint(
+                        endpoint, build_request(endpoint), stream
+                    )
+                if (
+                    not retryable
+                    or response.status_code not in RETRYABLE_STATUS_CODES
+                    or not self._can_retry(attempt, max_retries)
+                ):
+                    return response, endpoint
+                if stream:
+                    await self._close_streamed_response(response, endpoint)()
+                logger.warning(
+                    f"Retrying {method} to {self.name} after {response.status_code} from {endpoint.url}"
+                )
+            except httpx.RequestError as e:
+                if not retryable or not self._can_retry(attempt, max_retries):
+                    raise
+                logger.warning(
+                    f"Retrying {method} to {self.name} after {e} from {endpoint.url}"
+                )
+
+            attempt += 1
+            backoff = self.app_config.PROXY_RETRY_BACKOFF_IN_SECS * 2 ** (attempt - 1)
+            await asyncio.sleep(backoff * random.uniform(0.5, 1.0))
+
+    async def _send_hedged(
+        self,
+        endpoint: UpstreamEndpoint,
+        build_request: Callable[[UpstreamEndpoint], httpx.Request],
+        stream: bool,
+    ) -> tuple[httpx.Response, UpstreamEndpoint]:
+        """Send to endpoint and, if it runs late, to another replica as well"""
+
+        async def attempt(index: int) -> tuple[httpx.Response, UpstreamEndpoint]:
+            target = endpoint if index == 0 else self.load_balancer.select(endpoint)
+            response = await self._send_to_endpoint(
+                target, build_request(target), stream
+            )
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                # A failed attempt must not win the race over a healthy one
+                if stream:
+                    response = await self._buffer_streamed_response(response, target)
+                raise _RetryableStatusError(response, target)
+            return response, target
+
+        async def discard(result: tuple[httpx.Response, UpstreamEndpoint]):
+            response, target = result
+            if stream:
+                await self._close_streamed_response(response, target)()
+
+        try:
+            return await self.hedger.run(attempt, discard)
+        except _RetryableStatusError as e:
+            # Every attempt failed, the retry loop releases the buffered reply
+            # like any streamed response
+            if stream:
+                e.endpoint.outstanding += 1
+            return e.response, e.endpoint
+
+    def _has_other_replica(self, endpoint: UpstreamEndpoint) -> bool:
+        """Check whether a replica other than endpoint can take a hedge"""
+        return any(
+            other is not endpoint and other.is_available()
+            for other in self.load_balancer.endpoints
+        )
+
+    def _can_retry(self, attempt: int, max_retries: int) -> bool:
+        """Check the retry limit and spend from the retry budget"""
+        if attempt >= max_retries:
+            return False
+        if not self.retry_budget.try_withdraw():
+            PROXY_RETRIES.labels(upstream=self.name, outcome="budget_exhausted").inc()
+            return False
+        PROXY_RETRIES.labels(upstream=self.name, outcome="retried").inc()
+        return True
+
+    async def _send_to_endpoint(
+        self, endpoint: UpstreamEndpoint, upstream_request: httpx.Request, stream: bool
+    ) -> httpx.Response:
+        """Send one attempt and feed its outcome to the replica's load and health
+
+        A streamed response keeps counting as outstanding until it is closed
+        through _close_streamed_response.
+        """
+        circuit_breaker = endpoint.circuit_breaker
+        if circuit_breaker is not None:
+            circuit_breaker.before_call()
+        endpoint.outstanding += 1
+        started_at = time.monotonic()
+        try:
+            response = await self.client.send(upstream_request, stream=stream)
+        except httpx.RequestError:
+            endpoint.outstanding -= 1
+            if circuit_breaker is not None:
+                circuit_breaker.record(False, time.monotonic() - started_at)
+            raise
+        except BaseException:
+            endpoint.outstanding -= 1
+            if circuit_breaker is not None:
+                circuit_breaker.release()
+            raise
+
+        latency = time.monotonic() - started_at
+        endpoint.observe_latency(latency)
+        if circuit_breaker is not None:
+            circuit_breaker.record(response.status_code < 500, latency)
+        if not stream:
+            endpoint.outstanding -= 1
+        return response
+
+    def _close_streamed_response(
+        self, proxy_response: httpx.Response, endpoint: UpstreamEndpoint
+    ) -> Callable[[], Awaitable[None]]:
+        """Build a close callback that releases the replica exactly once"""
+        released = False
+
+        async def close():
+            nonlocal released
+            if released:
+                return
+            released = True
+            endpoint.outstanding -= 1
+            await proxy_response.aclose()
+
+        return close
+
+    async def _buffer_streamed_response(
+        self, proxy_response: httpx.Response, endpoint: UpstreamEndpoint
+    ) -> httpx.Response:
+        """Read a streamed response into memory and release the replica"""
+        try:
+            body = b"".join([chunk async for chunk in proxy_response.aiter_raw()])
+        finally:
+            await self._close_streamed_response(proxy_response, endpoint)()
+        return httpx.Response(
+            proxy_response.status_code,
+            headers=proxy_response.headers,
+            stream=httpx.ByteStream(body),
+            request=proxy_response.request,
+        )
+
+    async def _relay_response_body(
+        self, proxy_response: httpx.Response, close: Callable[[], Awaitable[None]]
+    ) -> AsyncIterator[bytes]:
+        """Relay the raw upstream body chunk by chunk"""
+        try:
+            async for chunk in proxy_response.aiter_raw():
+                yield chunk
+        finally:
+            await close()
+
+    def _get_affinity_key(self, request: Request) -> str | None:
+        """Key that pins the authenticated user to one replica"""
+        user = getattr(request.state, "user", None)
+        return user["sub"] if user is not None else None
+
+    def _get_request_content(self, request: Request) -> AsyncIterator[bytes] | None:
+        """Get the client body as a stream, or None when there is no body"""
+        if (
+            "content-length" not in request.headers
+            and "transfer-encoding" not in request.headers
+        ):
+            return None
+        return request.stream()
+
+    def _filter_headers(
+        self, raw_headers: list[tuple[bytes, bytes]]
+    ) -> list[tuple[bytes, bytes]]:
+        """Drop hop-by-hop headers that must not be forwarded"""
+        return [
+            (name, value)
+            for name, value in raw_headers
+            if name.decode("latin-1").lower() not in HOP_BY_HOP_HEADERS
+        ]
+
+    def _get_load_balancing_strategy(self) -> str:
+        """Route user-affinity upstreams by consistent hash on the user"""
+        if self.name in self.app_config.PROXY_USER_AFFINITY_UPSTREAMS:
+            return "consistent_hash"
+        return self.app_config.PROXY_LOAD_BALANCING_STRATEGY
+
+    def _build_hedger(self, hedge_budget: RetryBudget | None) -> Hedger | None:
+        """Build the hedger if hedging is enabled and there is a replica to hedge on"""
+        if (
+            hedge_budget is None
+            or self.name not in self.app_config.PROXY_HEDGE_UPSTREAMS
+            or len(self.endpoints) < 2
+        ):
+            return None
+        return Hedger(
+            self.name,
+            hedge_budget,
+            percentile=self.app_config.PROXY_HEDGE_DELAY_PERCENTILE,
+            min_delay=self.app_config.PROXY_HEDGE_MIN_DELAY_IN_SECS,
+            max_delay=self.app_config.PROXY_HEDGE_MAX_DELAY_IN_SECS,
+        )
+
+    def _build_circuit_breaker(self, url: str) -> CircuitBreaker | None:
+        """Build the replica's circuit breaker if it is enabled"""
+        if not self.app_config.CIRCUIT_BREAKER_ENABLED:
+            return None
+        return CircuitBreaker(
+            url,
+            window_size=self.app_config.CIRCUIT_BREAKER_WINDOW_SIZE,
+            minimum_calls=self.app_config.CIRCUIT_BREAKER_MINIMUM_CALLS,
+            failure_rate_threshold=self.app_config.CIRCUIT_BREAKER_FAILURE_RATE_THRESHOLD,
+            latency_percentile=self.app_config.CIRCUIT_BREAKER_LATENCY_PERCENTILE,
+            latency_threshold=self.app_config.CIRCUIT_BREAKER_LATENCY_THRESHOLD_IN_SECS,
+            open_duration=self.app_config.CIRCUIT_BREAKER_OPEN_DURATION_IN_SECS,
+            half_open_max_calls=self.app_config.CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS,
+        )
+
+    def _build_limits(self) -> httpx.Limits:
+        """Build the keep-alive pool limits"""
+        return httpx.Limits(
+            max_connections=self.app_config.PROXY_MAX_CONNECTIONS,
+            max_keepalive_connections=self.app_config.PROXY_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=self.app_config.PROXY_KEEPALIVE_EXPIRY_IN_SECS,
+        )
+
+    def _build_timeout(self, read: float | None = None) -> httpx.Timeout:
+        """Build the connect/read/write/pool timeouts"""
+        if read is None:
+            read = self.app_config.PROXY_READ_TIMEOUT_IN_SECS
+        return httpx.Timeout(
+            connect=self.app_config.PROXY_CONNECT_TIMEOUT_IN_SECS,
+            read=read,
+            write=self.app_config.PROXY_WRITE_TIMEOUT_IN_SECS,
+            pool=self.app_config.PROXY_POOL_TIMEOUT_IN_SECS,
+        )
@@ -0,0 +1,15 @@
+"""Rate limiting for the api-gateway service"""
+
+from .rate_limit_result import RateLimitResult
+from .redis_rate_limiter import RedisRateLimiter, RATE_LIMIT_SCRIPTS
+from .hybrid_rate_limiter import HybridRateLimiter
+from .rate_limit_policy import RateLimitPolicy, validate_shared_budgets
+
+__all__ = [
+    "RateLimitResult",
+    "RedisRateLimiter",
+    "HybridRateLimiter",
+    "RateLimitPolicy",
+    "validate_shared_budgets",
+    "RATE_LIMIT_SCRIPTS",
+]
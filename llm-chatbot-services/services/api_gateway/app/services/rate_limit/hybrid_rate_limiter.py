@@ -0,0 +1,171 @@
+"""Hybrid local and Redis rate limiter for the api-gateway service"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+import redis.asyncio as redis
+from prometheus_client import Counter
+from shared import get_logger
+from app.services.rate_limit.rate_limit_result import RateLimitResult
+
+RATE_LIMIT_SYNCS = Counter(
+    "gateway_rate_limit_syncs_total",
+    "Batched rate limit counter syncs with Redis",
+    ["outcome"],
+)
+RATE_LIMIT_LOCAL_REJECTIONS = Counter(
+    "gateway_rate_limit_local_rejections_total",
+    "Requests rejected by the local rate limit counters",
+)
+
+
+@dataclass
+class _WindowCounter:
+    """Approximate counter of one key in one fixed window"""
+
+    window: float
+    window_id: int
+    synced: int = 0
+    pending: int = 0
+    syncing: bool = False
+
+    @property
+    def used(self) -> int:
+        """Global usage as last reported by Redis plus unsynced local usage"""
+        return self.synced + self.pending
+
+    @property
+    def ends_at(self) -> float:
+        """Wall clock time at which the window ends"""
+        return (self.window_id + 1) * self.window
+
+
+class HybridRateLimiter:
+    """Rate limiter deciding locally and reconciling with Redis in batches
+
+    Every replica counts hits in process and pushes the unsynced delta to a
+    shared fixed-window counter in Redis every sync_interval seconds or as
+    soon as a key has sync_batch_size unsynced hits. The reply carries the
+    global count, so requests are rejected locally once the known global
+    budget is spent. The budget can be overshot by at most
+    sync_batch_size hits per replica plus whatever arrives within one
+    sync_interval, which is the accuracy traded for not waiting on Redis.
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        sync_interval: float = 0.05,
+        sync_batch_size: int = 20,
+        key_prefix: str = "ratelimit",
+    ):
+        """Initialize the rate limiter"""
+        self.redis = redis_client
+        self.sync_interval = sync_interval
+        self.sync_batch_size = sync_batch_size
+        self.key_prefix = f"{key_prefix}:hybrid"
+        self._counters: dict[str, _WindowCounter] = {}
+        self._task: asyncio.Task | None = None
+        self._pending_syncs: set[asyncio.Task] = set()
+        self.logger = get_logger(service_name="api_gateway")
+
+    async def start(self):
+        """Start the periodic sync with Redis"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the periodic sync and flush the remaining counts"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.sync()
+
+    async def hit(
+        self, key: str, limit: int, window: float, cost: int = 1
+    ) -> RateLimitResult:
+        """Consume cost units of the key's budget if the known budget allows it"""
+        now = time.time()
+        counter = self._get_counter(key, window, now)
+        reset_after = counter.ends_at - now
+
+        if counter.used + cost > limit:
+            RATE_LIMIT_LOCAL_REJECTIONS.inc()
+            return RateLimitResult(
+                allowed=False,
+                limit=limit,
+                remaining=max(limit - counter.used, 0),
+                reset_after=reset_after,
+                retry_after=reset_after,
+            )
+
+        counter.pending += cost
+        if counter.pending >= self.sync_batch_size and not counter.syncing:
+            task = asyncio.create_task(self.sync([key]))
+            self._pending_syncs.add(task)
+            task.add_done_callback(self._pending_syncs.discard)
+
+        return RateLimitResult(
+            allowed=True,
+            limit=limit,
+            remaining=max(limit - counter.used, 0),
+            reset_after=reset_after,
+            retry_after=0.0,
+        )
+
+    async def sync(self, keys: list[str] | None = None):
+        """Push unsynced hits to Redis and pull back the global counts"""
+        now = time.time()
+        batch = []
+        for key in list(self._counters) if keys is None else keys:
+            counter = self._counters.get(key)
+            if counter is None or counter.syncing:
+                continue
+            if counter.pending > 0:
+                batch.append((key, counter, counter.pending))
+            elif counter.ends_at <= now:
+                del self._counters[key]
+
+        if not batch:
+            return
+
+        pipe = self.redis.pipeline(transaction=False)
+        for key, counter, amount in batch:
+            counter.syncing = True
+            redis_key = f"{self.key_prefix}:{key}:{counter.window_id}"
+            pipe.incrby(redis_key, amount)
+            pipe.pexpire(redis_key, int(counter.window * 2000))
+
+        try:
+            results = await pipe.execute()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            RATE_LIMIT_SYNCS.labels(outcome="error").inc()
+            self.logger.error(f"Failed to sync rate limit counters with Redis: {e}")
+            return
+        finally:
+            for _, counter, _ in batch:
+                counter.syncing = False
+
+        RATE_LIMIT_SYNCS.labels(outcome="success").inc()
+        for (_, counter, amount), total in zip(batch, results[::2]):
+            counter.pending -= amount
+            counter.synced = max(counter.synced, int(total))
+
+    def _get_counter(self, key: str, window: float, now: float) -> _WindowCounter:
+        """Get the key's counter for the current window"""
+        window_id = int(now // window)
+        counter = self._counters.get(key)
+        if counter is None or counter.window_id != window_id:
+            counter = _WindowCounter(window=window, window_id=window_id)
+            self._counters[key] = counter
+        return counter
+
+    async def _run(self):
+        """Sync every sync_interval seconds until stopped"""
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            await self.sync()
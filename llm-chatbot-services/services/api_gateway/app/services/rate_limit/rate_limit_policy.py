@@ -0,0 +1,60 @@
+"""Rate limit policies for the api-gateway service"""
+
+from dataclasses import dataclass
+from shared import ConfigError
+
+RATE_LIMIT_KEYS = {"user", "ip"}
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """Budget a route draws from, and how much each request costs
+
+    Policies sharing a name share one budget, so routes of different cost
+    can draw from the same bucket. A cost of 0 exempts the route.
+    """
+
+    name: str
+    limit: int
+    window: float
+    cost: int = 1
+    key: str = "user"
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RateLimitPolicy":
+        """Build a policy from its config entry"""
+        try:
+            policy = cls(
+                name=str(data["name"]),
+                limit=int(data.get("limit", 0)),
+                window=float(data.get("window", 0)),
+                cost=int(data.get("cost", 1)),
+                key=str(data.get("key", "user")),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise ConfigError(f"Invalid rate limit policy {data}: {e}") from e
+
+        if policy.key not in RATE_LIMIT_KEYS:
+            raise ConfigError(f"Rate limit policy {policy.name} key must be user or ip")
+        if policy.cost < 0:
+            raise ConfigError(
+                f"Rate limit policy {policy.name} cost cannot be negative"
+            )
+        if policy.cost > 0 and (policy.limit <= 0 or policy.window <= 0):
+            raise ConfigError(
+                f"Rate limit policy {policy.name} needs a positive limit and window"
+            )
+        return policy
+
+
+def validate_shared_budgets(policies: list[RateLimitPolicy]) -> None:
+    """Policies sharing a budget must agree on its limit, window and key"""
+    budgets = {}
+    for policy in policies:
+        if policy.cost == 0:
+            continue
+        budget = (policy.limit, policy.window, policy.key)
+        if budgets.setdefault(policy.name, budget) != budget:
+            raise ConfigError(
+                f"Rate limit policies named {policy.name} must share limit, window and key"
+            )
@@ -0,0 +1,52 @@
+"""Redis rate limiter for the api-gateway service"""
+
+import uuid
+import redis.asyncio as redis
+from app.services.rate_limit.rate_limit_result import RateLimitResult
+from app.services.rate_limit.scripts import GCRA_SCRIPT, SLIDING_LOG_SCRIPT
+
+RATE_LIMIT_SCRIPTS = {
+    "sliding_log": SLIDING_LOG_SCRIPT,
+    "gcra": GCRA_SCRIPT,
+}
+
+
+class RedisRateLimiter:
+    """Rate limiter evaluated atomically in one Redis round trip"""
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        algorithm: str = "sliding_log",
+        key_prefix: str = "ratelimit",
+    ):
+        """Initialize the rate limiter"""
+        if algorithm not in RATE_LIMIT_SCRIPTS:
+            raise ValueError(f"Invalid rate limit algorithm: {algorithm}")
+        self.algorithm = algorithm
+        self.key_prefix = f"{key_prefix}:{algorithm}"
+        # Cached by sha on the server and sent with EVALSHA after the first call
+        self._script = redis_client.register_script(RATE_LIMIT_SCRIPTS[algorithm])
+
+    async def start(self):
+        """Nothing to start, every hit goes straight to Redis"""
+
+    async def stop(self):
+        """Nothing to stop, every hit goes straight to Redis"""
+
+    async def hit(
+        self, key: str, limit: int, window: float, cost: int = 1
+    ) -> RateLimitResult:
+        """Consume cost units of the key's budget if it fits"""
+        window_ms = int(window * 1000)
+        allowed, remaining, reset_after_ms, retry_after_ms = await self._script(
+            keys=[f"{self.key_prefix}:{key}"],
+            args=[limit, window_ms, cost, uuid.uuid4().hex],
+        )
+        return RateLimitResult(
+            allowed=bool(allowed),
+            limit=limit,
+            remaining=int(remaining),
+            reset_after=int(reset_after_ms) / 1000,
+            retry_after=int(retry_after_ms) / 1000,
+        )
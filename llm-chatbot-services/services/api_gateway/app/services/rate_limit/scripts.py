@@ -0,0 +1,77 @@
+"""Server-side Lua scripts for the Redis rate limiter
+
+Every script takes the rate-limit key as KEYS[1] and returns
+{allowed, remaining, reset_after_ms, retry_after_ms}. Time comes from the
+Redis server clock so every gateway replica agrees on the window.
+"""
+
+SLIDING_LOG_SCRIPT = """
+local key = KEYS[1]
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local member = ARGV[4]
+
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+local count = redis.call('ZCARD', key)
+
+local allowed = 0
+if count + cost <= limit then
+    for i = 1, cost do
+        redis.call('ZADD', key, now, member .. ':' .. i)
+    end
+    count = count + cost
+    allowed = 1
+end
+
+if count > 0 then
+    redis.call('PEXPIRE', key, window)
+end
+
+local reset_after = 0
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+if oldest[2] then
+    reset_after = tonumber(oldest[2]) + window - now
+end
+
+local retry_after = 0
+if allowed == 0 then
+    retry_after = window
+    local must_expire = count + cost - limit
+    if cost <= limit and must_expire <= count then
+        local entry = redis.call('ZRANGE', key, must_expire - 1, must_expire - 1, 'WITHSCORES')
+        retry_after = tonumber(entry[2]) + window - now
+    end
+end
+
+return {allowed, math.max(limit - count, 0), reset_after, retry_after}
+"""
+
+GCRA_SCRIPT = """
+local key = KEYS[1]
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+
+local emission_interval = window / limit
+local tat = tonumber(redis.call('GET', key)) or now
+tat = math.max(tat, now)
+
+local new_tat = tat + emission_interval * cost
+local allow_at = new_tat - window
+
+if allow_at > now then
+    local remaining = math.floor((window - (tat - now)) / emission_interval)
+    return {0, math.max(remaining, 0), math.ceil(tat - now), math.ceil(allow_at - now)}
+end
+
+redis.call('SET', key, new_tat, 'PX', math.ceil(new_tat - now))
+local remaining = math.floor((window - (new_tat - now)) / emission_interval)
+return {1, math.max(remaining, 0), math.ceil(new_tat - now), 0}
+"""
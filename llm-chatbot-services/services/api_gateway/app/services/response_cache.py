@@ -0,0 +1,169 @@
+"""Response cache for the api-gateway service"""
+
+import base64
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+import redis.asyncio as redis
+from prometheus_client import Counter, Gauge
+from shared import get_logger, TTLCache
+from config import AppConfig
+from app.services.routing import GatewayRoute
+
+logger = get_logger(service_name="api_gateway")
+
+RESPONSE_CACHE_REQUESTS = Counter(
+    "gateway_response_cache_requests_total",
+    "Cacheable requests by whether they were served from the cache",
+    ["result"],
+)
+RESPONSE_CACHE_INVALIDATIONS = Counter(
+    "gateway_response_cache_invalidations_total",
+    "Per-user invalidations triggered by writes through the gateway",
+)
+RESPONSE_CACHE_SIZE = Gauge(
+    "gateway_response_cache_entries", "Responses currently cached in process"
+)
+
+REDIS_KEY_PREFIX = "gateway:response_cache"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A buffered upstream response and its entity tag"""
+
+    status: int
+    headers: list[tuple[str, str]]
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_upstream(
+        cls, status: int, raw_headers: list[tuple[bytes, bytes]], body: bytes
+    ) -> "CachedResponse":
+        """Build an entry, keeping the upstream ETag or deriving one from the body"""
+        headers = [
+            (key.decode("latin-1"), value.decode("latin-1"))
+            for key, value in raw_headers
+        ]
+        etag = next((value for key, value in headers if key == "etag"), None)
+        if etag is None:
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'
+            headers.append(("etag", etag))
+        return cls(status=status, headers=headers, body=body, etag=etag)
+
+    def matches(self, if_none_match: str | None) -> bool:
+        """Check an If-None-Match header against the entity tag, weakly"""
+        if if_none_match is None:
+            return False
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or self.etag.removeprefix("W/") in tags
+
+    def to_json(self, expires_at: float) -> str:
+        """Serialize the entry for Redis"""
+        return json.dumps(
+            {
+                "status": self.status,
+                "headers": self.headers,
+                "body": base64.b64encode(self.body).decode("ascii"),
+                "etag": self.etag,
+                "expires_at": expires_at,
+            }
+        )
+
+    @classmethod
+    def from_json(cls, data: str) -> tuple["CachedResponse", float]:
+        """Deserialize an entry from Redis with its wall clock expiry"""
+        entry = json.loads(data)
+        response = cls(
+            status=entry["status"],
+            headers=[tuple(header) for header in entry["headers"]],
+            body=base64.b64decode(entry["body"]),
+            etag=entry["etag"],
+        )
+        return response, entry["expires_at"]
+
+
+class ResponseCache:
+    """Caches GET responses per user in process, optionally backed by Redis
+
+    Entries of a user live in one Redis hash so a write can drop all of them
+    with a single DEL. Another gateway replica may still serve its in-process
+    copy until the ttl runs out, which is why the ttl is kept short.
+    """
+
+    def __init__(self, app_config: AppConfig, redis_client: redis.Redis | None):
+        """Initialize the response cache"""
+        self.ttl = app_config.RESPONSE_CACHE_TTL_IN_SECS
+        self.max_body_size = app_config.RESPONSE_CACHE_MAX_BODY_SIZE_IN_BYTES
+        self.redis_client = redis_client
+        self._responses = TTLCache(
+            max_size=app_config.RESPONSE_CACHE_MAX_SIZE, ttl=self.ttl
+        )
+        self._invalidated_at = TTLCache(
+            max_size=app_config.RESPONSE_CACHE_MAX_SIZE, ttl=self.ttl
+        )
+        RESPONSE_CACHE_SIZE.set_function(lambda: len(self._responses))
+
+    def is_cacheable(self, method: str, route: GatewayRoute) -> bool:
+        """Check if the route is configured for caching"""
+        return method == "GET" and route.cacheable
+
+    async def get(self, owner: str, key: str) -> CachedResponse | None:
+        """Get a cached response from process memory, then Redis"""
+        response = self._responses.get((owner, key))
+        if response is not None or self.redis_client is None:
+            return response
+
+        try:
+            data = await self.redis_client.hget(self._redis_key(owner), key)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error(f"Response cache Redis lookup failed: {e}")
+            return None
+        if data is None:
+            return None
+
+        response, expires_at = CachedResponse.from_json(data)
+        ttl = expires_at - time.time()
+        if ttl <= 0:
+            return None
+        self._responses.set((owner, key), response, ttl=ttl)
+        return response
+
+    async def set(
+        self, owner: str, key: str, response: CachedResponse, started_at: float
+    ) -> None:
+        """Cache a response unless the owner wrote since the request started"""
+        if self._invalidated_at.get(owner, 0.0) >= started_at:
+            return
+
+        self._responses.set((owner, key), response)
+        if self.redis_client is None:
+            return
+
+        redis_key = self._redis_key(owner)
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.hset(redis_key, key, response.to_json(time.time() + self.ttl))
+                pipe.pexpire(redis_key, int(self.ttl * 1000))
+                await pipe.execute()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error(f"Response cache Redis write failed: {e}")
+
+    async def invalidate(self, owner: str) -> None:
+        """Drop every cached response of an owner"""
+        RESPONSE_CACHE_INVALIDATIONS.inc()
+        self._invalidated_at.set(owner, time.monotonic())
+        self._responses.evict_where(lambda key, _: key[0] == owner)
+        if self.redis_client is None:
+            return
+
+        try:
+            await self.redis_client.delete(self._redis_key(owner))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error(f"Response cache Redis invalidation failed: {e}")
+
+    def _redis_key(self, owner: str) -> str:
+        """Redis hash holding the entries of an owner"""
+        return f"{REDIS_KEY_PREFIX}:{owner}"
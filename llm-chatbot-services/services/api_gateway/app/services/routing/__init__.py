@@ -0,0 +1,10 @@
+"""Route table for the api-gateway service"""
+
+from .gateway_route import GatewayRoute, DEFAULT_GATEWAY_ROUTES
+from .route_table import RouteTable
+
+__all__ = [
+    "GatewayRoute",
+    "DEFAULT_GATEWAY_ROUTES",
+    "RouteTable",
+]
@@ -0,0 +1,138 @@
+"""Gateway routes for the api-gateway service"""
+
+from dataclasses import asdict, dataclass
+from shared import ConfigError
+from app.services.rate_limit import RateLimitPolicy
+
+AUTH_REQUIREMENTS = {"required", "public"}
+ROUTE_SETTINGS = {
+    "upstream",
+    "auth",
+    "timeout",
+    "max_retries",
+    "cacheable",
+    "rate_limit",
+}
+
+_HEALTH = {"name": "health", "cost": 0}
+
+# Every setting an entry leaves out is inherited from the route of the
+# nearest enclosing prefix, so a sub-route only lists what it changes.
+# Entries without an upstream are served by the gateway itself.
+DEFAULT_GATEWAY_ROUTES = [
+    {
+        "prefix": "/health",
+        "methods": ["GET"],
+        "auth": "public",
+        "cacheable": True,
+        "rate_limit": _HEALTH,
+    },
+    {"prefix": "/openapi.json", "methods": ["GET"], "auth": "public"},
+    {"prefix": "/metrics", "methods": ["GET"], "auth": "public"},
+    {"prefix": "/auth", "upstream": "auth"},
+    {
+        "prefix": "/auth",
+        "methods": ["POST"],
+        "rate_limit": {"name": "auth", "limit": 30, "window": 60, "key": "ip"},
+    },
+    {
+        "prefix": "/auth/health",
+        "methods": ["GET"],
+        "auth": "public",
+        "rate_limit": _HEALTH,
+    },
+    {"prefix": "/auth/me", "methods": ["GET"], "auth": "public"},
+    {"prefix": "/auth/openapi.json", "methods": ["GET"], "auth": "public"},
+    {"prefix": "/auth/.well-known/jwks.json", "methods": ["GET"], "auth": "public"},
+    {"prefix": "/auth/login", "methods": ["POST"], "auth": "public"},
+    {"prefix": "/auth/logout", "methods": ["POST"], "auth": "public"},
+    {"prefix": "/auth/refresh", "methods": ["POST"], "auth": "public"},
+    {"prefix": "/auth/register", "methods": ["POST"], "auth": "public"},
+    {"prefix": "/auth/forgot-password", "methods": ["POST"], "auth": "public"},
+    {"prefix": "/auth/reset-password", "methods": ["POST"], "auth": "public"},
+    {
+        "prefix": "/chatbot",
+        "upstream": "chatbot",
+        "rate_limit": {"name": "chatbot", "limit": 300, "window": 60, "key": "user"},
+    },
+    {"prefix": "/chatbot/chat", "methods": ["POST"], "rate_limit": {"cost": 10}},
+    {
+        "prefix": "/chatbot/health",
+        "methods": ["GET"],
+        "auth": "public",
+        "rate_limit": _HEALTH,
+    },
+    {"prefix": "/chatbot/openapi.json", "methods": ["GET"], "auth": "public"},
+    {"prefix": "/conversation", "upstream": "conversation"},
+    {
+        "prefix": "/conversation/health",
+        "methods": ["GET"],
+        "auth": "public",
+        "rate_limit": _HEALTH,
+    },
+    {"prefix": "/conversation/openapi.json", "methods": ["GET"], "auth": "public"},
+    {
+        "prefix": "/conversation/conversations/history",
+        "methods": ["GET"],
+        "cacheable": True,
+    },
+]
+
+
+@dataclass(frozen=True)
+class GatewayRoute:
+    """Every policy applied to the requests of one method under one prefix"""
+
+    prefix: str
+    method: str
+    upstream: str | None
+    upstream_prefix: str
+    auth: str
+    timeout: float
+    max_retries: int
+    cacheable: bool
+    rate_limit: RateLimitPolicy
+
+    @property
+    def is_public(self) -> bool:
+        """Check if the route is served without a token"""
+        return self.auth == "public"
+
+    def derive(self, entry: dict, prefix: str, method: str) -> "GatewayRoute":
+        """Build a sub-route from its config entry, inheriting what it leaves out"""
+        unknown = set(entry) - ROUTE_SETTINGS - {"prefix", "methods"}
+        if unknown:
+            raise ConfigError(f"Unknown settings {sorted(unknown)} in route {prefix}")
+
+        try:
+            rate_limit = RateLimitPolicy.from_dict(
+                {**asdict(self.rate_limit), **entry.get("rate_limit", {})}
+            )
+            route = GatewayRoute(
+                prefix=prefix,
+                method=method,
+                upstream=entry.get("upstream", self.upstream),
+                # The upstream sees the path below the prefix that named it
+                upstream_prefix=(
+                    prefix.rstrip("/") if "upstream" in entry else self.upstream_prefix
+                ),
+                auth=str(entry.get("auth", self.auth)),
+                timeout=float(entry.get("timeout", self.timeout)),
+                max_retries=int(entry.get("max_retries", self.max_retries)),
+                cacheable=bool(entry.get("cacheable", self.cacheable)),
+                rate_limit=rate_limit,
+            )
+        except (TypeError, ValueError) as e:
+            raise ConfigError(f"Invalid route {prefix}: {e}") from e
+
+        if route.auth not in AUTH_REQUIREMENTS:
+            raise ConfigError(f"Route {prefix} auth must be required or public")
+        if route.timeout <= 0:
+            raise ConfigError(f"Route {prefix} timeout must be positive")
+        if route.max_retries < 0:
+            raise ConfigError(f"Route {prefix} max_retries cannot be negative")
+        return route
+
+    def get_upstream_path(self, path: str) -> str:
+        """Get the path the upstream serves a request of this route on"""
+        return path[len(self.upstream_prefix) :] or "/"
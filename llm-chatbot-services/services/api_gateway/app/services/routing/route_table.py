@@ -0,0 +1,130 @@
+"""Route table for the api-gateway service"""
+
+from shared import ConfigError
+from config import AppConfig
+from app.services.rate_limit import RateLimitPolicy, validate_shared_budgets
+from app.services.routing.gateway_route import DEFAULT_GATEWAY_ROUTES, GatewayRoute
+
+
+class _RouteNode:
+    """Path segment of the route trie with the routes ending on it by method"""
+
+    __slots__ = ("children", "routes")
+
+    def __init__(self):
+        """Initialize the node"""
+        self.children: dict[str, _RouteNode] = {}
+        self.routes: dict[str, GatewayRoute] = {}
+
+
+class RouteTable:
+    """Routes compiled into a trie of path segments
+
+    A request resolves to the route of the longest matching prefix, an exact
+    method winning over "*" on the same prefix, so a single walk down the
+    path finds every policy that applies to it.
+    """
+
+    def __init__(self, default: GatewayRoute):
+        """Initialize an empty route table"""
+        self.default = default
+        self._root = _RouteNode()
+
+    @classmethod
+    def compile(
+        cls, entries: list[dict], default: GatewayRoute, upstreams: set[str]
+    ) -> "RouteTable":
+        """Compile the config entries, shortest prefix first so parents exist"""
+        table = cls(default)
+        parsed = []
+        for entry in entries:
+            try:
+                prefix = "/" + str(entry["prefix"]).strip("/")
+                methods = [
+                    str(method).upper() for method in entry.get("methods", ["*"])
+                ]
+            except (KeyError, TypeError, AttributeError) as e:
+                raise ConfigError(f"Invalid route {entry}: {e}") from e
+            parsed.append((prefix, methods, entry))
+
+        parsed.sort(key=lambda item: (len(cls._split(item[0])), item[1] != ["*"]))
+        for prefix, methods, entry in parsed:
+            for method in methods:
+                route = table.resolve(method, prefix).derive(entry, prefix, method)
+                if route.upstream is not None and route.upstream not in upstreams:
+                    raise ConfigError(
+                        f"Route {prefix} uses unknown upstream {route.upstream}"
+                    )
+                table._insert(route)
+
+        validate_shared_budgets(
+            [default.rate_limit, *(route.rate_limit for route in table.routes())]
+        )
+        return table
+
+    @classmethod
+    def from_config(cls, app_config: AppConfig) -> "RouteTable":
+        """Build the table from config, falling back to the built-in routes"""
+        default = GatewayRoute(
+            prefix="/",
+            method="*",
+            upstream=None,
+            upstream_prefix="",
+            auth="required",
+            timeout=app_config.PROXY_READ_TIMEOUT_IN_SECS,
+            max_retries=app_config.PROXY_MAX_RETRIES,
+            cacheable=False,
+            rate_limit=RateLimitPolicy(
+                name="default",
+                limit=app_config.RATE_LIMIT_LIMIT,
+                window=app_config.RATE_LIMIT_WINDOW_IN_SECS,
+            ),
+        )
+        return cls.compile(
+            app_config.GATEWAY_ROUTES or DEFAULT_GATEWAY_ROUTES,
+            default,
+            set(app_config.UPSTREAM_URLS),
+        )
+
+    def resolve(self, method: str, path: str) -> GatewayRoute:
+        """Get the route that applies to the request"""
+        node = self._root
+        route = node.routes.get(method) or node.routes.get("*") or self.default
+        for segment in self._split(path):
+            node = node.children.get(segment)
+            if node is None:
+                break
+            route = node.routes.get(method) or node.routes.get("*") or route
+        return route
+
+    def routes(self) -> list[GatewayRoute]:
+        """Get every configured route"""
+        routes = []
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            routes.extend(node.routes.values())
+            nodes.extend(node.children.values())
+        return routes
+
+    def upstream_prefixes(self) -> dict[str, str]:
+        """Get the prefixes that name an upstream, mapped to the upstream"""
+        return {
+            route.upstream_prefix or "/": route.upstream
+            for route in self.routes()
+            if route.upstream is not None
+        }
+
+    def _insert(self, route: GatewayRoute) -> None:
+        """Add a route to the trie"""
+        node = self._root
+        for segment in self._split(route.prefix):
+            node = node.children.setdefault(segment, _RouteNode())
+        if route.method in node.routes:
+            raise ConfigError(f"Route {route.method} {route.prefix} is defined twice")
+        node.routes[route.method] = route
+
+    @staticmethod
+    def _split(path: str) -> list[str]:
+        """Split a path into its non-empty segments"""
+        return [segment for segment in path.split("/") if segment]
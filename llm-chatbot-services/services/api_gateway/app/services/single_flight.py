@@ -0,0 +1,47 @@
+"""Single-flight call coalescing for the api-gateway service"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+from prometheus_client import Counter
+
+SINGLE_FLIGHT_CALLS = Counter(
+    "gateway_single_flight_calls_total",
+    "Calls that started a new in-flight operation",
+    ["name"],
+)
+SINGLE_FLIGHT_COALESCED = Counter(
+    "gateway_single_flight_coalesced_total",
+    "Calls that joined an operation already in flight",
+    ["name"],
+)
+
+
+class SingleFlight:
+    """Shares one in-flight call between concurrent callers with the same key"""
+
+    def __init__(self, name: str):
+        """Initialize the single-flight group"""
+        self.name = name
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run call once per key at a time and give every caller its outcome"""
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            SINGLE_FLIGHT_CALLS.labels(self.name).inc()
+        else:
+            SINGLE_FLIGHT_COALESCED.labels(self.name).inc()
+
+        # A cancelled waiter must not cancel the call the other waiters share
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, done: asyncio.Task) -> None:
+        """Drop the finished call so the next caller starts a fresh one"""
+        if self._in_flight.get(key) is done:
+            del self._in_flight[key]
+        if not done.cancelled():
+            # Mark the exception as retrieved even if every waiter went away
+            done.exception()
@@ -0,0 +1,88 @@
+"""Token validation cache for the api-gateway service"""
+
+import hashlib
+import time
+from prometheus_client import Counter, Gauge
+from shared import get_logger, TTLCache
+from config import AppConfig
+
+logger = get_logger(service_name="api_gateway")
+
+TOKEN_CACHE_HITS = Counter(
+    "gateway_token_cache_hits_total", "Token validations served from the cache"
+)
+TOKEN_CACHE_MISSES = Counter(
+    "gateway_token_cache_misses_total", "Token validations not found in the cache"
+)
+TOKEN_CACHE_REVOCATION_EVICTIONS = Counter(
+    "gateway_token_cache_revocation_evictions_total",
+    "Cached token validations evicted by a revocation broadcast",
+)
+TOKEN_CACHE_SIZE = Gauge(
+    "gateway_token_cache_entries", "Token validations currently cached"
+)
+
+
+class TokenValidationCache:
+    """Caches validated token claims and remembers broadcast revocations"""
+
+    def __init__(self, app_config: AppConfig):
+        """Initialize the token validation cache"""
+        self.enabled = app_config.AUTH_TOKEN_CACHE_ENABLED
+        self._validations = TTLCache(
+            max_size=app_config.AUTH_TOKEN_CACHE_MAX_SIZE,
+            ttl=app_config.AUTH_TOKEN_CACHE_TTL_IN_SECS,
+        )
+        self._revocations = TTLCache(
+            max_size=app_config.AUTH_TOKEN_CACHE_MAX_SIZE,
+            ttl=app_config.AUTH_REVOCATION_RETENTION_IN_SECS,
+        )
+        TOKEN_CACHE_SIZE.set_function(lambda: len(self._validations))
+
+    def get(self, token: str) -> dict | None:
+        """Get the cached claims for a token"""
+        if not self.enabled:
+            return None
+
+        claims = self._validations.get(self._hash_token(token))
+        if claims is None:
+            TOKEN_CACHE_MISSES.inc()
+        else:
+            TOKEN_CACHE_HITS.inc()
+        return claims
+
+    def set(self, token: str, claims: dict) -> None:
+        """Cache the claims of a validated token, never past its exp"""
+        if not self.enabled:
+            return
+
+        ttl = None
+        if "exp" in claims:
+            ttl = claims["exp"] - time.time()
+        self._validations.set(self._hash_token(token), claims, ttl=ttl)
+
+    def evict(self, subject: str) -> None:
+        """Evict cached validations for subject so its tokens are validated again"""
+        evicted = self._validations.evict_where(
+            lambda _, claims: claims.get("sub") == subject
+        )
+        TOKEN_CACHE_REVOCATION_EVICTIONS.inc(evicted)
+        logger.info(f"Evicted {evicted} cached validations for {subject}")
+
+    def revoke(self, subject: str, revoked_at: float) -> None:
+        """Evict the cached validations of subject and reject its older tokens"""
+        self._revocations.set(subject, revoked_at)
+        self.evict(subject)
+
+    def is_revoked(self, claims: dict) -> bool:
+        """Check if the token was issued up to a revocation of its subject"""
+        revoked_at = self._revocations.get(claims.get("sub"))
+        if revoked_at is None:
+            return False
+        # Both carry milliseconds, and a token issued in the same millisecond
+        # as a password reset predates it, a new one needs a login first
+        return claims.get("iat", 0) <= revoked_at
+
+    def _hash_token(self, token: str) -> str:
+        """Hash the token so raw bearer tokens are never kept as cache keys"""
+        return hashlib.sha256(token.encode()).hexdigest()
@@ -0,0 +1,71 @@
+"""Token revocation listener for the api-gateway service"""
+
+import asyncio
+import redis.asyncio as redis
+from shared import get_logger
+from shared.token_revocation import (
+    TOKEN_REVOCATION_CHANNEL,
+    parse_token_revocation_message,
+)
+from app.services.token_cache import TokenValidationCache
+
+logger = get_logger(service_name="api_gateway")
+
+
+class TokenRevocationListener:
+    """Applies revocations broadcast by the auth service to the local token cache"""
+
+    def __init__(self, redis_client: redis.Redis, token_cache: TokenValidationCache):
+        """Initialize the token revocation listener"""
+        self.redis_client = redis_client
+        self.token_cache = token_cache
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Start listening in the background"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop listening"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _listen(self) -> None:
+        """Subscribe to the revocation channel, resubscribing after errors"""
+        while True:
+            pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(TOKEN_REVOCATION_CHANNEL)
+                logger.info(
+                    f"Listening for token revocations on {TOKEN_REVOCATION_CHANNEL}"
+                )
+                async for message in pubsub.listen():
+                    self._handle_message(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error(f"Token revocation subscription failed: {e}")
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    def _handle_message(self, message: dict) -> None:
+        """Apply a single revocation message"""
+        if message.get("type") != "message":
+            return
+        try:
+            subject, revoked_at = parse_token_revocation_message(message["data"])
+        except (ValueError, KeyError) as e:
+            logger.error(f"Ignoring malformed token revocation message: {e}")
+            return
+        if revoked_at is None:
+            self.token_cache.evict(subject)
+        else:
+            self.token_cache.revoke(subject, revoked_at)
@@ -0,0 +1,38 @@
+"""Local access token verification for the api-gateway service"""
+
+from jose import JWTError, jwt
+from config import AppConfig
+from app.services.jwks_client import JWKSClient
+
+
+class TokenVerifier:
+    """Verifies access tokens with the auth service's published keys"""
+
+    def __init__(self, jwks_client: JWKSClient, app_config: AppConfig):
+        """Initialize the token verifier"""
+        self.jwks_client = jwks_client
+        self.algorithms = app_config.AUTH_JWT_ALGORITHMS
+
+    async def verify(self, token: str) -> dict | None:
+        """Return the token claims if it is a valid access token, otherwise None"""
+        try:
+            header = jwt.get_unverified_header(token)
+            keys = await self.jwks_client.get_keys(header.get("kid"))
+            if not keys:
+                return None
+
+            claims = jwt.decode(token, {"keys": keys}, algorithms=self.algorithms)
+        except JWTError:
+            return None
+
+        if not self._has_required_claims(claims):
+            return None
+        return claims
+
+    def _has_required_claims(self, claims: dict) -> bool:
+        """Check the claims the auth service puts in every access token"""
+        return (
+            claims.get("type") == "access"
+            and claims.get("sub") is not None
+            and claims.get("role") is not None
+        )
@@ -0,0 +1,79 @@
+"""Upstream health checks for the api-gateway service"""
+
+import asyncio
+import functools
+import httpx
+from shared import HealthCheckError, HealthProber
+from config import AppConfig
+
+
+class UpstreamHealthChecker:
+    """Probes the health endpoints of every upstream replica
+
+    The prober checks each service's /health and runs in the background.
+    The deep prober checks /health/all, which fans out further behind each
+    service, so it only probes on demand and caches for the interval.
+    """
+
+    def __init__(self, app_config: AppConfig):
+        """Initialize the upstream health checker"""
+        self._client = httpx.AsyncClient()
+        upstreams = {
+            f"{upstream}_service_health": urls
+            for upstream, urls in app_config.UPSTREAM_URLS.items()
+        }
+        self.prober = self._build_prober("upstreams", upstreams, "/health", app_config)
+        self.deep_prober = self._build_prober(
+            "upstreams_all", upstreams, "/health/all", app_config
+        )
+
+    async def start(self) -> None:
+        """Start probing the upstreams in the background"""
+        await self.prober.start()
+
+    async def close(self) -> None:
+        """Stop probing and close the connection pool"""
+        await self.prober.stop()
+        await self._client.aclose()
+
+    def _build_prober(
+        self,
+        name: str,
+        upstreams: dict[str, list[str]],
+        path: str,
+        app_config: AppConfig,
+    ) -> HealthProber:
+        """Build a prober checking path on every replica of every upstream"""
+        return HealthProber(
+            name,
+            {
+                upstream: functools.partial(self._check_replicas, urls, path)
+                for upstream, urls in upstreams.items()
+            },
+            interval=app_config.HEALTH_CHECK_INTERVAL_IN_SECS,
+            timeout=app_config.HEALTH_CHECK_TIMEOUT_IN_SECS,
+        )
+
+    async def _check_replicas(self, urls: list[str], path: str) -> dict:
+        """Check every replica concurrently, failing on the first unhealthy one"""
+        responses = await asyncio.gather(
+            *(self._check_replica(url, path) for url in urls)
+        )
+        return responses[0]
+
+    async def _check_replica(self, url: str, path: str) -> dict:
+        """Check one replica and return its health detail"""
+        try:
+            response = await self._client.get(f"{url}{path}")
+        except httpx.RequestError as e:
+            raise HealthCheckError(
+                {"status": "error", "detail": f"{url} is unreachable: {e!r}"}
+            ) from e
+
+        try:
+            detail = response.json()
+        except ValueError:
+            detail = {"status": "error", "detail": response.text}
+        if response.status_code != 200:
+            raise HealthCheckError(detail)
+        return detail
@@ -0,0 +1,120 @@
+"""Benchmark of the gateway response encoders on history payloads
+
+Run from the api_gateway directory:
+
+    python -m benchmarks.compression_benchmark --sample history.json
+
+The sample is a JSON list of recorded GET /conversation/conversations/history
+response bodies. Without one, history payloads of the same shape are
+generated from a fixed seed. Every payload goes through the encoders the
+middleware uses, chunked the way the proxy relays it, so the numbers
+include the per-chunk flushes. CPU time is process time, so it is only
+meaningful on an otherwise idle machine.
+"""
+
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timedelta
+
+from app.services.compression import (
+    DEFAULT_COMPRESSION_LEVELS,
+    ResponseCompressor,
+)
+
+LEVELS = {"gzip": (1, 6, 9), "br": (1, 4, 6, 11), "zstd": (1, 3, 9, 19)}
+
+WORDS = (
+    "the a to of and in is it you that for on with as this be can your are "
+    "conversation message model answer question request service gateway user "
+    "token stream cache latency history context prompt reply python error "
+    "deploy database query index vector search result example please thanks "
+    "could would should explain how why what when where which function class"
+).split()
+
+
+def generate_sample(args) -> list[bytes]:
+    """Generate history payloads shaped like the conversation service's"""
+    rng = random.Random(args.seed)
+    started = datetime(2025, 1, 1)
+    payloads = []
+    for user_id in range(1, args.payloads + 1):
+        history = []
+        for index in range(rng.randint(args.messages // 2, args.messages)):
+            length = rng.randint(5, 40) if index % 2 == 0 else rng.randint(40, 300)
+            history.append(
+                {
+                    "id": user_id * 1000 + index,
+                    "user_id": user_id,
+                    "message": " ".join(rng.choices(WORDS, k=length)),
+                    "created_at": (started + timedelta(seconds=index * 37)).isoformat(),
+                }
+            )
+        payloads.append(json.dumps(history).encode())
+    return payloads
+
+
+def load_sample(path: str) -> list[bytes]:
+    """Load recorded history payloads"""
+    with open(path, encoding="utf-8") as sample:
+        return [json.dumps(payload).encode() for payload in json.load(sample)]
+
+
+def encode(compressor: ResponseCompressor, encoding: str, level: int, payload, args):
+    """Encode a payload chunk by chunk and return the encoded size"""
+    encoder = compressor.create_encoder(encoding, level)
+    size = 0
+    for offset in range(0, len(payload), args.chunk_size):
+        size += len(encoder.compress(payload[offset : offset + args.chunk_size]))
+    return size + len(encoder.finish())
+
+
+def main(args):
+    """Encode the sample with every available coding and level"""
+    payloads = load_sample(args.sample) if args.sample else generate_sample(args)
+    total = sum(len(payload) for payload in payloads)
+    compressor = ResponseCompressor(
+        list(LEVELS), DEFAULT_COMPRESSION_LEVELS, min_size=0
+    )
+    defaults = DEFAULT_COMPRESSION_LEVELS["application/json"]
+
+    print(
+        f"{len(payloads)} payloads, {total / 1024:.0f} KiB, "
+        f"{args.chunk_size} byte chunks, {args.rounds} rounds"
+    )
+    print(f"{'coding':<8}{'level':>6}{'ratio':>8}{'saved':>8}{'cpu ms/MiB':>12}")
+    for encoding, levels in LEVELS.items():
+        if compressor.negotiate(encoding) != encoding:
+            print(f"{encoding:<8}{'not installed':>34}")
+            continue
+        for level in levels:
+            started = time.process_time()
+            for _ in range(args.rounds):
+                encoded = sum(
+                    encode(compressor, encoding, level, payload, args)
+                    for payload in payloads
+                )
+            cpu = (time.process_time() - started) / args.rounds
+            marker = "*" if defaults.get(encoding) == level else ""
+            print(
+                f"{encoding:<8}{f'{marker}{level}':>6}{total / encoded:>8.2f}"
+                f"{1 - encoded / total:>8.0%}{cpu * 1000 / (total / 2**20):>12.1f}"
+            )
+    print("* default level for application/json")
+
+
+def parse_args():
+    """Parse the benchmark arguments"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sample", help="JSON list of recorded history bodies")
+    parser.add_argument("--payloads", type=int, default=200)
+    parser.add_argument("--messages", type=int, default=40)
+    parser.add_argument("--chunk-size", type=int, default=16384)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main(parse_args())
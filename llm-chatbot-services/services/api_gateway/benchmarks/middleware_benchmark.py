@@ -0,0 +1,131 @@
+"""Benchmark of the gateway middleware stack
+
+Run from the api_gateway directory:
+
+    python -m benchmarks.middleware_benchmark
+
+Requests go in process through the route resolver, auth and rate limit
+middlewares to a trivial endpoint, so the numbers reflect middleware
+overhead rather than network or upstream latency. The token is served from the validation
+cache and the hybrid limiter decides locally, matching the steady state
+of a warm gateway.
+"""
+
+import argparse
+import asyncio
+import os
+import time
+import httpx
+import redis.asyncio as redis
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+
+# Per-request info logs would dominate the measurement
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("AUTH_SERVICE_URL", "http://localhost:8001")
+os.environ.setdefault("CHATBOT_SERVICE_URL", "http://localhost:8002")
+os.environ.setdefault("CONVERSATION_SERVICE_URL", "http://localhost:8003")
+
+# pylint: disable=wrong-import-position
+from config import AppConfig
+from app.middleware.auth_middleware import AuthMiddleware
+from app.middleware.rate_limiter import RedisRateLimitMiddleware
+from app.middleware.route_resolver import RouteResolverMiddleware
+from app.services.proxy_client import ProxyClient
+from app.services.rate_limit import HybridRateLimiter
+from app.services.routing import RouteTable
+from app.services.token_cache import TokenValidationCache
+
+TOKEN = "benchmark-token"
+
+
+def build_app(args, middleware: bool) -> FastAPI:
+    """Build a trivial app behind the gateway middlewares"""
+    app_config = AppConfig()
+    app = FastAPI()
+
+    @app.get("/bench/json")
+    async def bench_json():
+        return JSONResponse({"ok": True})
+
+    @app.get("/bench/stream")
+    async def bench_stream():
+        async def chunks():
+            for _ in range(args.chunks):
+                yield b"x" * 64
+
+        return StreamingResponse(chunks())
+
+    if not middleware:
+        return app
+
+    token_cache = TokenValidationCache(app_config)
+    token_cache.set(
+        TOKEN,
+        {"sub": "bench@example.com", "role": "user", "exp": time.time() + 3600},
+    )
+    rate_limiter = HybridRateLimiter(
+        redis.Redis.from_url(args.redis_url),
+        sync_interval=3600,
+        sync_batch_size=args.requests * 10,
+    )
+    # The bench paths fall to the default route, which must never limit
+    app_config.RATE_LIMIT_LIMIT = args.requests * 10
+    app_config.RATE_LIMIT_WINDOW_IN_SECS = 3600
+    app.add_middleware(RedisRateLimitMiddleware, rate_limiter=rate_limiter)
+    app.add_middleware(
+        AuthMiddleware,
+        app_config=app_config,
+        auth_client=ProxyClient("auth", app_config.UPSTREAM_URLS["auth"], app_config),
+        token_cache=token_cache,
+    )
+    app.add_middleware(
+        RouteResolverMiddleware, route_table=RouteTable.from_config(app_config)
+    )
+    return app
+
+
+async def run(app: FastAPI, path: str, args) -> float:
+    """Send the requests and return the throughput"""
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Authorization": f"Bearer {TOKEN}"}
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://gateway"
+    ) as client:
+        remaining = args.requests
+
+        async def worker():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                response = await client.get(path, headers=headers)
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        return args.requests / (time.perf_counter() - started)
+
+
+async def main(args):
+    """Run the benchmark with and without the middlewares"""
+    print(f"{args.requests} requests, {args.concurrency} concurrent")
+    print(f"{'stack':<14}{'path':<16}{'req/s':>10}")
+    for name, middleware in (("bare", False), ("middlewares", True)):
+        app = build_app(args, middleware)
+        for path in ("/bench/json", "/bench/stream"):
+            throughput = await run(app, path, args)
+            print(f"{name:<14}{path:<16}{throughput:>10.0f}")
+
+
+def parse_args():
+    """Parse the benchmark arguments"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--redis-url", default="redis://localhost:6379")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--chunks", type=int, default=20)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
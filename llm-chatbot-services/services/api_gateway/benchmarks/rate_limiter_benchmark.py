@@ -0,0 +1,126 @@
+"""Benchmark of the gateway rate limiters against a real Redis
+
+Run from the api_gateway directory:
+
+    python -m benchmarks.rate_limiter_benchmark --redis-url redis://localhost:6379
+
+Every limiter handles the same burst of requests spread over a few keys.
+The report shows the latency each limiter adds to a request, its
+throughput, and how many requests it admitted against the exact budget.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+import redis.asyncio as redis
+from app.services.rate_limit import HybridRateLimiter, RedisRateLimiter
+
+
+class PipelineRateLimiter:
+    """The original per-request ZADD/ZREMRANGEBYSCORE/ZCARD/EXPIRE pipeline"""
+
+    def __init__(self, redis_client: redis.Redis):
+        """Initialize the rate limiter"""
+        self.redis = redis_client
+
+    async def start(self):
+        """Nothing to start"""
+
+    async def stop(self):
+        """Nothing to stop"""
+
+    async def hit(self, key: str, limit: int, window: float, cost: int = 1) -> bool:
+        """Record the hit and report whether it is within the limit"""
+        key = f"ratelimit:pipeline:{key}"
+        current_ts = time.time()
+        pipe = self.redis.pipeline()
+        pipe.zadd(key, {uuid.uuid4().hex: current_ts})
+        pipe.zremrangebyscore(key, 0, current_ts - window)
+        pipe.zcard(key)
+        pipe.expire(key, int(window) + 1)
+        _, _, count, _ = await pipe.execute()
+        return count <= limit
+
+
+async def run_limiter(name, limiter, args) -> dict:
+    """Send the burst through one limiter and collect latencies"""
+    latencies = []
+    admitted = 0
+    queue = asyncio.Queue()
+    for i in range(args.requests):
+        queue.put_nowait(f"{name}:{args.run_id}:{i % args.keys}")
+
+    async def worker():
+        nonlocal admitted
+        while not queue.empty():
+            key = queue.get_nowait()
+            started = time.perf_counter()
+            result = await limiter.hit(key, args.limit, args.window)
+            latencies.append(time.perf_counter() - started)
+            admitted += bool(getattr(result, "allowed", result))
+
+    await limiter.start()
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+    await limiter.stop()
+
+    latencies.sort()
+    return {
+        "name": name,
+        "throughput": args.requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "admitted": admitted,
+    }
+
+
+async def main(args):
+    """Run every limiter and print the comparison"""
+    redis_client = redis.Redis.from_url(args.redis_url)
+    limiters = {
+        "pipeline": PipelineRateLimiter(redis_client),
+        "sliding_log": RedisRateLimiter(redis_client, "sliding_log"),
+        "gcra": RedisRateLimiter(redis_client, "gcra"),
+        "hybrid": HybridRateLimiter(
+            redis_client,
+            sync_interval=args.sync_interval_ms / 1000,
+            sync_batch_size=args.sync_batch_size,
+        ),
+    }
+
+    budget = args.keys * args.limit
+    print(
+        f"{args.requests} requests, {args.concurrency} concurrent, "
+        f"{args.keys} keys, budget {budget}"
+    )
+    print(f"{'limiter':<12}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'admitted':>10}")
+    for name, limiter in limiters.items():
+        report = await run_limiter(name, limiter, args)
+        print(
+            f"{report['name']:<12}{report['throughput']:>10.0f}"
+            f"{report['p50_ms']:>10.3f}{report['p99_ms']:>10.3f}"
+            f"{report['admitted']:>10}"
+        )
+    await redis_client.aclose()
+
+
+def parse_args():
+    """Parse the benchmark arguments"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--redis-url", default="redis://localhost:6379")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--keys", type=int, default=10)
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--window", type=float, default=60.0)
+    parser.add_argument("--sync-interval-ms", type=int, default=50)
+    parser.add_argument("--sync-batch-size", type=int, default=20)
+    parser.add_argument("--run-id", default=uuid.uuid4().hex[:8])
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -1,5 +1,6 @@
 """Configuration module for the API Gateway"""
 
+import json
 import os
 from dotenv import load_dotenv
 from shared import BaseAppConfig, ConfigError
@@ -10,10 +11,73 @@ load_dotenv()
 class AppConfig(BaseAppConfig):
     """Configuration class for the API Gateway"""
 
-    AUTH_SERVICE_URL: str | None = None
-    CHATBOT_SERVICE_URL: str | None = None
-    CONVERSATION_SERVICE_URL: str | None = None
+    GATEWAY_UPSTREAMS: list[str] | None = None
+    UPSTREAM_URLS: dict[str, list[str]] | None = None
+    GATEWAY_ROUTES: list[dict] | None = None
     REDIS_URL: str | None = None
+    PROXY_MAX_CONNECTIONS: int | None = None
+    PROXY_MAX_KEEPALIVE_CONNECTIONS: int | None = None
+    PROXY_KEEPALIVE_EXPIRY_IN_SECS: float | None = None
+    PROXY_CONNECT_TIMEOUT_IN_SECS: float | None = None
+    PROXY_READ_TIMEOUT_IN_SECS: float | None = None
+    PROXY_WRITE_TIMEOUT_IN_SECS: float | None = None
+    PROXY_POOL_TIMEOUT_IN_SECS: float | None = None
+    PROXY_HTTP2_ENABLED: bool = False
+    PROXY_STREAMING_ENABLED: bool = True
+    PROXY_LOAD_BALANCING_STRATEGY: str | None = None
+    PROXY_USER_AFFINITY_UPSTREAMS: list[str] | None = None
+    PROXY_HASH_BALANCE_FACTOR: float | None = None
+    PROXY_MAX_RETRIES: int | None = None
+    PROXY_RETRY_BACKOFF_IN_SECS: float | None = None
+    PROXY_RETRY_BUDGET_RATIO: float | None = None
+    PROXY_RETRY_BUDGET_MIN_PER_SEC: float | None = None
+    PROXY_HEDGE_UPSTREAMS: list[str] | None = None
+    PROXY_HEDGE_DELAY_PERCENTILE: float | None = None
+    PROXY_HEDGE_MIN_DELAY_IN_SECS: float | None = None
+    PROXY_HEDGE_MAX_DELAY_IN_SECS: float | None = None
+    PROXY_HEDGE_BUDGET_RATIO: float | None = None
+    PROXY_HEDGE_BUDGET_MIN_PER_SEC: float | None = None
+    CIRCUIT_BREAKER_ENABLED: bool = True
+    CIRCUIT_BREAKER_WINDOW_SIZE: int | None = None
+    CIRCUIT_BREAKER_MINIMUM_CALLS: int | None = None
+    CIRCUIT_BREAKER_FAILURE_RATE_THRESHOLD: float | None = None
+    CIRCUIT_BREAKER_LATENCY_PERCENTILE: float | None = None
+    CIRCUIT_BREAKER_LATENCY_THRESHOLD_IN_SECS: float | None = None
+    CIRCUIT_BREAKER_OPEN_DURATION_IN_SECS: float | None = None
+    CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS: int | None = None
+    AUTH_LOCAL_JWT_VERIFICATION_ENABLED: bool = False
+    AUTH_JWT_ALGORITHMS: list[str] | None = None
+    AUTH_JWKS_PATH: str | None = None
+    AUTH_JWKS_CACHE_TTL_IN_SECS: float | None = None
+    AUTH_JWKS_MIN_REFRESH_INTERVAL_IN_SECS: float | None = None
+    AUTH_TOKEN_CACHE_ENABLED: bool = True
+    AUTH_TOKEN_CACHE_MAX_SIZE: int | None = None
+    AUTH_TOKEN_CACHE_TTL_IN_SECS: float | None = None
+    AUTH_REVOCATION_RETENTION_IN_SECS: float | None = None
+    RATE_LIMIT_ALGORITHM: str | None = None
+    RATE_LIMIT_LIMIT: int | None = None
+    RATE_LIMIT_WINDOW_IN_SECS: float | None = None
+    RATE_LIMIT_IP_LIMIT: int | None = None
+    RATE_LIMIT_IP_WINDOW_IN_SECS: float | None = None
+    RATE_LIMIT_SYNC_INTERVAL_IN_MS: int | None = None
+    RATE_LIMIT_SYNC_BATCH_SIZE: int | None = None
+    RESPONSE_CACHE_ENABLED: bool = False
+    RESPONSE_CACHE_MAX_SIZE: int | None = None
+    RESPONSE_CACHE_TTL_IN_SECS: float | None = None
+    RESPONSE_CACHE_MAX_BODY_SIZE_IN_BYTES: int | None = None
+    RESPONSE_CACHE_REDIS_ENABLED: bool = False
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_ROUTE_CLASSES: list[dict] | None = None
+    ADMISSION_MAX_QUEUE_SIZE: int | None = None
+    ADMISSION_QUEUE_TIMEOUT_IN_SECS: float | None = None
+    ADMISSION_BACKOFF_RATIO: float | None = None
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_ENCODINGS: list[str] | None = None
+    COMPRESSION_MIN_SIZE_IN_BYTES: int | None = None
+    COMPRESSION_LEVELS: dict[str, dict[str, int]] | None = None
+    SERVER_TIMING_ENABLED: bool = False
+    HEALTH_CHECK_INTERVAL_IN_SECS: float | None = None
+    HEALTH_CHECK_TIMEOUT_IN_SECS: float | None = None
 
     def __init__(self):
         self.set_config()
@@ -21,21 +85,359 @@ class AppConfig(BaseAppConfig):
 
     def set_config(self):
         """Set the config"""
-        self.AUTH_SERVICE_URL = os.getenv("AUTH_SERVICE_URL")
-        self.CHATBOT_SERVICE_URL = os.getenv("CHATBOT_SERVICE_URL")
-        self.CONVERSATION_SERVICE_URL = os.getenv("CONVERSATION_SERVICE_URL")
         self.REDIS_URL = os.getenv("REDIS_URL")
+        self.SERVER_TIMING_ENABLED = self.get_bool_env("SERVER_TIMING_ENABLED", False)
+        self.HEALTH_CHECK_INTERVAL_IN_SECS = self.get_float_env(
+            "HEALTH_CHECK_INTERVAL_IN_SECS", 10.0
+        )
+        self.HEALTH_CHECK_TIMEOUT_IN_SECS = self.get_float_env(
+            "HEALTH_CHECK_TIMEOUT_IN_SECS", 3.0
+        )
+        self.__set_routing_config()
+        self.__set_proxy_config()
+        self.__set_circuit_breaker_config()
+        self.__set_auth_config()
+        self.__set_rate_limit_config()
+        self.__set_response_cache_config()
+        self.__set_admission_config()
+        self.__set_compression_config()
+        self.set_tracing_config()
 
     def validate_config(self):
         """Validate the config"""
-        if not self.AUTH_SERVICE_URL:
-            raise ConfigError("AUTH_SERVICE_URL is not set")
+        self.validate_tracing_config()
 
-        if not self.CHATBOT_SERVICE_URL:
-            raise ConfigError("CHATBOT_SERVICE_URL is not set")
+        if "auth" not in self.GATEWAY_UPSTREAMS:
+            raise ConfigError("GATEWAY_UPSTREAMS must include auth")
 
-        if not self.CONVERSATION_SERVICE_URL:
-            raise ConfigError("CONVERSATION_SERVICE_URL is not set")
+        for upstream, urls in self.UPSTREAM_URLS.items():
+            if not urls:
+                raise ConfigError(f"{self.get_upstream_url_env(upstream)} is not set")
+
+        if not isinstance(self.GATEWAY_ROUTES, list):
+            raise ConfigError("GATEWAY_ROUTES must be a JSON list of routes")
 
         if not self.REDIS_URL:
             raise ConfigError("REDIS_URL is not set")
+
+        if (
+            self.HEALTH_CHECK_INTERVAL_IN_SECS <= 0
+            or self.HEALTH_CHECK_TIMEOUT_IN_SECS <= 0
+        ):
+            raise ConfigError(
+                "HEALTH_CHECK_INTERVAL_IN_SECS and HEALTH_CHECK_TIMEOUT_IN_SECS must be positive"
+            )
+
+        if self.AUTH_LOCAL_JWT_VERIFICATION_ENABLED and any(
+            algorithm.upper().startswith("HS") for algorithm in self.AUTH_JWT_ALGORITHMS
+        ):
+            raise ConfigError(
+                "AUTH_JWT_ALGORITHMS must only contain asymmetric algorithms for local JWT verification"
+            )
+
+        if self.RATE_LIMIT_ALGORITHM not in ("sliding_log", "gcra", "hybrid"):
+            raise ConfigError(
+                "RATE_LIMIT_ALGORITHM must be one of sliding_log, gcra, hybrid"
+            )
+
+        if self.RATE_LIMIT_LIMIT <= 0 or self.RATE_LIMIT_WINDOW_IN_SECS <= 0:
+            raise ConfigError(
+                "RATE_LIMIT_LIMIT and RATE_LIMIT_WINDOW_IN_SECS must be positive"
+            )
+
+        if self.RATE_LIMIT_IP_LIMIT <= 0 or self.RATE_LIMIT_IP_WINDOW_IN_SECS <= 0:
+            raise ConfigError(
+                "RATE_LIMIT_IP_LIMIT and RATE_LIMIT_IP_WINDOW_IN_SECS must be positive"
+            )
+
+        if (
+            self.RATE_LIMIT_SYNC_INTERVAL_IN_MS <= 0
+            or self.RATE_LIMIT_SYNC_BATCH_SIZE <= 0
+        ):
+            raise ConfigError(
+                "RATE_LIMIT_SYNC_INTERVAL_IN_MS and RATE_LIMIT_SYNC_BATCH_SIZE must be positive"
+            )
+
+        if self.PROXY_LOAD_BALANCING_STRATEGY not in ("round_robin", "p2c", "ewma"):
+            raise ConfigError(
+                "PROXY_LOAD_BALANCING_STRATEGY must be one of round_robin, p2c, ewma"
+            )
+
+        if self.PROXY_HASH_BALANCE_FACTOR < 1:
+            raise ConfigError("PROXY_HASH_BALANCE_FACTOR cannot be less than 1")
+
+        if not 0 < self.PROXY_HEDGE_DELAY_PERCENTILE < 1:
+            raise ConfigError("PROXY_HEDGE_DELAY_PERCENTILE must be in (0, 1)")
+
+        if (
+            not 0
+            < self.PROXY_HEDGE_MIN_DELAY_IN_SECS
+            <= self.PROXY_HEDGE_MAX_DELAY_IN_SECS
+        ):
+            raise ConfigError(
+                "PROXY_HEDGE_MIN_DELAY_IN_SECS must be positive and not greater than PROXY_HEDGE_MAX_DELAY_IN_SECS"
+            )
+
+        if self.PROXY_MAX_RETRIES < 0:
+            raise ConfigError("PROXY_MAX_RETRIES cannot be negative")
+
+        if not 0 < self.CIRCUIT_BREAKER_FAILURE_RATE_THRESHOLD <= 1:
+            raise ConfigError(
+                "CIRCUIT_BREAKER_FAILURE_RATE_THRESHOLD must be in (0, 1]"
+            )
+
+        if not 0 < self.CIRCUIT_BREAKER_LATENCY_PERCENTILE < 1:
+            raise ConfigError("CIRCUIT_BREAKER_LATENCY_PERCENTILE must be in (0, 1)")
+
+        if self.CIRCUIT_BREAKER_MINIMUM_CALLS > self.CIRCUIT_BREAKER_WINDOW_SIZE:
+            raise ConfigError(
+                "CIRCUIT_BREAKER_MINIMUM_CALLS cannot be greater than CIRCUIT_BREAKER_WINDOW_SIZE"
+            )
+
+        if self.RESPONSE_CACHE_MAX_SIZE <= 0 or self.RESPONSE_CACHE_TTL_IN_SECS <= 0:
+            raise ConfigError(
+                "RESPONSE_CACHE_MAX_SIZE and RESPONSE_CACHE_TTL_IN_SECS must be positive"
+            )
+
+        if not isinstance(self.ADMISSION_ROUTE_CLASSES, list):
+            raise ConfigError(
+                "ADMISSION_ROUTE_CLASSES must be a JSON list of route classes"
+            )
+
+        if (
+            self.ADMISSION_MAX_QUEUE_SIZE < 0
+            or self.ADMISSION_QUEUE_TIMEOUT_IN_SECS <= 0
+        ):
+            raise ConfigError(
+                "ADMISSION_MAX_QUEUE_SIZE cannot be negative and ADMISSION_QUEUE_TIMEOUT_IN_SECS must be positive"
+            )
+
+        if not 0 < self.ADMISSION_BACKOFF_RATIO < 1:
+            raise ConfigError("ADMISSION_BACKOFF_RATIO must be in (0, 1)")
+
+        if set(self.COMPRESSION_ENCODINGS) - {"zstd", "br", "gzip"}:
+            raise ConfigError("COMPRESSION_ENCODINGS must only contain zstd, br, gzip")
+
+        if self.COMPRESSION_MIN_SIZE_IN_BYTES < 0:
+            raise ConfigError("COMPRESSION_MIN_SIZE_IN_BYTES cannot be negative")
+
+        if not isinstance(self.COMPRESSION_LEVELS, dict):
+            raise ConfigError(
+                "COMPRESSION_LEVELS must be a JSON object of levels per content type"
+            )
+
+        if self.PROXY_MAX_KEEPALIVE_CONNECTIONS > self.PROXY_MAX_CONNECTIONS:
+            raise ConfigError(
+                "PROXY_MAX_KEEPALIVE_CONNECTIONS cannot be greater than PROXY_MAX_CONNECTIONS"
+            )
+
+    @staticmethod
+    def get_upstream_url_env(upstream: str) -> str:
+        """Get the environment variable listing the replicas of an upstream"""
+        return f"{upstream.upper().replace('-', '_')}_SERVICE_URL"
+
+    def __set_routing_config(self):
+        """Set the upstream groups and the route table config"""
+        self.GATEWAY_UPSTREAMS = [
+            upstream.lower()
+            for upstream in self.get_list_env(
+                "GATEWAY_UPSTREAMS", ["auth", "chatbot", "conversation"]
+            )
+        ]
+        # Each upstream group lists its replicas in <NAME>_SERVICE_URL
+        self.UPSTREAM_URLS = {
+            upstream: self.get_list_env(self.get_upstream_url_env(upstream), [])
+            for upstream in self.GATEWAY_UPSTREAMS
+        }
+        try:
+            self.GATEWAY_ROUTES = json.loads(os.getenv("GATEWAY_ROUTES") or "[]")
+        except json.JSONDecodeError as e:
+            raise ConfigError(f"GATEWAY_ROUTES must be valid JSON: {e}") from e
+
+    def __set_proxy_config(self):
+        """Set the upstream connection pool config"""
+        self.PROXY_MAX_CONNECTIONS = self.get_int_env("PROXY_MAX_CONNECTIONS", 100)
+        self.PROXY_MAX_KEEPALIVE_CONNECTIONS = self.get_int_env(
+            "PROXY_MAX_KEEPALIVE_CONNECTIONS", 20
+        )
+        self.PROXY_KEEPALIVE_EXPIRY_IN_SECS = self.get_float_env(
+            "PROXY_KEEPALIVE_EXPIRY_IN_SECS", 30.0
+        )
+        self.PROXY_CONNECT_TIMEOUT_IN_SECS = self.get_float_env(
+            "PROXY_CONNECT_TIMEOUT_IN_SECS", 3.0
+        )
+        self.PROXY_READ_TIMEOUT_IN_SECS = self.get_float_env(
+            "PROXY_READ_TIMEOUT_IN_SECS", 60.0
+        )
+        self.PROXY_WRITE_TIMEOUT_IN_SECS = self.get_float_env(
+            "PROXY_WRITE_TIMEOUT_IN_SECS", 10.0
+        )
+        self.PROXY_POOL_TIMEOUT_IN_SECS = self.get_float_env(
+            "PROXY_POOL_TIMEOUT_IN_SECS", 5.0
+        )
+        self.PROXY_HTTP2_ENABLED = self.get_bool_env("PROXY_HTTP2_ENABLED", False)
+        self.PROXY_STREAMING_ENABLED = self.get_bool_env(
+            "PROXY_STREAMING_ENABLED", True
+        )
+        self.PROXY_LOAD_BALANCING_STRATEGY = os.getenv(
+            "PROXY_LOAD_BALANCING_STRATEGY", "p2c"
+        )
+        self.PROXY_USER_AFFINITY_UPSTREAMS = self.get_list_env(
+            "PROXY_USER_AFFINITY_UPSTREAMS", ["chatbot"]
+        )
+        self.PROXY_HASH_BALANCE_FACTOR = self.get_float_env(
+            "PROXY_HASH_BALANCE_FACTOR", 1.25
+        )
+        self.PROXY_MAX_RETRIES = self.get_int_env("PROXY_MAX_RETRIES", 2)
+        self.PROXY_RETRY_BACKOFF_IN_SECS = self.get_float_env(
+            "PROXY_RETRY_BACKOFF_IN_SECS", 0.05
+        )
+        self.PROXY_RETRY_BUDGET_RATIO = self.get_float_env(
+            "PROXY_RETRY_BUDGET_RATIO", 0.2
+        )
+        self.PROXY_RETRY_BUDGET_MIN_PER_SEC = self.get_float_env(
+            "PROXY_RETRY_BUDGET_MIN_PER_SEC", 5.0
+        )
+        self.PROXY_HEDGE_UPSTREAMS = self.get_list_env("PROXY_HEDGE_UPSTREAMS", [])
+        self.PROXY_HEDGE_DELAY_PERCENTILE = self.get_float_env(
+            "PROXY_HEDGE_DELAY_PERCENTILE", 0.95
+        )
+        self.PROXY_HEDGE_MIN_DELAY_IN_SECS = self.get_float_env(
+            "PROXY_HEDGE_MIN_DELAY_IN_SECS", 0.05
+        )
+        self.PROXY_HEDGE_MAX_DELAY_IN_SECS = self.get_float_env(
+            "PROXY_HEDGE_MAX_DELAY_IN_SECS", 1.0
+        )
+        self.PROXY_HEDGE_BUDGET_RATIO = self.get_float_env(
+            "PROXY_HEDGE_BUDGET_RATIO", 0.05
+        )
+        self.PROXY_HEDGE_BUDGET_MIN_PER_SEC = self.get_float_env(
+            "PROXY_HEDGE_BUDGET_MIN_PER_SEC", 1.0
+        )
+
+    def __set_circuit_breaker_config(self):
+        """Set the upstream circuit breaker config"""
+        self.CIRCUIT_BREAKER_ENABLED = self.get_bool_env(
+            "CIRCUIT_BREAKER_ENABLED", True
+        )
+        self.CIRCUIT_BREAKER_WINDOW_SIZE = self.get_int_env(
+            "CIRCUIT_BREAKER_WINDOW_SIZE", 50
+        )
+        self.CIRCUIT_BREAKER_MINIMUM_CALLS = self.get_int_env(
+            "CIRCUIT_BREAKER_MINIMUM_CALLS", 20
+        )
+        self.CIRCUIT_BREAKER_FAILURE_RATE_THRESHOLD = self.get_float_env(
+            "CIRCUIT_BREAKER_FAILURE_RATE_THRESHOLD", 0.5
+        )
+        self.CIRCUIT_BREAKER_LATENCY_PERCENTILE = self.get_float_env(
+            "CIRCUIT_BREAKER_LATENCY_PERCENTILE", 0.95
+        )
+        self.CIRCUIT_BREAKER_LATENCY_THRESHOLD_IN_SECS = self.get_float_env(
+            "CIRCUIT_BREAKER_LATENCY_THRESHOLD_IN_SECS", 30.0
+        )
+        self.CIRCUIT_BREAKER_OPEN_DURATION_IN_SECS = self.get_float_env(
+            "CIRCUIT_BREAKER_OPEN_DURATION_IN_SECS", 30.0
+        )
+        self.CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS = self.get_int_env(
+            "CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS", 3
+        )
+
+    def __set_auth_config(self):
+        """Set the token verification config"""
+        self.AUTH_LOCAL_JWT_VERIFICATION_ENABLED = self.get_bool_env(
+            "AUTH_LOCAL_JWT_VERIFICATION_ENABLED", False
+        )
+        self.AUTH_JWT_ALGORITHMS = self.get_list_env("AUTH_JWT_ALGORITHMS", ["RS256"])
+        self.AUTH_JWKS_PATH = os.getenv("AUTH_JWKS_PATH", "/.well-known/jwks.json")
+        self.AUTH_JWKS_CACHE_TTL_IN_SECS = self.get_float_env(
+            "AUTH_JWKS_CACHE_TTL_IN_SECS", 300.0
+        )
+        self.AUTH_JWKS_MIN_REFRESH_INTERVAL_IN_SECS = self.get_float_env(
+            "AUTH_JWKS_MIN_REFRESH_INTERVAL_IN_SECS", 10.0
+        )
+        self.AUTH_TOKEN_CACHE_ENABLED = self.get_bool_env(
+            "AUTH_TOKEN_CACHE_ENABLED", True
+        )
+        self.AUTH_TOKEN_CACHE_MAX_SIZE = self.get_int_env(
+            "AUTH_TOKEN_CACHE_MAX_SIZE", 10000
+        )
+        self.AUTH_TOKEN_CACHE_TTL_IN_SECS = self.get_float_env(
+            "AUTH_TOKEN_CACHE_TTL_IN_SECS", 60.0
+        )
+        self.AUTH_REVOCATION_RETENTION_IN_SECS = self.get_float_env(
+            "AUTH_REVOCATION_RETENTION_IN_SECS", 3600.0
+        )
+
+    def __set_rate_limit_config(self):
+        """Set the rate limit config"""
+        self.RATE_LIMIT_ALGORITHM = os.getenv("RATE_LIMIT_ALGORITHM", "sliding_log")
+        self.RATE_LIMIT_LIMIT = self.get_int_env("RATE_LIMIT_LIMIT", 100)
+        self.RATE_LIMIT_WINDOW_IN_SECS = self.get_float_env(
+            "RATE_LIMIT_WINDOW_IN_SECS", 60.0
+        )
+        self.RATE_LIMIT_IP_LIMIT = self.get_int_env("RATE_LIMIT_IP_LIMIT", 600)
+        self.RATE_LIMIT_IP_WINDOW_IN_SECS = self.get_float_env(
+            "RATE_LIMIT_IP_WINDOW_IN_SECS", 60.0
+        )
+        self.RATE_LIMIT_SYNC_INTERVAL_IN_MS = self.get_int_env(
+            "RATE_LIMIT_SYNC_INTERVAL_IN_MS", 50
+        )
+        self.RATE_LIMIT_SYNC_BATCH_SIZE = self.get_int_env(
+            "RATE_LIMIT_SYNC_BATCH_SIZE", 20
+        )
+
+    def __set_response_cache_config(self):
+        """Set the response cache config"""
+        self.RESPONSE_CACHE_ENABLED = self.get_bool_env("RESPONSE_CACHE_ENABLED", False)
+        self.RESPONSE_CACHE_MAX_SIZE = self.get_int_env(
+            "RESPONSE_CACHE_MAX_SIZE", 10000
+        )
+        self.RESPONSE_CACHE_TTL_IN_SECS = self.get_float_env(
+            "RESPONSE_CACHE_TTL_IN_SECS", 5.0
+        )
+        self.RESPONSE_CACHE_MAX_BODY_SIZE_IN_BYTES = self.get_int_env(
+            "RESPONSE_CACHE_MAX_BODY_SIZE_IN_BYTES", 1024 * 1024
+        )
+        self.RESPONSE_CACHE_REDIS_ENABLED = self.get_bool_env(
+            "RESPONSE_CACHE_REDIS_ENABLED", False
+        )
+
+    def __set_admission_config(self):
+        """Set the admission control config"""
+        self.ADMISSION_CONTROL_ENABLED = self.get_bool_env(
+            "ADMISSION_CONTROL_ENABLED", True
+        )
+        self.ADMISSION_MAX_QUEUE_SIZE = self.get_int_env(
+            "ADMISSION_MAX_QUEUE_SIZE", 100
+        )
+        self.ADMISSION_QUEUE_TIMEOUT_IN_SECS = self.get_float_env(
+            "ADMISSION_QUEUE_TIMEOUT_IN_SECS", 2.0
+        )
+        self.ADMISSION_BACKOFF_RATIO = self.get_float_env(
+            "ADMISSION_BACKOFF_RATIO", 0.9
+        )
+        try:
+            self.ADMISSION_ROUTE_CLASSES = json.loads(
+                os.getenv("ADMISSION_ROUTE_CLASSES") or "[]"
+            )
+        except json.JSONDecodeError as e:
+            raise ConfigError(f"ADMISSION_ROUTE_CLASSES must be valid JSON: {e}") from e
+
+    def __set_compression_config(self):
+        """Set the response compression config"""
+        self.COMPRESSION_ENABLED = self.get_bool_env("COMPRESSION_ENABLED", True)
+        self.COMPRESSION_ENCODINGS = [
+            encoding.lower()
+            for encoding in self.get_list_env(
+                "COMPRESSION_ENCODINGS", ["zstd", "br", "gzip"]
+            )
+        ]
+        self.COMPRESSION_MIN_SIZE_IN_BYTES = self.get_int_env(
+            "COMPRESSION_MIN_SIZE_IN_BYTES", 1024
+        )
+        try:
+            self.COMPRESSION_LEVELS = json.loads(
+                os.getenv("COMPRESSION_LEVELS") or "{}"
+            )
+        except json.JSONDecodeError as e:
+            raise ConfigError(f"COMPRESSION_LEVELS must be valid JSON: {e}") from e
@@ -0,0 +1,155 @@
+"""Tests for the admission controller"""
+
+import asyncio
+import pytest
+from app.services.admission import (
+    AdmissionController,
+    AdmissionRejected,
+    AdmissionRouteClass,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+def _route_class(name: str, priority: int) -> AdmissionRouteClass:
+    """A class admitting one request at a time"""
+    return AdmissionRouteClass(
+        name=name,
+        path_prefix=f"/{name}",
+        priority=priority,
+        initial_limit=1,
+        min_limit=1,
+        max_limit=1,
+        latency_threshold=1.0,
+    )
+
+
+HIGH = _route_class("auth", 0)
+LOW = _route_class("chatbot", 2)
+
+
+def _build_controller(
+    max_queue_size: int = 10, queue_timeout: float = 1.0
+) -> AdmissionController:
+    """A controller over one high and one low priority class"""
+    return AdmissionController(
+        [HIGH, LOW],
+        max_queue_size=max_queue_size,
+        queue_timeout=queue_timeout,
+        backoff_ratio=0.9,
+    )
+
+
+async def _settle():
+    """Let the queued acquires reach their wait"""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+def test_resolve_uses_longest_prefix():
+    """Paths map to their class, unknown paths bypass admission"""
+    controller = _build_controller()
+    assert controller.resolve("/auth/login") is HIGH
+    assert controller.resolve("/metrics") is None
+
+
+async def test_release_admits_oldest_waiter():
+    """A freed slot goes to the waiters in arrival order"""
+    controller = _build_controller()
+    await controller.acquire(LOW)
+    admitted = []
+
+    async def wait(name: str):
+        await controller.acquire(LOW)
+        admitted.append(name)
+
+    first = asyncio.ensure_future(wait("first"))
+    await _settle()
+    second = asyncio.ensure_future(wait("second"))
+    await _settle()
+    assert controller.snapshot()["chatbot"]["queued"] == 2
+
+    controller.release(LOW, 0.0, 0.1, dropped=False)
+    await first
+    assert admitted == ["first"]
+    controller.release(LOW, 0.0, 0.1, dropped=False)
+    await second
+    assert admitted == ["first", "second"]
+
+
+async def test_waiter_is_shed_after_queue_timeout():
+    """A request still queued at the deadline is rejected"""
+    controller = _build_controller(queue_timeout=0.01)
+    await controller.acquire(LOW)
+    with pytest.raises(AdmissionRejected) as error:
+        await controller.acquire(LOW)
+    assert error.value.reason == "timeout"
+    assert controller.snapshot()["chatbot"]["queued"] == 0
+
+
+async def test_full_queue_evicts_lower_priority_waiter():
+    """A high priority request takes the queue slot of a low priority one"""
+    controller = _build_controller(max_queue_size=1)
+    await controller.acquire(HIGH)
+    await controller.acquire(LOW)
+    low_waiter = asyncio.ensure_future(controller.acquire(LOW))
+    await _settle()
+
+    high_waiter = asyncio.ensure_future(controller.acquire(HIGH))
+    await _settle()
+    with pytest.raises(AdmissionRejected) as error:
+        await low_waiter
+    assert error.value.reason == "evicted"
+
+    controller.release(HIGH, 0.0, 0.1, dropped=False)
+    await high_waiter
+
+
+async def test_full_queue_sheds_request_without_lower_priority_waiter():
+    """A low priority request never evicts a higher priority one"""
+    controller = _build_controller(max_queue_size=1)
+    await controller.acquire(HIGH)
+    await controller.acquire(LOW)
+    high_waiter = asyncio.ensure_future(controller.acquire(HIGH))
+    await _settle()
+
+    with pytest.raises(AdmissionRejected) as error:
+        await controller.acquire(LOW)
+    assert error.value.reason == "queue_full"
+    high_waiter.cancel()
+    await asyncio.gather(high_waiter, return_exceptions=True)
+
+
+async def test_cancelled_waiter_leaves_the_queue():
+    """A client going away while queued frees its queue slot"""
+    controller = _build_controller(max_queue_size=1)
+    await controller.acquire(LOW)
+    waiter = asyncio.ensure_future(controller.acquire(LOW))
+    await _settle()
+    waiter.cancel()
+    await _settle()
+    assert controller.snapshot()["chatbot"]["queued"] == 0
+
+    controller.release(LOW, 0.0, 0.1, dropped=False)
+    await controller.acquire(LOW)
+    assert controller.snapshot()["chatbot"]["in_flight"] == 1
+
+
+async def test_cancelled_after_admission_hands_slot_on():
+    """A slot granted to a request cancelled before it ran goes to the next"""
+    controller = _build_controller()
+    await controller.acquire(LOW)
+    cancelled = asyncio.ensure_future(controller.acquire(LOW))
+    await _settle()
+    next_waiter = asyncio.ensure_future(controller.acquire(LOW))
+    await _settle()
+
+    controller.release(LOW, 0.0, 0.1, dropped=False)
+    cancelled.cancel()
+    await next_waiter
+    assert controller.snapshot()["chatbot"] == {
+        "priority": 2,
+        "limit": 1,
+        "in_flight": 1,
+        "queued": 0,
+    }
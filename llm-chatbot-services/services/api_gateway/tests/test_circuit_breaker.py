@@ -0,0 +1,124 @@
+"""Tests for the upstream circuit breaker"""
+
+import time
+import pytest
+from app.services.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the monotonic clock with one the test moves by hand"""
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    return now
+
+
+def _open_breaker(**kwargs) -> CircuitBreaker:
+    """A breaker opened by a window of failures"""
+    breaker = CircuitBreaker(
+        "test",
+        window_size=4,
+        minimum_calls=4,
+        open_duration=10.0,
+        half_open_max_calls=2,
+        **kwargs,
+    )
+    for _ in range(4):
+        breaker.before_call()
+        breaker.record(False, 0.1)
+    assert breaker.state == CircuitState.OPEN
+    return breaker
+
+
+def test_stays_closed_below_minimum_calls(clock):
+    """A few failures are not enough to judge the upstream"""
+    breaker = CircuitBreaker("test", window_size=4, minimum_calls=4)
+    for _ in range(3):
+        breaker.before_call()
+        breaker.record(False, 0.1)
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_opens_on_slow_calls(clock):
+    """Calls over the latency threshold open the circuit like failures"""
+    breaker = CircuitBreaker(
+        "test",
+        window_size=4,
+        minimum_calls=4,
+        latency_percentile=0.5,
+        latency_threshold=1.0,
+    )
+    for duration in (0.1, 2.0, 2.0, 2.0):
+        breaker.before_call()
+        breaker.record(True, duration)
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_open_rejects_until_open_duration(clock):
+    """An open circuit rejects calls and reports when it probes again"""
+    breaker = _open_breaker()
+    clock[0] += 4.0
+    assert not breaker.is_available()
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before_call()
+    assert error.value.retry_after == pytest.approx(6.0)
+
+
+def test_half_open_admits_limited_probes(clock):
+    """After open_duration only half_open_max_calls probes go through"""
+    breaker = _open_breaker()
+    clock[0] += 10.0
+    assert breaker.is_available()
+    breaker.before_call()
+    assert breaker.state == CircuitState.HALF_OPEN
+    breaker.before_call()
+    assert not breaker.is_available()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_half_open_closes_after_successful_probes(clock):
+    """Every probe succeeding closes the circuit with a fresh window"""
+    breaker = _open_breaker()
+    clock[0] += 10.0
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record(True, 0.1)
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.snapshot()["calls"] == 0
+
+
+def test_half_open_reopens_on_failed_probe(clock):
+    """One failed probe reopens the circuit for another open_duration"""
+    breaker = _open_breaker()
+    clock[0] += 10.0
+    breaker.before_call()
+    breaker.record(False, 0.1)
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.retry_after() == pytest.approx(10.0)
+
+
+def test_half_open_reopens_on_slow_probe(clock):
+    """A probe over the latency threshold counts as failed"""
+    breaker = _open_breaker(latency_threshold=1.0)
+    clock[0] += 10.0
+    breaker.before_call()
+    breaker.record(True, 2.0)
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_release_gives_back_a_probe_slot(clock):
+    """A probe cancelled without an outcome frees its slot"""
+    breaker = _open_breaker()
+    clock[0] += 10.0
+    breaker.before_call()
+    breaker.before_call()
+    assert not breaker.is_available()
+    breaker.release()
+    assert breaker.is_available()
+    breaker.before_call()
+    assert breaker.state == CircuitState.HALF_OPEN
@@ -0,0 +1,133 @@
+"""Tests for response compression"""
+
+import gzip
+import zlib
+import httpx
+import pytest
+from fastapi.responses import Response
+from app.middleware.compression import CompressionMiddleware
+from app.services.compression import DEFAULT_COMPRESSION_LEVELS, ResponseCompressor
+
+pytestmark = pytest.mark.anyio
+
+BODY = b'{"messages": ["' + b"hello " * 200 + b'"]}'
+
+
+def _compressor(encodings: list[str] | None = None) -> ResponseCompressor:
+    """The built-in levels, compressing bodies from 100 bytes"""
+    return ResponseCompressor(
+        encodings or ["gzip"], DEFAULT_COMPRESSION_LEVELS, min_size=100
+    )
+
+
+def _client(app, encodings: list[str] | None = None) -> httpx.AsyncClient:
+    """Client of the app behind the compression middleware, decoding nothing"""
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(
+            app=CompressionMiddleware(app, compressor=_compressor(encodings))
+        ),
+        base_url="http://gateway",
+    )
+
+
+def _respond(body: bytes, status: int = 200, **headers: str):
+    """An ASGI app sending one buffered response"""
+
+    async def app(scope, receive, send):
+        await Response(
+            body,
+            status_code=status,
+            media_type=headers.pop("media_type", "application/json"),
+            headers=headers,
+        )(scope, receive, send)
+
+    return app
+
+
+async def _get(
+    client: httpx.AsyncClient, accept_encoding: str
+) -> tuple[httpx.Headers, bytes]:
+    """Get the headers and raw body without letting httpx decode it"""
+    async with client.stream(
+        "GET", "/", headers={"Accept-Encoding": accept_encoding}
+    ) as response:
+        body = b"".join([chunk async for chunk in response.aiter_raw()])
+    return response.headers, body
+
+
+def test_negotiate_honours_quality_values():
+    """The preferred accepted coding wins, q=0 refuses one"""
+    compressor = _compressor(["zstd", "br", "gzip"])
+    assert compressor.negotiate("gzip, br") == "br"
+    assert compressor.negotiate("br;q=0, gzip") == "gzip"
+    assert compressor.negotiate("gzip;q=0.5, zstd;q=0.4") == "gzip"
+    assert compressor.negotiate("*") == "zstd"
+    assert compressor.negotiate("identity") is None
+    assert compressor.negotiate(None) is None
+
+
+async def test_compresses_large_json():
+    """A large body is gzipped, its length dropped and its ETag weakened"""
+    async with _client(_respond(BODY, etag='"v1"')) as client:
+        headers, body = await _get(client, "gzip")
+    assert headers["content-encoding"] == "gzip"
+    assert "content-length" not in headers
+    assert headers["etag"] == 'W/"v1"'
+    assert headers["vary"] == "Accept-Encoding"
+    assert gzip.decompress(body) == BODY
+
+
+async def test_small_body_is_sent_as_is():
+    """A body under the threshold is not worth the coding"""
+    async with _client(_respond(b'{"ok": true}')) as client:
+        headers, body = await _get(client, "gzip")
+    assert "content-encoding" not in headers
+    assert body == b'{"ok": true}'
+
+
+async def test_encoded_upstream_body_is_passed_through():
+    """A body the upstream already encoded is never encoded twice"""
+    encoded = gzip.compress(BODY)
+    async with _client(_respond(encoded, **{"content-encoding": "gzip"})) as client:
+        headers, body = await _get(client, "gzip")
+    assert headers["content-encoding"] == "gzip"
+    assert body == encoded
+
+
+async def test_uncompressible_type_is_passed_through():
+    """Media types without levels, like images, are sent as they are"""
+    async with _client(_respond(BODY, media_type="image/png")) as client:
+        headers, body = await _get(client, "gzip")
+    assert "content-encoding" not in headers
+    assert body == BODY
+
+
+async def test_stream_is_flushed_per_chunk():
+    """Every streamed chunk can be decoded as soon as it arrives"""
+    sent = []
+
+    async def app(scope, receive, send):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"text/event-stream")],
+            }
+        )
+        for chunk in (b"data: " + b"a" * 200 + b"\n\n", b"data: b\n\n"):
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def record(message):
+        sent.append(message)
+
+    middleware = CompressionMiddleware(app, compressor=_compressor())
+    scope = {"type": "http", "headers": [(b"accept-encoding", b"gzip")]}
+    await middleware(scope, None, record)
+
+    bodies = [message["body"] for message in sent[1:]]
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    assert decompressor.decompress(bodies[0]) == b"data: " + b"a" * 200 + b"\n\n"
+    assert decompressor.decompress(bodies[1]) == b"data: b\n\n"
+    assert decompressor.decompress(bodies[2]) == b""
+    assert decompressor.eof
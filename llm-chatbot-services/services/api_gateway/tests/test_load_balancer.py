@@ -0,0 +1,116 @@
+"""Tests for the upstream load balancer"""
+
+import pytest
+from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.services.load_balancer import LoadBalancer, UpstreamEndpoint
+
+
+def _endpoints(count: int) -> list[UpstreamEndpoint]:
+    """Replicas with their own circuit breakers"""
+    return [
+        UpstreamEndpoint(f"http://replica-{i}", CircuitBreaker(f"replica-{i}"))
+        for i in range(count)
+    ]
+
+
+def _eject(endpoint: UpstreamEndpoint):
+    """Open the replica's circuit as its failures would"""
+    endpoint.circuit_breaker.open_duration = 60.0
+    for _ in range(endpoint.circuit_breaker.minimum_calls):
+        endpoint.circuit_breaker.before_call()
+        endpoint.circuit_breaker.record(False, 0.1)
+
+
+def test_round_robin_cycles_through_replicas():
+    """Every replica is picked once per round"""
+    endpoints = _endpoints(3)
+    load_balancer = LoadBalancer("test", endpoints, "round_robin")
+    picks = [load_balancer.select() for _ in range(6)]
+    assert picks == endpoints * 2
+
+
+def test_p2c_prefers_fewer_outstanding():
+    """Of two replicas, the one with fewer outstanding requests wins"""
+    endpoints = _endpoints(2)
+    endpoints[0].outstanding = 5
+    load_balancer = LoadBalancer("test", endpoints, "p2c")
+    assert all(load_balancer.select() is endpoints[1] for _ in range(10))
+
+
+def test_select_avoids_excluded_replica():
+    """A retry goes to another replica when there is one"""
+    endpoints = _endpoints(2)
+    load_balancer = LoadBalancer("test", endpoints, "round_robin")
+    assert all(
+        load_balancer.select(exclude=endpoints[0]) is endpoints[1] for _ in range(5)
+    )
+
+
+def test_select_returns_excluded_replica_when_alone():
+    """With one replica left, the excluded one is still used"""
+    endpoints = _endpoints(2)
+    _eject(endpoints[1])
+    load_balancer = LoadBalancer("test", endpoints, "round_robin")
+    assert load_balancer.select(exclude=endpoints[0]) is endpoints[0]
+
+
+def test_select_skips_ejected_replicas():
+    """A replica whose circuit is open gets no traffic"""
+    endpoints = _endpoints(3)
+    _eject(endpoints[1])
+    load_balancer = LoadBalancer("test", endpoints, "round_robin")
+    assert all(load_balancer.select() is not endpoints[1] for _ in range(6))
+
+
+def test_select_raises_when_every_replica_is_ejected():
+    """No available replica surfaces the circuit as open"""
+    endpoints = _endpoints(2)
+    for endpoint in endpoints:
+        _eject(endpoint)
+    load_balancer = LoadBalancer("test", endpoints, "p2c")
+    with pytest.raises(CircuitOpenError):
+        load_balancer.select()
+
+
+def test_consistent_hash_pins_key_to_replica():
+    """The same key keeps going to the same replica"""
+    load_balancer = LoadBalancer("test", _endpoints(3), "consistent_hash")
+    for key in ("alice", "bob", "carol"):
+        home = load_balancer.select(key=key)
+        assert all(load_balancer.select(key=key) is home for _ in range(5))
+
+
+def test_consistent_hash_spreads_keys():
+    """Every replica owns part of the ring"""
+    endpoints = _endpoints(3)
+    load_balancer = LoadBalancer("test", endpoints, "consistent_hash")
+    homes = [load_balancer.select(key=f"user-{i}") for i in range(300)]
+    assert all(any(home is endpoint for home in homes) for endpoint in endpoints)
+
+
+def test_consistent_hash_only_moves_keys_of_ejected_replica():
+    """Ejecting a replica leaves the keys of the others where they were"""
+    endpoints = _endpoints(3)
+    load_balancer = LoadBalancer("test", endpoints, "consistent_hash")
+    keys = [f"user-{i}" for i in range(100)]
+    before = {key: load_balancer.select(key=key) for key in keys}
+    _eject(endpoints[0])
+    for key in keys:
+        after = load_balancer.select(key=key)
+        assert after is not endpoints[0]
+        if before[key] is not endpoints[0]:
+            assert after is before[key]
+
+
+def test_consistent_hash_moves_key_off_overloaded_replica():
+    """A key spills to the next replica while its own is over the load bound"""
+    endpoints = _endpoints(3)
+    load_balancer = LoadBalancer(
+        "test", endpoints, "consistent_hash", balance_factor=1.25
+    )
+    home = load_balancer.select(key="alice")
+    home.outstanding = 10
+    spilled = load_balancer.select(key="alice")
+    assert spilled is not home
+    home.outstanding = 0
+    assert load_balancer.select(key="alice") is home
@@ -0,0 +1,117 @@
+"""Tests for hedged sends of the gateway proxy client"""
+
+import asyncio
+from types import SimpleNamespace
+import httpx
+import pytest
+from shared import RetryBudget
+from app.services.proxy_client import ProxyClient
+
+pytestmark = pytest.mark.anyio
+
+
+class _Upstream(httpx.AsyncBaseTransport):
+    """Replicas answering from a handler with an unread streamed body"""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.hosts = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.hosts.append(request.url.host)
+        status, body, delay = self.handler(request.url.host)
+        await asyncio.sleep(delay)
+        return httpx.Response(status, stream=httpx.ByteStream(body))
+
+
+def _build_proxy_client(handler, replicas: int = 2) -> tuple[ProxyClient, _Upstream]:
+    """A hedging proxy client over fake replicas a, b, ..."""
+    app_config = SimpleNamespace(
+        CIRCUIT_BREAKER_ENABLED=True,
+        CIRCUIT_BREAKER_WINDOW_SIZE=4,
+        CIRCUIT_BREAKER_MINIMUM_CALLS=4,
+        CIRCUIT_BREAKER_FAILURE_RATE_THRESHOLD=0.5,
+        CIRCUIT_BREAKER_LATENCY_PERCENTILE=0.95,
+        CIRCUIT_BREAKER_LATENCY_THRESHOLD_IN_SECS=30.0,
+        CIRCUIT_BREAKER_OPEN_DURATION_IN_SECS=60.0,
+        CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS=1,
+        PROXY_USER_AFFINITY_UPSTREAMS=[],
+        PROXY_LOAD_BALANCING_STRATEGY="round_robin",
+        PROXY_HASH_BALANCE_FACTOR=1.25,
+        PROXY_RETRY_BUDGET_RATIO=1.0,
+        PROXY_RETRY_BUDGET_MIN_PER_SEC=100.0,
+        PROXY_RETRY_BACKOFF_IN_SECS=0.001,
+        PROXY_HEDGE_UPSTREAMS=["test"],
+        PROXY_HEDGE_DELAY_PERCENTILE=0.95,
+        PROXY_HEDGE_MIN_DELAY_IN_SECS=0.01,
+        PROXY_HEDGE_MAX_DELAY_IN_SECS=0.01,
+    )
+    urls = [f"http://{chr(ord('a') + i)}" for i in range(replicas)]
+    proxy_client = ProxyClient(
+        "test", urls, app_config, hedge_budget=RetryBudget(min_retries_per_sec=100.0)
+    )
+    upstream = _Upstream(handler)
+    proxy_client._client = httpx.AsyncClient(transport=upstream)
+    return proxy_client, upstream
+
+
+async def _send(proxy_client: ProxyClient, stream: bool, max_retries: int = 0):
+    """Send a hedgeable GET and read the body the way the callers do"""
+    response, endpoint = await proxy_client._send_with_retries(
+        "GET",
+        None,
+        lambda endpoint: proxy_client.client.build_request("GET", f"{endpoint.url}/"),
+        stream=stream,
+        max_retries=max_retries,
+        retryable=True,
+        hedgeable=True,
+    )
+    if not stream:
+        return response, endpoint, response.content
+    body = b"".join([chunk async for chunk in response.aiter_raw()])
+    await proxy_client._close_streamed_response(response, endpoint)()
+    return response, endpoint, body
+
+
+@pytest.mark.parametrize("stream", [False, True])
+async def test_failed_hedge_does_not_beat_healthy_attempt(stream):
+    """A fast 503 from the hedge loses to a slower 200"""
+
+    def handler(host: str):
+        return (200, b"ok", 0.05) if host == "a" else (503, b"busy", 0.0)
+
+    proxy_client, upstream = _build_proxy_client(handler)
+    response, endpoint, body = await _send(proxy_client, stream)
+    assert (response.status_code, endpoint.url, body) == (200, "http://a", b"ok")
+    assert upstream.hosts == ["a", "b"]
+    assert [endpoint.outstanding for endpoint in proxy_client.endpoints] == [0, 0]
+
+
+async def test_every_attempt_failing_returns_buffered_error():
+    """When no attempt succeeds the first one's error is relayed with its body"""
+
+    def handler(host: str):
+        return 503, f"busy-{host}".encode(), 0.05 if host == "a" else 0.0
+
+    proxy_client, _ = _build_proxy_client(handler)
+    response, _, body = await _send(proxy_client, stream=True)
+    assert response.status_code == 503
+    assert body == b"busy-a"
+    assert [endpoint.outstanding for endpoint in proxy_client.endpoints] == [0, 0]
+
+
+async def test_no_hedge_without_another_replica():
+    """A slow request to the only available replica is not duplicated"""
+
+    def handler(host: str):
+        return 200, host.encode(), 0.05
+
+    proxy_client, upstream = _build_proxy_client(handler)
+    breaker = proxy_client.endpoints[1].circuit_breaker
+    for _ in range(breaker.minimum_calls):
+        breaker.before_call()
+        breaker.record(False, 0.1)
+
+    response, _, body = await _send(proxy_client, stream=False)
+    assert (response.status_code, body) == (200, b"a")
+    assert upstream.hosts == ["a"]
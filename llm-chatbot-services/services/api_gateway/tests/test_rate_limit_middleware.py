@@ -0,0 +1,100 @@
+"""Tests for the rate limiter middleware stages"""
+
+import fakeredis
+import httpx
+import pytest
+from fastapi.responses import JSONResponse
+from app.middleware.rate_limiter import RedisRateLimitMiddleware
+from app.middleware.route_resolver import RouteResolverMiddleware
+from app.services.rate_limit import RateLimitPolicy, RedisRateLimiter
+from app.services.routing import DEFAULT_GATEWAY_ROUTES, GatewayRoute, RouteTable
+
+pytestmark = pytest.mark.anyio
+
+
+def _route_table() -> RouteTable:
+    """The built-in routes with a small default budget"""
+    default = GatewayRoute(
+        prefix="/",
+        method="*",
+        upstream=None,
+        upstream_prefix="",
+        auth="required",
+        timeout=5.0,
+        max_retries=0,
+        cacheable=False,
+        rate_limit=RateLimitPolicy(name="default", limit=100, window=60),
+    )
+    return RouteTable.compile(
+        DEFAULT_GATEWAY_ROUTES, default, {"auth", "chatbot", "conversation"}
+    )
+
+
+def _build_gateway(
+    ip_limit: int, authenticated: bool = False
+) -> tuple[httpx.AsyncClient, list[str]]:
+    """Route resolver, per IP stage, auth, then the per route stage"""
+    auth_calls = []
+    rate_limiter = RedisRateLimiter(fakeredis.FakeAsyncRedis())
+
+    async def upstream(scope, receive, send):
+        await JSONResponse({"ok": True})(scope, receive, send)
+
+    route_stage = RedisRateLimitMiddleware(upstream, rate_limiter=rate_limiter)
+
+    async def auth(scope, receive, send):
+        auth_calls.append(scope["path"])
+        if authenticated:
+            scope["state"]["user"] = {"sub": "alice"}
+            await route_stage(scope, receive, send)
+            return
+        await JSONResponse({"detail": "Invalid token"}, status_code=401)(
+            scope, receive, send
+        )
+
+    app = RedisRateLimitMiddleware(
+        auth,
+        rate_limiter=rate_limiter,
+        policy=RateLimitPolicy(name="ip", limit=ip_limit, window=60, key="ip"),
+    )
+    app = RouteResolverMiddleware(app, route_table=_route_table())
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://gateway"
+    )
+    return client, auth_calls
+
+
+async def test_bogus_tokens_are_limited_per_ip_before_auth():
+    """Once the IP budget is spent, forged tokens no longer reach auth"""
+    client, auth_calls = _build_gateway(ip_limit=3)
+    async with client:
+        statuses = [
+            (
+                await client.get(
+                    "/chatbot/history", headers={"Authorization": f"Bearer forged-{i}"}
+                )
+            ).status_code
+            for i in range(5)
+        ]
+        rejected = await client.get("/chatbot/history")
+    assert statuses == [401, 401, 401, 429, 429]
+    assert len(auth_calls) == 3
+    assert "retry-after" in rejected.headers
+
+
+async def test_exempt_routes_skip_the_ip_budget():
+    """Health probes are never charged to the IP budget"""
+    client, auth_calls = _build_gateway(ip_limit=1)
+    async with client:
+        statuses = [(await client.get("/health")).status_code for _ in range(3)]
+    assert 429 not in statuses
+    assert len(auth_calls) == 3
+
+
+async def test_only_the_route_policy_sets_headers():
+    """An allowed request carries the route budget's headers, once"""
+    client, _ = _build_gateway(ip_limit=3, authenticated=True)
+    async with client:
+        response = await client.get("/chatbot/history")
+    assert response.status_code == 200
+    assert response.headers.get_list("x-ratelimit-limit") == ["300"]
@@ -0,0 +1,57 @@
+"""Tests for the Lua scripts of the Redis rate limiter"""
+
+import asyncio
+import fakeredis
+import pytest
+from app.services.rate_limit import RATE_LIMIT_SCRIPTS, RedisRateLimiter
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(params=sorted(RATE_LIMIT_SCRIPTS))
+def rate_limiter(request):
+    """A rate limiter per algorithm on an in-memory Redis"""
+    return RedisRateLimiter(fakeredis.FakeAsyncRedis(), request.param)
+
+
+async def test_allows_up_to_limit_then_rejects(rate_limiter):
+    """The limit is a hard cap within the window"""
+    results = [await rate_limiter.hit("client", 3, 60) for _ in range(4)]
+    assert [result.allowed for result in results] == [True, True, True, False]
+    assert [result.remaining for result in results[:3]] == [2, 1, 0]
+    rejected = results[-1]
+    assert rejected.remaining == 0
+    assert 0 < rejected.retry_after <= 60
+    assert "Retry-After" in rejected.headers()
+
+
+async def test_cost_spends_several_units(rate_limiter):
+    """A request costing more than what is left is rejected without spending it"""
+    assert (await rate_limiter.hit("client", 10, 60, cost=6)).allowed
+    rejected = await rate_limiter.hit("client", 10, 60, cost=6)
+    assert not rejected.allowed
+    allowed = await rate_limiter.hit("client", 10, 60, cost=4)
+    assert allowed.allowed
+    assert allowed.remaining == 0
+
+
+async def test_cost_above_limit_is_never_allowed(rate_limiter):
+    """A request that could never fit is rejected on an empty budget"""
+    result = await rate_limiter.hit("client", 5, 60, cost=6)
+    assert not result.allowed
+    assert (await rate_limiter.hit("client", 5, 60, cost=5)).allowed
+
+
+async def test_keys_have_separate_budgets(rate_limiter):
+    """Spending one key's budget leaves the others untouched"""
+    assert (await rate_limiter.hit("alice", 1, 60)).allowed
+    assert not (await rate_limiter.hit("alice", 1, 60)).allowed
+    assert (await rate_limiter.hit("bob", 1, 60)).allowed
+
+
+async def test_budget_refills_after_window(rate_limiter):
+    """A short window frees the budget again once it has passed"""
+    assert (await rate_limiter.hit("client", 1, 0.05)).allowed
+    assert not (await rate_limiter.hit("client", 1, 0.05)).allowed
+    await asyncio.sleep(0.1)
+    assert (await rate_limiter.hit("client", 1, 0.05)).allowed
@@ -0,0 +1,98 @@
+"""Tests for the gateway response cache"""
+
+import time
+from types import SimpleNamespace
+import fakeredis
+import pytest
+from app.services.response_cache import CachedResponse, ResponseCache
+
+pytestmark = pytest.mark.anyio
+
+
+def _build_cache(redis_client=None) -> ResponseCache:
+    """A response cache with a ttl long enough for any test"""
+    app_config = SimpleNamespace(
+        RESPONSE_CACHE_TTL_IN_SECS=60.0,
+        RESPONSE_CACHE_MAX_BODY_SIZE_IN_BYTES=1024,
+        RESPONSE_CACHE_MAX_SIZE=100,
+    )
+    return ResponseCache(app_config, redis_client)
+
+
+def _response(body: bytes = b"[]") -> CachedResponse:
+    """A cacheable upstream response"""
+    return CachedResponse.from_upstream(
+        200, [(b"content-type", b"application/json")], body
+    )
+
+
+async def test_set_then_get():
+    """A cached response is served to its owner only"""
+    cache = _build_cache()
+    await cache.set("alice", "/history", _response(), time.monotonic())
+    assert (await cache.get("alice", "/history")).body == b"[]"
+    assert await cache.get("bob", "/history") is None
+
+
+async def test_invalidate_during_miss_drops_stale_response():
+    """A write landing while a miss is in flight keeps its old body out"""
+    cache = _build_cache()
+    started_at = time.monotonic()
+    await cache.invalidate("alice")
+    await cache.set("alice", "/history", _response(b"stale"), started_at)
+    assert await cache.get("alice", "/history") is None
+
+
+async def test_miss_started_after_invalidate_is_cached():
+    """Only requests that started before the write are refused"""
+    cache = _build_cache()
+    await cache.invalidate("alice")
+    await cache.set("alice", "/history", _response(), time.monotonic())
+    assert await cache.get("alice", "/history") is not None
+
+
+async def test_invalidate_only_drops_the_owner():
+    """A user's write leaves other users' entries alone"""
+    cache = _build_cache()
+    started_at = time.monotonic()
+    await cache.set("alice", "/history", _response(), started_at)
+    await cache.set("alice", "/search", _response(), started_at)
+    await cache.set("bob", "/history", _response(), started_at)
+    await cache.invalidate("alice")
+    assert await cache.get("alice", "/history") is None
+    assert await cache.get("alice", "/search") is None
+    assert await cache.get("bob", "/history") is not None
+
+
+async def test_redis_shares_entries_and_invalidations():
+    """Another replica reads the entry from Redis until the owner writes"""
+    redis_client = fakeredis.FakeAsyncRedis()
+    replica_a, replica_b = _build_cache(redis_client), _build_cache(redis_client)
+    await replica_a.set("alice", "/history", _response(), time.monotonic())
+    shared = await replica_b.get("alice", "/history")
+    assert shared is not None
+    assert shared.etag == _response().etag
+
+    await replica_a.invalidate("alice")
+    assert await redis_client.exists("gateway:response_cache:alice") == 0
+    assert await _build_cache(redis_client).get("alice", "/history") is None
+
+
+async def test_invalidate_during_miss_keeps_redis_clean():
+    """The refused stale response is not written to Redis either"""
+    redis_client = fakeredis.FakeAsyncRedis()
+    cache = _build_cache(redis_client)
+    started_at = time.monotonic()
+    await cache.invalidate("alice")
+    await cache.set("alice", "/history", _response(b"stale"), started_at)
+    assert await redis_client.exists("gateway:response_cache:alice") == 0
+
+
+def test_etag_matches_weakly():
+    """If-None-Match compares tags weakly and accepts lists and *"""
+    response = _response()
+    assert response.matches(response.etag)
+    assert response.matches(f'"other", W/{response.etag}')
+    assert response.matches("*")
+    assert not response.matches('"other"')
+    assert not response.matches(None)
@@ -7,6 +7,7 @@ from .dependency_factory import (
     get_app_config,
     get_refresh_token_repository,
     get_reset_password_service,
+    get_token_revocation_service,
 )
 
 __all__ = [
@@ -16,4 +17,5 @@ __all__ = [
     "get_app_config",
     "get_refresh_token_repository",
     "get_reset_password_service",
+    "get_token_revocation_service",
 ]
@@ -14,6 +14,7 @@ from app.dependencies.dependency_factory import (
 )
 from app.repositories.refresh_token_repository import RefreshTokenRepository
 from app.repositories.user_repository import UserRepository
+from app.services.signing_keys import SigningKeys
 
 from .assert_token_validity import (
     assert_token_payload_has_required_fields,
@@ -98,7 +99,9 @@ async def _verify_token(
     """Verify the token"""
     try:
         payload = jwt.decode(
-            token, app_config.SECRET_KEY, algorithms=[app_config.ALGORITHM]
+            token,
+            SigningKeys(app_config).verification_key,
+            algorithms=[app_config.ALGORITHM],
         )
 
         assert_token_payload_has_required_fields(payload)
@@ -8,8 +8,10 @@ from app.repositories.user_repository import UserRepository
 from app.repositories.refresh_token_repository import RefreshTokenRepository
 from app.services.user_service import UserService
 from app.services.reset_password_service import ResetPasswordService
+from app.services.token_revocation_service import TokenRevocationService
 
 _auth_service_app_config = AppConfig()
+_token_revocation_service = TokenRevocationService(_auth_service_app_config)
 
 
 def get_app_config() -> AppConfig:
@@ -51,3 +53,8 @@ def get_reset_password_service(
 ) -> ResetPasswordService:
     """Get the reset password service"""
     return ResetPasswordService(app_config, user_repo)
+
+
+def get_token_revocation_service() -> TokenRevocationService:
+    """Get the token revocation service"""
+    return _token_revocation_service
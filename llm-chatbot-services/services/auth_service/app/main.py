@@ -3,7 +3,14 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends
 from shared import get_logger
-from shared import Database
+from shared import (
+    set_tracer,
+    Database,
+    InstrumentationMiddleware,
+    Tracer,
+    TracingMiddleware,
+    metrics_router,
+)
 from config import AppConfig
 from app.routes import health_router
 from app.services.refresh_token_service import RefreshTokenService
@@ -32,11 +39,16 @@ from app.dependencies.dependency_factory import (
     get_user_repository,
     get_user_service,
     get_reset_password_service,
+    get_token_revocation_service,
 )
 from app.services.reset_password_service import ResetPasswordService
+from app.services.token_revocation_service import TokenRevocationService
+from app.services.signing_keys import SigningKeys
 
 logger = get_logger(service_name="auth_service")
 db_object = Database()
+tracer = Tracer.from_config("auth_service", get_app_config())
+set_tracer(tracer)
 
 logger.info("Auth Service is starting up")
 
@@ -44,16 +56,25 @@ logger.info("Auth Service is starting up")
 @asynccontextmanager
 async def lifespan(_fastapi_app: FastAPI):
     """Lifespan for the application"""
+    await tracer.start()
     logger.info("Initializing database")
     await db_object.init_db()
     yield
     logger.info("Shutting down database")
     await db_object.shutdown_db()
+    await tracer.stop()
 
 
 app = FastAPI(lifespan=lifespan)
+app.add_middleware(
+    InstrumentationMiddleware,
+    service_name="auth_service",
+    server_timing=get_app_config().SERVER_TIMING_ENABLED,
+)
+app.add_middleware(TracingMiddleware)
 
 app.include_router(health_router)
+app.include_router(metrics_router)
 
 
 @app.get("/")
@@ -89,10 +110,14 @@ async def logout(
     refresh_token_repository: RefreshTokenRepository = Depends(
         get_refresh_token_repository
     ),
+    token_revocation_service: TokenRevocationService = Depends(
+        get_token_revocation_service
+    ),
 ):
     """Logout endpoint"""
     logger.info(f"Logging out user: {validated_token.email}")
     await refresh_token_repository.invalidate(validated_token.token)
+    await token_revocation_service.evict_user_tokens(validated_token.email)
     return {"message": f"{validated_token.email} logged out successfully"}
 
 
@@ -104,9 +129,13 @@ async def refresh_access_token(
     refresh_token_repository: RefreshTokenRepository = Depends(
         get_refresh_token_repository
     ),
+    token_revocation_service: TokenRevocationService = Depends(
+        get_token_revocation_service
+    ),
 ):
     """Refresh an access token using a valid refresh token."""
     logger.info(f"Refreshing access token for user: {current_user.email}")
+    await token_revocation_service.evict_user_tokens(current_user.email)
     refresh_token_service = RefreshTokenService(
         app_config, user_repository, refresh_token_repository
     )
@@ -134,6 +163,9 @@ async def reset_password(
         get_refresh_token_repository
     ),
     reset_password_service: ResetPasswordService = Depends(get_reset_password_service),
+    token_revocation_service: TokenRevocationService = Depends(
+        get_token_revocation_service
+    ),
 ):
     """Reset password endpoint"""
     logger.info("Reset password endpoint called")
@@ -143,9 +175,11 @@ async def reset_password(
         user_repository,
         refresh_token_repository,
     )
-    return await reset_password_service.reset_password(
+    reset_result = await reset_password_service.reset_password(
         token_data.email, reset_password_data
     )
+    await token_revocation_service.revoke_user_tokens(token_data.email)
+    return reset_result
 
 
 @app.get("/me")
@@ -157,6 +191,12 @@ async def read_current_user(
     return {"message": "Registered user", "user": current_user}
 
 
+@app.get("/.well-known/jwks.json")
+async def read_jwks(app_config: AppConfig = Depends(get_app_config)):
+    """Public keys used to verify access tokens outside the auth service"""
+    return SigningKeys(app_config).jwks()
+
+
 @app.get("/admin-only")
 async def admin_dashboard(current_user=Depends(require_role("admin"))):
     """Admin dashboard"""
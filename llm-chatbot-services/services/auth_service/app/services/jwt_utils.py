@@ -5,6 +5,7 @@ from datetime import datetime, timedelta, timezone
 from jose import jwt
 from config import AppConfig
 from shared.logger import get_logger
+from app.services.signing_keys import SigningKeys
 
 
 class JWTUtils:
@@ -12,7 +13,7 @@ class JWTUtils:
 
     def __init__(self, app_config: AppConfig):
         """Initialize the JWT utilities"""
-        self.secret_key = app_config.SECRET_KEY
+        self.signing_keys = SigningKeys(app_config)
         self.algorithm = app_config.ALGORITHM
         self.access_token_expire_minutes = app_config.ACCESS_TOKEN_EXPIRE_MINUTES
         self.refresh_token_expire_minutes = app_config.REFRESH_TOKEN_EXPIRE_MINUTES
@@ -41,7 +42,20 @@ class JWTUtils:
     ) -> str:
         """Helper to create a token with a specific type and expiry."""
         to_encode = data.copy()
-        expire = datetime.now(timezone.utc) + expires_delta
-        to_encode.update({"exp": expire, "type": token_type})
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
+        issued_at = datetime.now(timezone.utc)
+        expire = issued_at + expires_delta
+        # iat keeps milliseconds so a password reset cutoff is exact
+        to_encode.update(
+            {
+                "exp": expire,
+                "iat": round(issued_at.timestamp(), 3),
+                "type": token_type,
+            }
+        )
+        encoded_jwt = jwt.encode(
+            to_encode,
+            self.signing_keys.signing_key,
+            algorithm=self.algorithm,
+            headers=self.signing_keys.signing_headers(),
+        )
         return encoded_jwt
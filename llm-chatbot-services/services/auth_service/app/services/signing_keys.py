@@ -0,0 +1,91 @@
+"""Module for the JWT signing keys"""
+
+import hashlib
+import threading
+from jose import jwk
+from config import AppConfig
+from shared.logger import get_logger
+
+
+class SigningKeys:
+    """Keys used to sign and verify JWTs, and the JWKS published for them"""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, app_config: AppConfig):
+        """Initialize the signing keys"""
+        if hasattr(self, "initialized"):
+            return
+        self.__logger = get_logger(service_name="auth_service")
+        self.algorithm = app_config.ALGORITHM
+        self.is_asymmetric = app_config.is_asymmetric_algorithm()
+        self._secret_key = app_config.SECRET_KEY
+        self._private_key_pem = None
+        self.key_id = None
+        self._public_jwks = []
+
+        if self.is_asymmetric:
+            self.__load_asymmetric_keys(app_config)
+        self.initialized = True
+
+    @property
+    def signing_key(self) -> str:
+        """Key used to sign new tokens"""
+        return self._private_key_pem if self.is_asymmetric else self._secret_key
+
+    @property
+    def verification_key(self) -> str | dict:
+        """Key (or key set) used to verify tokens issued by this service"""
+        return self.jwks() if self.is_asymmetric else self._secret_key
+
+    def signing_headers(self) -> dict | None:
+        """JOSE headers added to every new token"""
+        return {"kid": self.key_id} if self.is_asymmetric else None
+
+    def jwks(self) -> dict:
+        """Public keys other services can verify tokens with"""
+        return {"keys": list(self._public_jwks)}
+
+    def __load_asymmetric_keys(self, app_config: AppConfig):
+        """Load the current private key and any previous public keys"""
+        self._private_key_pem = self.__read_pem(app_config.JWT_PRIVATE_KEY_PATH)
+        current_public_key = jwk.construct(
+            self._private_key_pem, self.algorithm
+        ).public_key()
+        self.key_id = self.__get_key_id(current_public_key)
+        self._public_jwks.append(self.__to_public_jwk(current_public_key))
+
+        for public_key_path in app_config.JWT_PREVIOUS_PUBLIC_KEY_PATHS:
+            previous_public_key = jwk.construct(
+                self.__read_pem(public_key_path), self.algorithm
+            )
+            self._public_jwks.append(self.__to_public_jwk(previous_public_key))
+
+        self.__logger.info(
+            f"Loaded {len(self._public_jwks)} public key(s), signing with key {self.key_id}"
+        )
+
+    def __to_public_jwk(self, public_key) -> dict:
+        """Convert a public key into its JWK representation"""
+        public_jwk = public_key.to_dict()
+        public_jwk.update(
+            {"kid": self.__get_key_id(public_key), "use": "sig", "alg": self.algorithm}
+        )
+        return public_jwk
+
+    def __get_key_id(self, public_key) -> str:
+        """Derive a stable key id from the public key"""
+        return hashlib.sha256(public_key.to_pem()).hexdigest()[:16]
+
+    def __read_pem(self, path: str) -> str:
+        """Read a PEM encoded key from disk"""
+        with open(path, encoding="utf-8") as pem_file:
+            return pem_file.read()
@@ -0,0 +1,51 @@
+"""Service for broadcasting token revocations"""
+
+import time
+from config import AppConfig
+from shared import RedisClient
+from shared.logger import get_logger
+from shared.token_revocation import (
+    TOKEN_REVOCATION_CHANNEL,
+    build_token_revocation_message,
+)
+
+
+class TokenRevocationService:
+    """Service for broadcasting token revocations to the api gateway replicas"""
+
+    def __init__(self, app_config: AppConfig):
+        """Initialize the token revocation service"""
+        self.redis_client = (
+            RedisClient(app_config).get_redis_client() if app_config.REDIS_URL else None
+        )
+        self.__logger = get_logger(service_name="auth_service")
+
+    async def evict_user_tokens(self, email: str) -> None:
+        """Drop the gateways' cached validations of the user's tokens
+
+        The next request of the user is validated again, so /me stays the
+        source of truth for whether its token is still accepted.
+        """
+        await self.__broadcast(email, None)
+
+    async def revoke_user_tokens(self, email: str) -> None:
+        """Reject every access token issued to the user until now"""
+        # Stamped once the change is done, iat has the same millisecond precision
+        await self.__broadcast(email, round(time.time(), 3))
+
+    async def __broadcast(self, email: str, revoked_at: float | None) -> None:
+        """Publish a revocation to the gateway replicas"""
+        if self.redis_client is None:
+            self.__logger.debug(
+                "REDIS_URL not set, skipping token revocation broadcast"
+            )
+            return
+
+        try:
+            await self.redis_client.publish(
+                TOKEN_REVOCATION_CHANNEL,
+                build_token_revocation_message(email, revoked_at),
+            )
+            self.__logger.info(f"Token revocation broadcast for user: {email}")
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.__logger.error(f"Token revocation broadcast failed for {email}: {e}")
@@ -8,6 +8,7 @@ from app.repositories.refresh_token_repository import RefreshTokenRepository
 from app.schemas import UserCreate, UserLogin
 from app.models import User
 from app.services.password import PasswordService
+from shared import time_stage
 from shared.logger import get_logger
 
 
@@ -33,7 +34,8 @@ class UserService:
         if await self.user_repository.get_user_by_email(user.email):
             raise HTTPException(status_code=400, detail="Email already registered")
 
-        hashed_pw = self.password_service.hash_password(user.password)
+        with time_stage("password_hash"):
+            hashed_pw = self.password_service.hash_password(user.password)
         new_user = User(
             username=user.username,
             email=user.email,
@@ -52,7 +54,11 @@ class UserService:
         if not user:
             raise HTTPException(status_code=401, detail="Invalid credentials")
 
-        if not self.password_service.verify(credentials.password, user.hashed_password):
+        with time_stage("password_hash"):
+            verified = self.password_service.verify(
+                credentials.password, user.hashed_password
+            )
+        if not verified:
             raise HTTPException(status_code=401, detail="Invalid credentials")
         self.__logger.info(f"User found: {user.email}")
         self.__logger.info(f"Generating new tokens for user: {user.email}")
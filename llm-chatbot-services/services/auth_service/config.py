@@ -14,6 +14,10 @@ class AppConfig(BaseAppConfig):
     ALGORITHM: str | None = None
     ACCESS_TOKEN_EXPIRE_MINUTES: int | None = None
     REFRESH_TOKEN_EXPIRE_MINUTES: int | None = None
+    JWT_PRIVATE_KEY_PATH: str | None = None
+    JWT_PREVIOUS_PUBLIC_KEY_PATHS: list[str] | None = None
+    REDIS_URL: str | None = None
+    SERVER_TIMING_ENABLED: bool = False
 
     def __init__(self):
         self.set_config()
@@ -25,19 +29,33 @@ class AppConfig(BaseAppConfig):
         self.ALGORITHM = os.getenv("ALGORITHM")
         self.ACCESS_TOKEN_EXPIRE_MINUTES = self.__get_access_token_expire_minutes()
         self.REFRESH_TOKEN_EXPIRE_MINUTES = self.__get_refresh_token_expire_minutes()
+        self.JWT_PRIVATE_KEY_PATH = os.getenv("JWT_PRIVATE_KEY_PATH")
+        self.JWT_PREVIOUS_PUBLIC_KEY_PATHS = self.get_list_env(
+            "JWT_PREVIOUS_PUBLIC_KEY_PATHS", []
+        )
+        self.REDIS_URL = os.getenv("REDIS_URL")
+        self.SERVER_TIMING_ENABLED = self.get_bool_env("SERVER_TIMING_ENABLED", False)
+        self.set_tracing_config()
 
     def validate_config(self):
         """Validate the configuration values"""
-        if self.SECRET_KEY is None:
-            raise ConfigError(
-                "SECRET_KEY is required but not set in environment variables."
-            )
+        self.validate_tracing_config()
 
         if self.ALGORITHM is None:
             raise ConfigError(
                 "ALGORITHM is required but not set in environment variables."
             )
 
+        if self.is_asymmetric_algorithm() and self.JWT_PRIVATE_KEY_PATH is None:
+            raise ConfigError(
+                f"JWT_PRIVATE_KEY_PATH is required for {self.ALGORITHM} but not set in environment variables."
+            )
+
+        if not self.is_asymmetric_algorithm() and self.SECRET_KEY is None:
+            raise ConfigError(
+                "SECRET_KEY is required but not set in environment variables."
+            )
+
         if self.ACCESS_TOKEN_EXPIRE_MINUTES is None:
             raise ConfigError(
                 "ACCESS_TOKEN_EXPIRE_MINUTES is required but not set in environment variables."
@@ -48,6 +66,10 @@ class AppConfig(BaseAppConfig):
                 "REFRESH_TOKEN_EXPIRE_MINUTES is required but not set in environment variables."
             )
 
+    def is_asymmetric_algorithm(self) -> bool:
+        """Check if tokens are signed with a public/private key pair"""
+        return not self.ALGORITHM.upper().startswith("HS")
+
     def __get_access_token_expire_minutes(self) -> int | None:
         """Get the access token expire minutes"""
         value = os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES")
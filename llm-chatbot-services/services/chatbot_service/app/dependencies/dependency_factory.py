@@ -1,8 +1,69 @@
+from shared import RedisClient
 from config import AppConfig
+from app.llm.factory import LLMProviderRegistry
+from app.services.chat_service import ChatService
+from app.services.conversation_client import ConversationClient
+from app.services.llm_response_cache import LLMResponseCache
+from app.services.user_context_cache import UserContextCache
+from app.services.health_checker import HealthChecker
 
 _app_config = AppConfig()
+_user_context_cache = (
+    UserContextCache(
+        max_users=_app_config.USER_CONTEXT_CACHE_MAX_USERS,
+        ttl=_app_config.USER_CONTEXT_CACHE_TTL_IN_SECS,
+        history_size=_app_config.USER_CONTEXT_CACHE_HISTORY_SIZE,
+    )
+    if _app_config.USER_CONTEXT_CACHE_ENABLED
+    else None
+)
+_conversation_client = ConversationClient(_app_config)
+_llm_providers = LLMProviderRegistry(_app_config)
+_llm_response_cache = (
+    LLMResponseCache(_app_config, RedisClient(_app_config).get_redis_client())
+    if _app_config.LLM_RESPONSE_CACHE_ENABLED
+    else None
+)
+_chat_service = ChatService(
+    _app_config,
+    _conversation_client,
+    _llm_providers,
+    _user_context_cache,
+    _llm_response_cache,
+)
+_health_checker = HealthChecker(_app_config, _llm_providers.get())
 
 
 def get_app_config() -> AppConfig:
     """Get the app config"""
     return _app_config
+
+
+def get_user_context_cache() -> UserContextCache | None:
+    """Get the user context cache, None when it is disabled"""
+    return _user_context_cache
+
+
+def get_conversation_client() -> ConversationClient:
+    """Get the pooled conversation service client"""
+    return _conversation_client
+
+
+def get_llm_providers() -> LLMProviderRegistry:
+    """Get the registry of LLM providers"""
+    return _llm_providers
+
+
+def get_llm_response_cache() -> LLMResponseCache | None:
+    """Get the LLM response cache, None when it is disabled"""
+    return _llm_response_cache
+
+
+def get_chat_service() -> ChatService:
+    """Get the chat service"""
+    return _chat_service
+
+
+def get_health_checker() -> HealthChecker:
+    """Get the dependency health checker"""
+    return _health_checker
@@ -1,6 +1,7 @@
 """LLM Provider Base Class"""
 
 from abc import ABC, abstractmethod
+from typing import AsyncIterator
 
 
 class LLMProvider(ABC):
@@ -11,3 +12,19 @@ class LLMProvider(ABC):
     @abstractmethod
     async def generate_response(self, prompt: str) -> str:
         """Generate a response from the LLM"""
+
+    @abstractmethod
+    def stream_response(self, prompt: str) -> AsyncIterator[str]:
+        """Stream the text of a response from the LLM as it is generated"""
+
+    @abstractmethod
+    async def embed_text(self, text: str) -> list[float]:
+        """Get the embedding of a text"""
+
+    @abstractmethod
+    async def check_health(self) -> None:
+        """Check that the LLM API is reachable without generating anything"""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release the connections held by the provider"""
@@ -1,13 +1,28 @@
 """LLM Provider Factory"""
 
+from app.llm.base import LLMProvider
 from app.llm.gemini import GeminiLLM
+from config import AppConfig
 
-"""Add other providers here when needed"""  # pylint: disable=pointless-string-statement
 
+class LLMProviderRegistry:
+    """Providers built once at startup and shared by every request"""
 
-def get_llm_provider(provider: str = "gemini") -> GeminiLLM:
-    """Get the LLM provider"""
-    if provider == "gemini":
-        return GeminiLLM()
-    else:
-        raise ValueError(f"Invalid provider: {provider}")
+    def __init__(self, app_config: AppConfig):
+        """Initialize the registry"""
+        # Add other providers here when needed
+        self._providers: dict[str, LLMProvider] = {
+            GeminiLLM.llm_name: GeminiLLM(app_config),
+        }
+
+    def get(self, provider: str = "gemini") -> LLMProvider:
+        """Get the LLM provider"""
+        try:
+            return self._providers[provider]
+        except KeyError:
+            raise ValueError(f"Invalid provider: {provider}") from None
+
+    async def close(self) -> None:
+        """Close every provider"""
+        for provider in self._providers.values():
+            await provider.close()
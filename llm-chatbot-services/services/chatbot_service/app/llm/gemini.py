@@ -1,7 +1,9 @@
 """Gemini LLM Provider"""
 
-import httpx
+import json
+from typing import AsyncIterator
 from app.llm.base import LLMProvider
+from app.utils.http_client import build_http_client
 from config import AppConfig
 
 
@@ -10,10 +12,22 @@ class GeminiLLM(LLMProvider):
 
     llm_name = "gemini"
 
-    def __init__(self):
-        self.app_config = AppConfig()
+    def __init__(self, app_config: AppConfig):
+        self.app_config = app_config
         self.api_key = self.app_config.GEMINI_API_KEY
         self.endpoint = self.app_config.GEMINI_URL
+        self.stream_endpoint = self.app_config.GEMINI_STREAM_URL
+        self.embedding_endpoint = self.app_config.GEMINI_EMBEDDING_URL
+        self.model_endpoint = self.app_config.GEMINI_MODEL_URL
+        self._client = build_http_client(
+            app_config,
+            timeout=app_config.LLM_TIMEOUT_IN_SECS,
+            http2=app_config.LLM_HTTP2_ENABLED,
+        )
+
+    async def close(self) -> None:
+        """Close the connection pool"""
+        await self._client.aclose()
 
     async def generate_response(self, prompt: str) -> str:
         """Generate a response from the LLM"""
@@ -21,9 +35,52 @@ class GeminiLLM(LLMProvider):
         params = {"key": self.api_key}
         body = {"contents": [{"parts": [{"text": prompt}]}]}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.endpoint, headers=headers, params=params, json=body
-            )
+        response = await self._client.post(
+            self.endpoint, headers=headers, params=params, json=body
+        )
+        response.raise_for_status()
+        return response
+
+    async def stream_response(self, prompt: str) -> AsyncIterator[str]:
+        """Stream the response text from streamGenerateContent as SSE"""
+        headers = {"Content-Type": "application/json"}
+        params = {"key": self.api_key, "alt": "sse"}
+        body = {"contents": [{"parts": [{"text": prompt}]}]}
+
+        async with self._client.stream(
+            "POST", self.stream_endpoint, headers=headers, params=params, json=body
+        ) as response:
             response.raise_for_status()
-            return response
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                for text in self._parse_chunk(json.loads(line[5:])):
+                    yield text
+
+    async def embed_text(self, text: str) -> list[float]:
+        """Get the embedding of a text from embedContent"""
+        headers = {"Content-Type": "application/json"}
+        params = {"key": self.api_key}
+        body = {
+            "content": {"parts": [{"text": text}]},
+            "outputDimensionality": self.app_config.GEMINI_EMBEDDING_DIMENSIONS,
+        }
+
+        response = await self._client.post(
+            self.embedding_endpoint, headers=headers, params=params, json=body
+        )
+        response.raise_for_status()
+        return response.json()["embedding"]["values"]
+
+    async def check_health(self) -> None:
+        """Get the model from models.get, which checks the key and is not billed"""
+        response = await self._client.get(
+            self.model_endpoint, params={"key": self.api_key}
+        )
+        response.raise_for_status()
+
+    def _parse_chunk(self, chunk: dict) -> list[str]:
+        """Get the text parts of a streamed chunk, the last one may have none"""
+        candidates = chunk.get("candidates") or [{}]
+        parts = candidates[0].get("content", {}).get("parts", [])
+        return [part["text"] for part in parts if part.get("text")]
@@ -1,14 +1,52 @@
 """Module for the chatbot service"""
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from shared import get_logger
+from shared import (
+    get_logger,
+    set_tracer,
+    InstrumentationMiddleware,
+    Tracer,
+    TracingMiddleware,
+    metrics_router,
+)
+from app.dependencies.dependency_factory import (
+    get_app_config,
+    get_conversation_client,
+    get_health_checker,
+    get_llm_providers,
+    get_llm_response_cache,
+)
 from app.routes import chat_router, health_router
 
 logger = get_logger(service_name="chatbot_service")
+tracer = Tracer.from_config("chatbot_service", get_app_config())
+set_tracer(tracer)
 
 logger.info("Chatbot Service is up and running.")
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(_fastapi_app: FastAPI):
+    """Lifespan for the application"""
+    await tracer.start()
+    await get_health_checker().start()
+    yield
+    await get_health_checker().close()
+    await get_conversation_client().close()
+    await get_llm_providers().close()
+    if get_llm_response_cache() is not None:
+        await get_llm_response_cache().close()
+    await tracer.stop()
+
+
+app = FastAPI(lifespan=lifespan)
+app.add_middleware(
+    InstrumentationMiddleware,
+    service_name="chatbot_service",
+    server_timing=get_app_config().SERVER_TIMING_ENABLED,
+)
+app.add_middleware(TracingMiddleware)
 
 
 @app.get("/")
@@ -19,3 +57,4 @@ def read_root():
 
 app.include_router(chat_router)
 app.include_router(health_router)
+app.include_router(metrics_router)
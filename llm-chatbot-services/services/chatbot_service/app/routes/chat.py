@@ -1,7 +1,11 @@
 """Chat Service Routes"""
 
+import json
+from typing import AsyncIterator
 from fastapi import APIRouter, Depends, Query, HTTPException, status
+from fastapi.responses import StreamingResponse
 from shared import get_logger
+from app.dependencies.dependency_factory import get_chat_service
 from app.schemas.chat_schema import ChatRequest, ChatResponse
 from app.services.chat_service import ChatService
 
@@ -12,7 +16,7 @@ router = APIRouter(prefix="/chat", tags=["Chat"])
 @router.post("/", response_model=ChatResponse, status_code=status.HTTP_200_OK)
 async def chat_endpoint(
     request: ChatRequest,
-    service: ChatService = Depends(),
+    service: ChatService = Depends(get_chat_service),
     provider: str = Query(default="gemini"),
 ):
     """Chat endpoint"""
@@ -25,3 +29,45 @@ async def chat_endpoint(
     except Exception as e:
         logger.error(f"Error in chat endpoint: {e}")
         raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.post("/stream", status_code=status.HTTP_200_OK)
+async def chat_stream_endpoint(
+    request: ChatRequest,
+    service: ChatService = Depends(get_chat_service),
+    provider: str = Query(default="gemini"),
+) -> StreamingResponse:
+    """Chat endpoint streaming the reply as Server-Sent Events
+
+    Every token is sent as a message event with {"text": ...}, followed by
+    a done event once the reply was saved, or an error event if the stream
+    broke off after the first token.
+    """
+    logger.info("Chat stream endpoint called")
+    try:
+        reply = await service.handle_chat_stream(request, provider)
+    except ValueError as e:
+        logger.error(f"Value Error in chat stream endpoint: {e}")
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        logger.error(f"Error in chat stream endpoint: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+    return StreamingResponse(
+        _format_events(reply),
+        media_type="text/event-stream",
+        # Keep proxies from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _format_events(reply: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Format the reply tokens as Server-Sent Events"""
+    try:
+        async for token in reply:
+            yield f"data: {json.dumps({'text': token})}\n\n"
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.error(f"Error in chat stream: {e}")
+        yield f"event: error\ndata: {json.dumps({'detail': str(e)})}\n\n"
+        return
+    yield "event: done\ndata: {}\n\n"
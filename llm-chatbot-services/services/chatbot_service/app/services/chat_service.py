@@ -1,47 +1,224 @@
 """Service for the chat service"""
 
-from shared.logger import get_logger
+import asyncio
+import time
+from typing import AsyncIterator, Awaitable
+from prometheus_client import Counter
+from shared import get_logger, get_current_span, record_stage, time_stage
+from config import AppConfig
 from app.schemas.chat_schema import ChatRequest, ChatResponse
 from app.services.conversation_client import ConversationClient
-from app.llm.factory import get_llm_provider
+from app.services.llm_response_cache import LLMResponseCache, LLMResponseCacheLookup
+from app.services.user_context_cache import UserContextCache
+from app.llm.base import LLMProvider
+from app.llm.factory import LLMProviderRegistry
 from app.utils.errors import ServiceError
 
+CONTEXT_DEGRADATIONS = Counter(
+    "chat_context_degradations_total",
+    "Chat turns answered without a piece of context, by source and reason",
+    ["source", "reason"],
+)
+
 
 class ChatService:
-    """Service for the chat service"""
+    """Service for the chat service, shared by every request
+
+    Holds no per-request state, the provider of a turn is passed along.
+    """
 
-    def __init__(self):
+    def __init__(
+        self,
+        app_config: AppConfig,
+        conversation_client: ConversationClient,
+        llm_providers: LLMProviderRegistry,
+        user_context_cache: UserContextCache | None,
+        llm_response_cache: LLMResponseCache | None,
+    ):
         """Initialize the chat service"""
         self.logger = get_logger(service_name="chat_service")
-        self.conversation_client = ConversationClient()
-        self.llm_provider = None
+        self.app_config = app_config
+        self.conversation_client = conversation_client
+        self.llm_providers = llm_providers
+        self.user_context_cache = user_context_cache
+        self.llm_response_cache = llm_response_cache
 
     async def handle_chat(self, request: ChatRequest, provider: str) -> ChatResponse:
         """Handle the chat request"""
-        self.llm_provider = get_llm_provider(provider)
-        self.logger.info(f"Handling chat request for user {request.user_id}")
-        history = await self._get_user_history(request.user_id)
-        semantic_search_results = await self._get_semantic_search_results(
-            request.user_id, request.message
+        llm_provider = self.llm_providers.get(provider)
+        prompt, has_context = await self._prepare_prompt(request)
+        cached = await self._get_cached_reply(
+            llm_provider, request, prompt, has_context
+        )
+
+        if cached is not None and cached.reply is not None:
+            reply = cached.reply
+        else:
+            started_at = time.perf_counter()
+            with time_stage("llm"):
+                response = await self._get_llm_response(llm_provider, prompt)
+            reply = self._parse_response(response)
+            await self._cache_reply(cached, reply, time.perf_counter() - started_at)
+        await self._save_turn(request, reply)
+        return ChatResponse(response=reply)
+
+    async def handle_chat_stream(
+        self, request: ChatRequest, provider: str
+    ) -> AsyncIterator[str]:
+        """Handle the chat request, streaming the reply as the LLM generates it
+
+        Returns once the first token arrived, so failures up to then raise
+        here and keep their status code. The reply is saved after the last
+        token, and not at all if the client goes away before that. A cached
+        reply is sent as a single token.
+        """
+        llm_provider = self.llm_providers.get(provider)
+        prompt, has_context = await self._prepare_prompt(request)
+        cached = await self._get_cached_reply(
+            llm_provider, request, prompt, has_context
         )
+        if cached is not None and cached.reply is not None:
+            return self._replay_reply(request, cached.reply)
+
+        started_at = time.perf_counter()
+        tokens = self._stream_llm_response(llm_provider, prompt)
+        with time_stage("llm_first_token"):
+            first_token = await anext(tokens, "")
+        return self._relay_reply(request, cached, first_token, tokens, started_at)
+
+    async def _prepare_prompt(self, request: ChatRequest) -> tuple[str, bool]:
+        """Build the prompt from the user's message and its context
 
+        History and semantic search are fetched concurrently, each within
+        its own deadline. A source that fails or runs late is left out of
+        the prompt and recorded as a degradation instead of failing the turn.
+        Also tells whether the prompt holds any of the user's context.
+        """
+        self.logger.info(f"Handling chat request for user {request.user_id}")
+        history, semantic_search_results = await asyncio.gather(
+            self._get_context(
+                "history",
+                self._get_user_history(request.user_id),
+                self.app_config.CHAT_HISTORY_DEADLINE_IN_SECS,
+                [],
+            ),
+            self._get_context(
+                "semantic_search",
+                self._get_semantic_search_results(request.user_id, request.message),
+                self.app_config.CHAT_SEMANTIC_SEARCH_DEADLINE_IN_SECS,
+                {"matches": []},
+            ),
+        )
         prompt = self._build_prompt(history, request.message, semantic_search_results)
+        return prompt, bool(history or semantic_search_results["matches"])
 
-        response = await self._get_llm_response(prompt)
-        reply = self._parse_response(response)
-        await self._save_message(request.user_id, request.message)
-        await self._save_message(request.user_id, reply)
-        return ChatResponse(response=reply)
+    async def _get_context(
+        self, source: str, fetch: Awaitable, deadline: float, fallback: list | dict
+    ) -> list | dict:
+        """Fetch one source of context, falling back when it fails or runs late"""
+        with time_stage(source):
+            try:
+                return await asyncio.wait_for(fetch, timeout=deadline)
+            except asyncio.TimeoutError:
+                self._record_degradation(source, "timeout")
+            except ServiceError:
+                self._record_degradation(source, "error")
+        return fallback
+
+    def _record_degradation(self, source: str, reason: str) -> None:
+        """Count a missing source of context and mark it on the request span"""
+        self.logger.warning(f"Building the prompt without {source}: {reason}")
+        CONTEXT_DEGRADATIONS.labels(source=source, reason=reason).inc()
+        span = get_current_span()
+        if span is not None:
+            span.set_attribute(f"chat.{source}.degraded", reason)
+
+    async def _relay_reply(
+        self,
+        request: ChatRequest,
+        cached: LLMResponseCacheLookup | None,
+        first_token: str,
+        tokens: AsyncIterator[str],
+        started_at: float,
+    ) -> AsyncIterator[str]:
+        """Relay the streamed tokens, then save the assembled reply"""
+        parts = [first_token]
+        try:
+            if first_token:
+                yield first_token
+            async for token in tokens:
+                parts.append(token)
+                yield token
+        finally:
+            await tokens.aclose()
+        # Not a time_stage, which must not stay open across yields
+        generation_time = time.perf_counter() - started_at
+        record_stage("llm", generation_time)
+        reply = "".join(parts)
+        await self._cache_reply(cached, reply, generation_time)
+        await self._save_turn(request, reply)
+
+    async def _replay_reply(
+        self, request: ChatRequest, reply: str
+    ) -> AsyncIterator[str]:
+        """Send a cached reply, then save it like a generated one"""
+        yield reply
+        await self._save_turn(request, reply)
+
+    async def _get_cached_reply(
+        self,
+        llm_provider: LLMProvider,
+        request: ChatRequest,
+        prompt: str,
+        has_context: bool,
+    ) -> LLMResponseCacheLookup | None:
+        """Look the reply up in the response cache, None when it is disabled"""
+        if self.llm_response_cache is None:
+            return None
+        with time_stage("response_cache"):
+            return await self.llm_response_cache.get(
+                llm_provider, request.user_id, request.message, prompt, has_context
+            )
+
+    async def _cache_reply(
+        self,
+        cached: LLMResponseCacheLookup | None,
+        reply: str,
+        generation_time: float,
+    ) -> None:
+        """Cache a generated reply after a miss"""
+        if self.llm_response_cache is not None and cached is not None:
+            await self.llm_response_cache.set(cached, reply, generation_time)
+
+    async def _save_turn(self, request: ChatRequest, reply: str) -> None:
+        """Save the user's message and the reply in one write, and cache both
+
+        A turn the LLM fails to answer is not saved, so the history never
+        holds a message without its reply.
+        """
+        with time_stage("save"):
+            saved_messages = await self._save_messages(
+                request.user_id, [request.message, reply]
+            )
+        if self.user_context_cache is not None:
+            self.user_context_cache.add_messages(request.user_id, saved_messages)
 
     async def _get_user_history(self, user_id: str) -> list[dict]:
-        """Get the user history"""
+        """Get the user history, from this replica's cache when it is warm"""
+        if self.user_context_cache is not None:
+            history = self.user_context_cache.get_history(user_id)
+            if history is not None:
+                return history
         try:
-            return await self.conversation_client.get_user_history(user_id)
+            history = await self.conversation_client.get_user_history(user_id)
         except Exception as e:
             self.logger.error(f"Error getting user history for user {user_id}: {e}")
             raise ServiceError(
                 f"Error getting user history for user {user_id}: {e}"
             ) from e
+        if self.user_context_cache is not None:
+            self.user_context_cache.set_history(user_id, history)
+        return history
 
     async def _get_semantic_search_results(self, user_id: str, message: str) -> dict:
         """Get the semantic search results"""
@@ -57,21 +234,32 @@ class ChatService:
                 f"Error getting semantic search results for user {user_id}: {e}"
             ) from e
 
-    async def _get_llm_response(self, prompt: str) -> str:
+    async def _get_llm_response(self, llm_provider: LLMProvider, prompt: str) -> str:
         """Get the LLM response"""
         try:
-            return await self.llm_provider.generate_response(prompt)
+            return await llm_provider.generate_response(prompt)
         except Exception as e:
             self.logger.error(f"Error getting LLM response: {e}")
             raise ServiceError(f"Error getting LLM response: {e}") from e
 
-    async def _save_message(self, user_id: str, message: str) -> None:
-        """Save the message"""
+    async def _stream_llm_response(
+        self, llm_provider: LLMProvider, prompt: str
+    ) -> AsyncIterator[str]:
+        """Stream the LLM response"""
+        try:
+            async for token in llm_provider.stream_response(prompt):
+                yield token
+        except Exception as e:
+            self.logger.error(f"Error streaming LLM response: {e}")
+            raise ServiceError(f"Error streaming LLM response: {e}") from e
+
+    async def _save_messages(self, user_id: str, messages: list[str]) -> list[dict]:
+        """Save the messages"""
         try:
-            await self.conversation_client.save_message(user_id, message)
+            return await self.conversation_client.save_messages(user_id, messages)
         except Exception as e:
-            self.logger.error(f"Error saving message for user {user_id}: {e}")
-            raise ServiceError(f"Error saving message for user {user_id}: {e}") from e
+            self.logger.error(f"Error saving messages for user {user_id}: {e}")
+            raise ServiceError(f"Error saving messages for user {user_id}: {e}") from e
 
     def _build_prompt(
         self,
@@ -1,25 +1,50 @@
 """Conversation Client"""
 
-import httpx
+import itertools
 import urllib.parse
-from shared import get_logger
-from app.dependencies.dependency_factory import get_app_config
+from shared import Hedger, RetryBudget, get_logger
+from config import AppConfig
+from app.utils.http_client import build_http_client
 
 
 class ConversationClient:
-    """Conversation Client"""
+    """Conversation Client sharing one connection pool across requests"""
 
-    def __init__(self):
+    def __init__(self, app_config: AppConfig):
         """Initialize the Conversation Client"""
         self.logger = get_logger(service_name="conversation_client")
-        self.app_config = get_app_config()
-        self.base_url = self.app_config.CONVERSATION_SERVICE_URL
+        self.app_config = app_config
+        self.replica_urls = self.app_config.CONVERSATION_SERVICE_URLS
+        self._round_robin = itertools.count()
+        self._client = build_http_client(
+            app_config,
+            timeout=app_config.CONVERSATION_SERVICE_TIMEOUT_IN_SECS,
+            http2=app_config.CONVERSATION_SERVICE_HTTP2_ENABLED,
+        )
+        # A hedge sent to the same replica, over HTTP/2 even on the same
+        # connection, would only add load to the one that is running late
+        self.hedging_enabled = app_config.CONVERSATION_HEDGING_ENABLED
+        if self.hedging_enabled and len(self.replica_urls) < 2:
+            self.logger.warning(
+                "Conversation hedging needs two CONVERSATION_SERVICE_URLS, disabling it"
+            )
+            self.hedging_enabled = False
+        self._hedgers: dict[str, Hedger] = {}
+        # One budget for every hedged read so hedging cannot add up across them
+        self._hedge_budget = RetryBudget(
+            ratio=app_config.CONVERSATION_HEDGE_BUDGET_RATIO,
+            min_retries_per_sec=app_config.CONVERSATION_HEDGE_BUDGET_MIN_PER_SEC,
+        )
+
+    async def close(self) -> None:
+        """Close the connection pool"""
+        await self._client.aclose()
 
     async def get_user_history(self, user_id: int):
         """Get the user history"""
         self.logger.info(f"Getting user history for user {user_id}")
-        response = await self._make_request(
-            f"/conversations/history?user_id={user_id}", "GET", {}
+        response = await self._make_hedged_request(
+            "history", f"/conversations/history?user_id={user_id}"
         )
         return response.json()
 
@@ -27,8 +52,9 @@ class ConversationClient:
         """Get semantic search results for a user"""
         self.logger.info(f"Getting semantic search results for user {user_id}")
         encoded_query = urllib.parse.quote(query)
-        response = await self._make_request(
-            f"/semantic-search/?user_id={user_id}&query={encoded_query}", "GET", {}
+        response = await self._make_hedged_request(
+            "semantic_search",
+            f"/semantic-search/?user_id={user_id}&query={encoded_query}",
         )
         return response.json()
 
@@ -40,10 +66,48 @@ class ConversationClient:
         )
         return response.json()
 
-    async def _make_request(self, path: str, method: str, json: dict):
-        """Make a request to the conversation service"""
-        self.logger.info(f"Making {method} request to {path}")
-        async with httpx.AsyncClient() as client:
-            response = await client.request(method, f"{self.base_url}{path}", json=json)
-            response.raise_for_status()
-            return response
+    async def save_messages(self, user_id: int, messages: list[str]):
+        """Save several messages, in order, with one request"""
+        self.logger.info(f"Saving {len(messages)} messages for user {user_id}")
+        response = await self._make_request(
+            "/conversations/messages/batch",
+            "POST",
+            {"messages": [{"user_id": user_id, "message": m} for m in messages]},
+        )
+        return response.json()
+
+    def _get_hedger(self, name: str) -> Hedger | None:
+        """Get the hedger of a read, None when hedging is disabled"""
+        if not self.hedging_enabled:
+            return None
+        if name not in self._hedgers:
+            self._hedgers[name] = Hedger(
+                name,
+                self._hedge_budget,
+                percentile=self.app_config.CONVERSATION_HEDGE_DELAY_PERCENTILE,
+                min_delay=self.app_config.CONVERSATION_HEDGE_MIN_DELAY_IN_SECS,
+                max_delay=self.app_config.CONVERSATION_HEDGE_MAX_DELAY_IN_SECS,
+            )
+        return self._hedgers[name]
+
+    async def _make_hedged_request(self, operation: str, path: str):
+        """Make a GET request, hedged with a second one to the next replica"""
+        hedger = self._get_hedger(operation)
+        replica = next(self._round_robin)
+        if hedger is None:
+            return await self._make_request(path, "GET", {}, replica)
+        return await hedger.run(
+            lambda index: self._make_request(path, "GET", {}, replica + index)
+        )
+
+    async def _make_request(
+        self, path: str, method: str, json: dict, replica: int | None = None
+    ):
+        """Make a request to a conversation service replica, by default the next"""
+        if replica is None:
+            replica = next(self._round_robin)
+        base_url = self.replica_urls[replica % len(self.replica_urls)]
+        self.logger.info(f"Making {method} request to {base_url}{path}")
+        response = await self._client.request(method, f"{base_url}{path}", json=json)
+        response.raise_for_status()
+        return response
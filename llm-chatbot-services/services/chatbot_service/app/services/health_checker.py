@@ -0,0 +1,69 @@
+"""Dependency health checks for the chatbot service"""
+
+import functools
+import httpx
+from shared import HealthCheckError, HealthProber
+from config import AppConfig
+from app.llm.base import LLMProvider
+
+
+class HealthChecker:
+    """Probes the conversation service and the LLM API
+
+    The prober checks the conversation service's /health and runs in the
+    background. The deep prober checks its /health/all and only probes on
+    demand. Both reach the LLM API through its model metadata, so no probe
+    spends a completion or counts against the generation quota.
+    """
+
+    def __init__(self, app_config: AppConfig, llm_provider: LLMProvider):
+        """Initialize the health checker"""
+        self.app_config = app_config
+        self.llm_provider = llm_provider
+        self._client = httpx.AsyncClient()
+        self.prober = self._build_prober("chatbot", "/health")
+        self.deep_prober = self._build_prober("chatbot_all", "/health/all")
+
+    async def start(self) -> None:
+        """Start probing the dependencies in the background"""
+        await self.prober.start()
+
+    async def close(self) -> None:
+        """Stop probing and close the connection pool"""
+        await self.prober.stop()
+        await self._client.aclose()
+
+    def _build_prober(self, name: str, conversation_service_path: str) -> HealthProber:
+        """Build a prober for the conversation service path and the LLM API"""
+        return HealthProber(
+            name,
+            {
+                "conversation_service_health": functools.partial(
+                    self._check_conversation_service, conversation_service_path
+                ),
+                "llm_api_health": self._check_llm_api,
+            },
+            interval=self.app_config.HEALTH_CHECK_INTERVAL_IN_SECS,
+            timeout=self.app_config.HEALTH_CHECK_TIMEOUT_IN_SECS,
+        )
+
+    async def _check_conversation_service(self, path: str) -> dict:
+        """Check the health of the conversation service"""
+        response = await self._client.get(
+            f"{self.app_config.CONVERSATION_SERVICE_URL}{path}"
+        )
+        try:
+            detail = response.json()
+        except ValueError:
+            detail = {"status": "error", "detail": response.text}
+        if response.status_code != 200:
+            raise HealthCheckError(detail)
+        return detail
+
+    async def _check_llm_api(self) -> dict:
+        """Check the health of the LLM API"""
+        await self.llm_provider.check_health()
+        return {
+            "status": "ok",
+            "detail": f"{self.llm_provider.llm_name} API is healthy",
+        }
@@ -0,0 +1,186 @@
+"""LLM response cache for the chatbot service"""
+
+import base64
+import hashlib
+import json
+import math
+import operator
+import time
+from array import array
+from dataclasses import dataclass
+import redis.asyncio as redis
+from prometheus_client import Counter
+from shared import get_logger
+from config import AppConfig
+from app.llm.base import LLMProvider
+
+logger = get_logger(service_name="llm_response_cache")
+
+LLM_RESPONSE_CACHE_LOOKUPS = Counter(
+    "llm_response_cache_lookups_total",
+    "LLM response cache lookups by tier and whether they hit",
+    ["tier", "result"],
+)
+LLM_RESPONSE_CACHE_SAVED_SECONDS = Counter(
+    "llm_response_cache_saved_seconds_total",
+    "Generation time of the replies served from the cache, by tier",
+    ["tier"],
+)
+
+REDIS_KEY_PREFIX = "chatbot:llm_response_cache"
+
+
+@dataclass
+class LLMResponseCacheLookup:
+    """Outcome of a lookup, kept to cache the reply generated on a miss"""
+
+    exact_key: str
+    semantic_key: str | None = None
+    embedding: array | None = None
+    reply: str | None = None
+    has_context: bool = False
+
+
+class LLMResponseCache:
+    """Caches LLM replies in Redis, by prompt and optionally by similar message
+
+    The exact tier keys a reply by a hash of the normalized prompt, which
+    holds the history and search matches, so a hit always answered the
+    same input. The semantic tier embeds the user's message and reuses the
+    reply of the most similar recent message of the scope, whatever its
+    context, from the configured cosine similarity on. Its entries of a
+    scope live in one capped Redis list and are compared in process. The
+    global scope only stores replies to prompts without any history or
+    search matches, which would otherwise leak one user's conversation to
+    the others.
+    """
+
+    def __init__(self, app_config: AppConfig, redis_client: redis.Redis):
+        """Initialize the LLM response cache"""
+        self.ttl = app_config.LLM_RESPONSE_CACHE_TTL_IN_SECS
+        self.semantic_enabled = app_config.LLM_SEMANTIC_CACHE_ENABLED
+        self.semantic_threshold = app_config.LLM_SEMANTIC_CACHE_THRESHOLD
+        self.semantic_scope = app_config.LLM_SEMANTIC_CACHE_SCOPE
+        self.semantic_max_entries = app_config.LLM_SEMANTIC_CACHE_MAX_ENTRIES
+        self.redis_client = redis_client
+
+    async def close(self) -> None:
+        """Close the Redis connection pool"""
+        await self.redis_client.aclose()
+
+    async def get(
+        self,
+        llm_provider: LLMProvider,
+        user_id: int,
+        message: str,
+        prompt: str,
+        has_context: bool,
+    ) -> LLMResponseCacheLookup:
+        """Look the reply up by prompt, then by similar message"""
+        lookup = LLMResponseCacheLookup(
+            exact_key=self._exact_key(llm_provider.llm_name, prompt),
+            has_context=has_context,
+        )
+        lookup.reply = await self._get_exact(lookup)
+        if lookup.reply is not None or not self.semantic_enabled:
+            return lookup
+
+        lookup.semantic_key = self._semantic_key(llm_provider.llm_name, user_id)
+        lookup.reply = await self._get_semantic(llm_provider, lookup, message)
+        return lookup
+
+    async def set(
+        self, lookup: LLMResponseCacheLookup, reply: str, generation_time: float
+    ) -> None:
+        """Cache a generated reply in every enabled tier"""
+        if not reply:
+            return
+
+        entry = {"reply": reply, "generation_time": generation_time}
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.set(lookup.exact_key, json.dumps(entry), px=int(self.ttl * 1000))
+                if self._is_semantic_cacheable(lookup):
+                    entry["embedding"] = base64.b64encode(
+                        lookup.embedding.tobytes()
+                    ).decode("ascii")
+                    entry["expires_at"] = time.time() + self.ttl
+                    pipe.lpush(lookup.semantic_key, json.dumps(entry))
+                    pipe.ltrim(lookup.semantic_key, 0, self.semantic_max_entries - 1)
+                    pipe.pexpire(lookup.semantic_key, int(self.ttl * 1000))
+                await pipe.execute()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error(f"LLM response cache Redis write failed: {e}")
+
+    async def _get_exact(self, lookup: LLMResponseCacheLookup) -> str | None:
+        """Get the reply cached for the same prompt"""
+        try:
+            data = await self.redis_client.get(lookup.exact_key)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error(f"LLM response cache Redis lookup failed: {e}")
+            LLM_RESPONSE_CACHE_LOOKUPS.labels("exact", "error").inc()
+            return None
+        if data is None:
+            LLM_RESPONSE_CACHE_LOOKUPS.labels("exact", "miss").inc()
+            return None
+        return self._hit("exact", json.loads(data))
+
+    async def _get_semantic(
+        self, llm_provider: LLMProvider, lookup: LLMResponseCacheLookup, message: str
+    ) -> str | None:
+        """Get the reply cached for the most similar message of the scope"""
+        try:
+            lookup.embedding = self._normalize(await llm_provider.embed_text(message))
+            entries = await self.redis_client.lrange(lookup.semantic_key, 0, -1)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error(f"LLM semantic response cache lookup failed: {e}")
+            LLM_RESPONSE_CACHE_LOOKUPS.labels("semantic", "error").inc()
+            return None
+
+        now = time.time()
+        best_entry, best_similarity = None, self.semantic_threshold
+        for data in entries:
+            entry = json.loads(data)
+            if entry["expires_at"] <= now:
+                continue
+            embedding = array("f", base64.b64decode(entry["embedding"]))
+            if len(embedding) != len(lookup.embedding):
+                continue
+            # Both are unit length, so the dot product is the cosine similarity
+            similarity = sum(map(operator.mul, lookup.embedding, embedding))
+            if similarity >= best_similarity:
+                best_entry, best_similarity = entry, similarity
+
+        if best_entry is None:
+            LLM_RESPONSE_CACHE_LOOKUPS.labels("semantic", "miss").inc()
+            return None
+        return self._hit("semantic", best_entry)
+
+    def _is_semantic_cacheable(self, lookup: LLMResponseCacheLookup) -> bool:
+        """Check whether the reply may go to the semantic tier of its scope"""
+        if lookup.semantic_key is None or lookup.embedding is None:
+            return False
+        return self.semantic_scope == "user" or not lookup.has_context
+
+    def _hit(self, tier: str, entry: dict) -> str:
+        """Count a hit and the generation time it saved"""
+        LLM_RESPONSE_CACHE_LOOKUPS.labels(tier, "hit").inc()
+        LLM_RESPONSE_CACHE_SAVED_SECONDS.labels(tier).inc(entry["generation_time"])
+        return entry["reply"]
+
+    def _exact_key(self, llm_name: str, prompt: str) -> str:
+        """Redis key of the reply to a prompt, ignoring case and whitespace runs"""
+        normalized = " ".join(prompt.split()).casefold()
+        digest = hashlib.sha256(normalized.encode()).hexdigest()
+        return f"{REDIS_KEY_PREFIX}:{llm_name}:exact:{digest}"
+
+    def _semantic_key(self, llm_name: str, user_id: int) -> str:
+        """Redis list holding the recent replies of the scope"""
+        scope = f"user:{user_id}" if self.semantic_scope == "user" else "global"
+        return f"{REDIS_KEY_PREFIX}:{llm_name}:semantic:{scope}"
+
+    @staticmethod
+    def _normalize(values: list[float]) -> array:
+        """Scale an embedding to unit length"""
+        norm = math.sqrt(sum(value * value for value in values)) or 1.0
+        return array("f", (value / norm for value in values))
@@ -0,0 +1,39 @@
+"""Per-user conversation context cache for the chatbot service"""
+
+from shared import TTLCache
+
+
+class UserContextCache:
+    """Recent history of the users this replica serves, newest message first
+
+    The gateway pins each user to one chatbot replica, so the replica that
+    saves a user's turns is the one that reads their history next. Turns
+    are folded in locally as they complete instead of refetching the
+    history; the ttl bounds how stale an entry can get when the user is
+    rebalanced onto another replica or the history changes elsewhere.
+    """
+
+    def __init__(self, max_users: int, ttl: float, history_size: int):
+        """Initialize the cache"""
+        self.history_size = history_size
+        self._histories = TTLCache(max_size=max_users, ttl=ttl)
+
+    def get_history(self, user_id: int) -> list[dict] | None:
+        """Get the cached history of a user"""
+        history = self._histories.get(user_id)
+        return None if history is None else list(history)
+
+    def set_history(self, user_id: int, history: list[dict]) -> None:
+        """Cache the history fetched from the conversation service"""
+        self._histories.set(user_id, list(history[: self.history_size]))
+
+    def add_messages(self, user_id: int, messages: list[dict]) -> None:
+        """Fold saved messages, oldest first, into a cached history"""
+        history = self._histories.get(user_id)
+        if history is None:
+            return
+        # A history fetched while the message was being saved may hold it
+        cached_ids = {item.get("id") for item in history}
+        messages = [item for item in messages if item.get("id") not in cached_ids]
+        updated = [*reversed(messages), *history][: self.history_size]
+        self._histories.set(user_id, updated)
@@ -0,0 +1,24 @@
+"""Pooled HTTP clients for the chatbot service"""
+
+import httpx
+from shared.tracing.http_client import TracingTransport
+from config import AppConfig
+
+
+def build_http_client(
+    app_config: AppConfig, timeout: float, http2: bool
+) -> httpx.AsyncClient:
+    """Build a long-lived client keeping its connections alive between requests"""
+    return httpx.AsyncClient(
+        transport=TracingTransport(
+            httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=app_config.HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=app_config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=app_config.HTTP_KEEPALIVE_EXPIRY_IN_SECS,
+                ),
+                http2=http2,
+            )
+        ),
+        timeout=httpx.Timeout(timeout, connect=app_config.HTTP_CONNECT_TIMEOUT_IN_SECS),
+    )
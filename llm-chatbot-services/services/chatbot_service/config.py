@@ -13,6 +13,41 @@ class AppConfig(BaseAppConfig):
     CONVERSATION_SERVICE_URL: str | None = None
     GEMINI_API_KEY: str | None = None
     GEMINI_URL: str | None = None
+    GEMINI_STREAM_URL: str | None = None
+    GEMINI_MODEL_URL: str | None = None
+    GEMINI_EMBEDDING_URL: str | None = None
+    GEMINI_EMBEDDING_DIMENSIONS: int | None = None
+    REDIS_URL: str | None = None
+    LLM_RESPONSE_CACHE_ENABLED: bool = False
+    LLM_RESPONSE_CACHE_TTL_IN_SECS: float | None = None
+    LLM_SEMANTIC_CACHE_ENABLED: bool = False
+    LLM_SEMANTIC_CACHE_THRESHOLD: float | None = None
+    LLM_SEMANTIC_CACHE_SCOPE: str | None = None
+    LLM_SEMANTIC_CACHE_MAX_ENTRIES: int | None = None
+    USER_CONTEXT_CACHE_ENABLED: bool = True
+    USER_CONTEXT_CACHE_MAX_USERS: int | None = None
+    USER_CONTEXT_CACHE_TTL_IN_SECS: float | None = None
+    USER_CONTEXT_CACHE_HISTORY_SIZE: int | None = None
+    CONVERSATION_SERVICE_URLS: list[str] | None = None
+    CONVERSATION_HEDGING_ENABLED: bool = False
+    CONVERSATION_HEDGE_DELAY_PERCENTILE: float | None = None
+    CONVERSATION_HEDGE_MIN_DELAY_IN_SECS: float | None = None
+    CONVERSATION_HEDGE_MAX_DELAY_IN_SECS: float | None = None
+    CONVERSATION_HEDGE_BUDGET_RATIO: float | None = None
+    CONVERSATION_HEDGE_BUDGET_MIN_PER_SEC: float | None = None
+    CHAT_HISTORY_DEADLINE_IN_SECS: float | None = None
+    CHAT_SEMANTIC_SEARCH_DEADLINE_IN_SECS: float | None = None
+    HTTP_MAX_CONNECTIONS: int | None = None
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int | None = None
+    HTTP_KEEPALIVE_EXPIRY_IN_SECS: float | None = None
+    HTTP_CONNECT_TIMEOUT_IN_SECS: float | None = None
+    CONVERSATION_SERVICE_TIMEOUT_IN_SECS: float | None = None
+    CONVERSATION_SERVICE_HTTP2_ENABLED: bool = False
+    LLM_TIMEOUT_IN_SECS: float | None = None
+    LLM_HTTP2_ENABLED: bool = True
+    SERVER_TIMING_ENABLED: bool = False
+    HEALTH_CHECK_INTERVAL_IN_SECS: float | None = None
+    HEALTH_CHECK_TIMEOUT_IN_SECS: float | None = None
 
     def __init__(self):
         self.set_config()
@@ -23,9 +58,126 @@ class AppConfig(BaseAppConfig):
         self.CONVERSATION_SERVICE_URL = os.getenv("CONVERSATION_SERVICE_URL")
         self.GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
         self.GEMINI_URL = os.getenv("GEMINI_URL")
+        self.GEMINI_STREAM_URL = os.getenv("GEMINI_STREAM_URL") or (
+            self.GEMINI_URL.replace(":generateContent", ":streamGenerateContent")
+            if self.GEMINI_URL
+            else None
+        )
+        self.GEMINI_MODEL_URL = os.getenv("GEMINI_MODEL_URL") or (
+            self.GEMINI_URL.replace(":generateContent", "") if self.GEMINI_URL else None
+        )
+        self.GEMINI_EMBEDDING_URL = os.getenv(
+            "GEMINI_EMBEDDING_URL",
+            "https://generativelanguage.googleapis.com/v1beta/models/text-embedding-004:embedContent",
+        )
+        self.GEMINI_EMBEDDING_DIMENSIONS = self.get_int_env(
+            "GEMINI_EMBEDDING_DIMENSIONS", 256
+        )
+        self.REDIS_URL = os.getenv("REDIS_URL")
+        self.CHAT_HISTORY_DEADLINE_IN_SECS = self.get_float_env(
+            "CHAT_HISTORY_DEADLINE_IN_SECS", 2.0
+        )
+        self.CHAT_SEMANTIC_SEARCH_DEADLINE_IN_SECS = self.get_float_env(
+            "CHAT_SEMANTIC_SEARCH_DEADLINE_IN_SECS", 2.0
+        )
+        self.SERVER_TIMING_ENABLED = self.get_bool_env("SERVER_TIMING_ENABLED", False)
+        self.HEALTH_CHECK_INTERVAL_IN_SECS = self.get_float_env(
+            "HEALTH_CHECK_INTERVAL_IN_SECS", 30.0
+        )
+        self.HEALTH_CHECK_TIMEOUT_IN_SECS = self.get_float_env(
+            "HEALTH_CHECK_TIMEOUT_IN_SECS", 5.0
+        )
+        self.set_tracing_config()
+        self.__set_user_context_cache_config()
+        self.__set_conversation_hedging_config()
+        self.__set_http_client_config()
+        self.__set_llm_response_cache_config()
+
+    def __set_user_context_cache_config(self):
+        """Set the user context cache config"""
+        self.USER_CONTEXT_CACHE_ENABLED = self.get_bool_env(
+            "USER_CONTEXT_CACHE_ENABLED", True
+        )
+        self.USER_CONTEXT_CACHE_MAX_USERS = self.get_int_env(
+            "USER_CONTEXT_CACHE_MAX_USERS", 1000
+        )
+        self.USER_CONTEXT_CACHE_TTL_IN_SECS = self.get_float_env(
+            "USER_CONTEXT_CACHE_TTL_IN_SECS", 120.0
+        )
+        self.USER_CONTEXT_CACHE_HISTORY_SIZE = self.get_int_env(
+            "USER_CONTEXT_CACHE_HISTORY_SIZE", 20
+        )
+
+    def __set_conversation_hedging_config(self):
+        """Set the conversation service hedging config"""
+        self.CONVERSATION_SERVICE_URLS = self.get_list_env(
+            "CONVERSATION_SERVICE_URLS", [self.CONVERSATION_SERVICE_URL]
+        )
+        self.CONVERSATION_HEDGING_ENABLED = self.get_bool_env(
+            "CONVERSATION_HEDGING_ENABLED", False
+        )
+        self.CONVERSATION_HEDGE_DELAY_PERCENTILE = self.get_float_env(
+            "CONVERSATION_HEDGE_DELAY_PERCENTILE", 0.95
+        )
+        self.CONVERSATION_HEDGE_MIN_DELAY_IN_SECS = self.get_float_env(
+            "CONVERSATION_HEDGE_MIN_DELAY_IN_SECS", 0.05
+        )
+        self.CONVERSATION_HEDGE_MAX_DELAY_IN_SECS = self.get_float_env(
+            "CONVERSATION_HEDGE_MAX_DELAY_IN_SECS", 1.0
+        )
+        self.CONVERSATION_HEDGE_BUDGET_RATIO = self.get_float_env(
+            "CONVERSATION_HEDGE_BUDGET_RATIO", 0.05
+        )
+        self.CONVERSATION_HEDGE_BUDGET_MIN_PER_SEC = self.get_float_env(
+            "CONVERSATION_HEDGE_BUDGET_MIN_PER_SEC", 1.0
+        )
+
+    def __set_http_client_config(self):
+        """Set the pooled HTTP client config"""
+        self.HTTP_MAX_CONNECTIONS = self.get_int_env("HTTP_MAX_CONNECTIONS", 100)
+        self.HTTP_MAX_KEEPALIVE_CONNECTIONS = self.get_int_env(
+            "HTTP_MAX_KEEPALIVE_CONNECTIONS", 20
+        )
+        self.HTTP_KEEPALIVE_EXPIRY_IN_SECS = self.get_float_env(
+            "HTTP_KEEPALIVE_EXPIRY_IN_SECS", 30.0
+        )
+        self.HTTP_CONNECT_TIMEOUT_IN_SECS = self.get_float_env(
+            "HTTP_CONNECT_TIMEOUT_IN_SECS", 3.0
+        )
+        self.CONVERSATION_SERVICE_TIMEOUT_IN_SECS = self.get_float_env(
+            "CONVERSATION_SERVICE_TIMEOUT_IN_SECS", 5.0
+        )
+        self.CONVERSATION_SERVICE_HTTP2_ENABLED = self.get_bool_env(
+            "CONVERSATION_SERVICE_HTTP2_ENABLED", False
+        )
+        self.LLM_TIMEOUT_IN_SECS = self.get_float_env("LLM_TIMEOUT_IN_SECS", 30.0)
+        self.LLM_HTTP2_ENABLED = self.get_bool_env("LLM_HTTP2_ENABLED", True)
+
+    def __set_llm_response_cache_config(self):
+        """Set the LLM response cache config"""
+        self.LLM_RESPONSE_CACHE_ENABLED = self.get_bool_env(
+            "LLM_RESPONSE_CACHE_ENABLED", False
+        )
+        self.LLM_RESPONSE_CACHE_TTL_IN_SECS = self.get_float_env(
+            "LLM_RESPONSE_CACHE_TTL_IN_SECS", 3600.0
+        )
+        self.LLM_SEMANTIC_CACHE_ENABLED = self.get_bool_env(
+            "LLM_SEMANTIC_CACHE_ENABLED", False
+        )
+        self.LLM_SEMANTIC_CACHE_THRESHOLD = self.get_float_env(
+            "LLM_SEMANTIC_CACHE_THRESHOLD", 0.95
+        )
+        self.LLM_SEMANTIC_CACHE_SCOPE = os.getenv(
+            "LLM_SEMANTIC_CACHE_SCOPE", "user"
+        ).lower()
+        self.LLM_SEMANTIC_CACHE_MAX_ENTRIES = self.get_int_env(
+            "LLM_SEMANTIC_CACHE_MAX_ENTRIES", 100
+        )
 
     def validate_config(self):
         """Validate the configuration values"""
+        self.validate_tracing_config()
+
         if self.CONVERSATION_SERVICE_URL is None:
             raise ConfigError(
                 "CONVERSATION_SERVICE_URL is required but not set in environment variables/ docker-compose."
@@ -40,3 +192,79 @@ class AppConfig(BaseAppConfig):
             raise ConfigError(
                 "GEMINI_URL is required but not set in environment variables/ docker-compose."
             )
+
+        if self.USER_CONTEXT_CACHE_MAX_USERS <= 0:
+            raise ConfigError("USER_CONTEXT_CACHE_MAX_USERS must be greater than 0")
+
+        if self.USER_CONTEXT_CACHE_TTL_IN_SECS <= 0:
+            raise ConfigError("USER_CONTEXT_CACHE_TTL_IN_SECS must be greater than 0")
+
+        if self.USER_CONTEXT_CACHE_HISTORY_SIZE <= 0:
+            raise ConfigError("USER_CONTEXT_CACHE_HISTORY_SIZE must be greater than 0")
+
+        if (
+            self.CHAT_HISTORY_DEADLINE_IN_SECS <= 0
+            or self.CHAT_SEMANTIC_SEARCH_DEADLINE_IN_SECS <= 0
+        ):
+            raise ConfigError(
+                "CHAT_HISTORY_DEADLINE_IN_SECS and CHAT_SEMANTIC_SEARCH_DEADLINE_IN_SECS must be positive"
+            )
+
+        if (
+            self.HEALTH_CHECK_INTERVAL_IN_SECS <= 0
+            or self.HEALTH_CHECK_TIMEOUT_IN_SECS <= 0
+        ):
+            raise ConfigError(
+                "HEALTH_CHECK_INTERVAL_IN_SECS and HEALTH_CHECK_TIMEOUT_IN_SECS must be positive"
+            )
+
+        if self.HTTP_MAX_CONNECTIONS <= 0:
+            raise ConfigError("HTTP_MAX_CONNECTIONS must be greater than 0")
+
+        if not 0 <= self.HTTP_MAX_KEEPALIVE_CONNECTIONS <= self.HTTP_MAX_CONNECTIONS:
+            raise ConfigError(
+                "HTTP_MAX_KEEPALIVE_CONNECTIONS must be between 0 and HTTP_MAX_CONNECTIONS"
+            )
+
+        if (
+            self.HTTP_CONNECT_TIMEOUT_IN_SECS <= 0
+            or self.CONVERSATION_SERVICE_TIMEOUT_IN_SECS <= 0
+            or self.LLM_TIMEOUT_IN_SECS <= 0
+        ):
+            raise ConfigError(
+                "HTTP_CONNECT_TIMEOUT_IN_SECS, CONVERSATION_SERVICE_TIMEOUT_IN_SECS and LLM_TIMEOUT_IN_SECS must be positive"
+            )
+
+        if self.LLM_RESPONSE_CACHE_ENABLED and self.REDIS_URL is None:
+            raise ConfigError(
+                "REDIS_URL is required when LLM_RESPONSE_CACHE_ENABLED is set"
+            )
+
+        if self.LLM_RESPONSE_CACHE_TTL_IN_SECS <= 0:
+            raise ConfigError("LLM_RESPONSE_CACHE_TTL_IN_SECS must be positive")
+
+        if not 0 < self.LLM_SEMANTIC_CACHE_THRESHOLD <= 1:
+            raise ConfigError("LLM_SEMANTIC_CACHE_THRESHOLD must be in (0, 1]")
+
+        if self.LLM_SEMANTIC_CACHE_SCOPE not in ("user", "global"):
+            raise ConfigError("LLM_SEMANTIC_CACHE_SCOPE must be one of user, global")
+
+        if (
+            self.LLM_SEMANTIC_CACHE_MAX_ENTRIES <= 0
+            or self.GEMINI_EMBEDDING_DIMENSIONS <= 0
+        ):
+            raise ConfigError(
+                "LLM_SEMANTIC_CACHE_MAX_ENTRIES and GEMINI_EMBEDDING_DIMENSIONS must be greater than 0"
+            )
+
+        if not 0 < self.CONVERSATION_HEDGE_DELAY_PERCENTILE < 1:
+            raise ConfigError("CONVERSATION_HEDGE_DELAY_PERCENTILE must be in (0, 1)")
+
+        if (
+            not 0
+            < self.CONVERSATION_HEDGE_MIN_DELAY_IN_SECS
+            <= self.CONVERSATION_HEDGE_MAX_DELAY_IN_SECS
+        ):
+            raise ConfigError(
+                "CONVERSATION_HEDGE_MIN_DELAY_IN_SECS must be positive and not greater than CONVERSATION_HEDGE_MAX_DELAY_IN_SECS"
+            )
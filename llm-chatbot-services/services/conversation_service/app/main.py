@@ -2,8 +2,16 @@
 
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from shared import Database
+from shared import (
+    set_tracer,
+    Database,
+    InstrumentationMiddleware,
+    Tracer,
+    TracingMiddleware,
+    metrics_router,
+)
 from shared.logger import get_logger
+from app.dependencies.dependency_factory import get_app_config
 from app.routes import (
     conversation_router,
     health_router,
@@ -14,23 +22,34 @@ logger = get_logger(service_name="conversation-service")
 logger.info("Starting Conversation Service")
 
 db_object = Database()
+tracer = Tracer.from_config("conversation_service", get_app_config())
+set_tracer(tracer)
 
 
 @asynccontextmanager
 async def lifespan(_fastapi_app: FastAPI):
     """Lifespan for the application"""
+    await tracer.start()
     logger.info("Initializing database")
     await db_object.init_db()
     yield
     logger.info("Shutting down database")
     await db_object.shutdown_db()
+    await tracer.stop()
 
 
 app = FastAPI(lifespan=lifespan)
+app.add_middleware(
+    InstrumentationMiddleware,
+    service_name="conversation_service",
+    server_timing=get_app_config().SERVER_TIMING_ENABLED,
+)
+app.add_middleware(TracingMiddleware)
 
 app.include_router(conversation_router)
 app.include_router(health_router)
 app.include_router(semantic_search_router)
+app.include_router(metrics_router)
 
 
 @app.get("/")
@@ -14,13 +14,16 @@ class ConversationRepository:
         """Initialize the repository"""
         self.__db = db
 
-    async def create_conversation(self, data: ConversationCreate) -> Conversation:
-        """Create a new conversation"""
-        convo = Conversation(**data.model_dump())
-        self.__db.add(convo)
+    async def create_conversations(
+        self, data: list[ConversationCreate]
+    ) -> list[Conversation]:
+        """Create new conversations in one transaction"""
+        convos = [Conversation(**item.model_dump()) for item in data]
+        self.__db.add_all(convos)
+        # Sessions do not expire on commit, so the ids assigned when the
+        # rows were flushed stay loaded without a refresh per row
         await self.__db.commit()
-        await self.__db.refresh(convo)
-        return convo
+        return convos
 
     async def get_conversations_by_user(
         self, user_id: int, limit: int
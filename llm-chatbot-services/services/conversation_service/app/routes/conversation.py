@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter, Depends, status, Query
 from shared import get_logger
-from app.schemas import ConversationCreate, ConversationRead
+from app.schemas import ConversationBatchCreate, ConversationCreate, ConversationRead
 from app.services.conversation_service import ConversationService
 from app.dependencies.dependency_factory import get_conversation_service
 
@@ -23,6 +23,20 @@ async def create_conversation(
     return await service.create_conversation(conversation)
 
 
+@router.post(
+    "/messages/batch",
+    status_code=status.HTTP_201_CREATED,
+    response_model=list[ConversationRead],
+)
+async def create_conversations(
+    batch: ConversationBatchCreate,
+    service: ConversationService = Depends(get_conversation_service),
+):
+    """Create several conversations in one write"""
+    logger.info("Creating conversations batch endpoint called")
+    return await service.create_conversations(batch.messages)
+
+
 @router.get("/history", response_model=list[ConversationRead])
 async def get_conversations(
     user_id: int = Query(...),
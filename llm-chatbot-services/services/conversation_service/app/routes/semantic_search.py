@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Query, Depends
-from shared import get_logger
+from shared import get_logger, time_stage
 from app.dependencies.dependency_factory import get_vector_db_service
 from app.services.vector_db_service import VectorDBService
 
@@ -16,4 +16,6 @@ async def search_messages(
 ):
     """Return semantically similar messages"""
     logger.info(f"Searching for similar messages for user {user_id} with query {query}")
-    return {"matches": vector_db.search_similar(user_id=user_id, query=query)}
+    with time_stage("vector_search"):
+        matches = vector_db.search_similar(user_id=user_id, query=query)
+    return {"matches": matches}
@@ -1,5 +1,5 @@
 """Conversation Service Schemas"""
 
-from .conversation import ConversationCreate, ConversationRead
+from .conversation import ConversationBatchCreate, ConversationCreate, ConversationRead
 
-__all__ = ["ConversationCreate", "ConversationRead"]
+__all__ = ["ConversationBatchCreate", "ConversationCreate", "ConversationRead"]
@@ -1,7 +1,7 @@
 """Conversation Service Schemas"""
 
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class ConversationCreate(BaseModel):
@@ -11,6 +11,12 @@ class ConversationCreate(BaseModel):
     message: str
 
 
+class ConversationBatchCreate(BaseModel):
+    """Create several conversations at once, such as the two sides of a turn"""
+
+    messages: list[ConversationCreate] = Field(min_length=1, max_length=100)
+
+
 class ConversationRead(BaseModel):
     """Read a conversation"""
 
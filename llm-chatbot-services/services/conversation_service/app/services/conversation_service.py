@@ -1,7 +1,7 @@
 """Conversation Service"""
 
 import json
-from shared import get_logger, RedisClient
+from shared import get_logger, time_stage, RedisClient
 from app.repositories.conversation_repository import ConversationRepository
 from app.schemas.conversation import ConversationCreate, ConversationRead
 from app.models.conversation import Conversation
@@ -28,22 +28,32 @@ class ConversationService:
     ) -> ConversationRead:
         """Create a new conversation"""
         self.__logger.info(f"Creating new conversation for user {conversation.user_id}")
-        saved_message = await self.conversation_repo.create_conversation(conversation)
-        pydantic_obj = ConversationRead.model_validate(saved_message)
-        await self.__add_entry_to_cache(conversation.user_id, pydantic_obj)
-
-        self.__logger.info(
-            f"Adding document to vector database for user {saved_message.user_id} and message {saved_message.id}"
-        )
-        self.vector_db_service.add_document(
-            user_id=saved_message.user_id,
-            message_id=saved_message.id,
-            message=saved_message.message,
-        )
-        self.__logger.info(
-            f"Document added to vector database for user {saved_message.user_id} and message {saved_message.id}"
-        )
-        return pydantic_obj
+        return (await self.create_conversations([conversation]))[0]
+
+    async def create_conversations(
+        self, conversations: list[ConversationCreate]
+    ) -> list[ConversationRead]:
+        """Create conversations in one transaction, cache write and index call"""
+        self.__logger.info(f"Creating {len(conversations)} new conversations")
+        with time_stage("db"):
+            saved_messages = await self.conversation_repo.create_conversations(
+                conversations
+            )
+        pydantic_objs = [
+            ConversationRead.model_validate(saved_message)
+            for saved_message in saved_messages
+        ]
+        with time_stage("cache"):
+            await self.__add_entries_to_cache(pydantic_objs)
+
+        with time_stage("vector_index"):
+            self.vector_db_service.add_documents(
+                [
+                    (saved_message.user_id, saved_message.id, saved_message.message)
+                    for saved_message in saved_messages
+                ]
+            )
+        return pydantic_objs
 
     async def get_user_conversations(self, user_id: int, limit: int = 20):
         """Get conversations by user"""
@@ -51,7 +61,8 @@ class ConversationService:
         redis_key = self.__get_cache_key(user_id)
         limit = min(limit, self.redis_cache_size)
 
-        cached = await self.redis_client.lrange(redis_key, 0, limit - 1)
+        with time_stage("cache"):
+            cached = await self.redis_client.lrange(redis_key, 0, limit - 1)
 
         if cached:
             self.__logger.info(f"Returning cached conversations for user {user_id}")
@@ -60,12 +71,14 @@ class ConversationService:
         self.__logger.info(
             f"No cached conversations found for user {user_id}, fetching from database"
         )
-        conversations = await self.conversation_repo.get_conversations_by_user(
-            user_id, limit=limit
-        )
+        with time_stage("db"):
+            conversations = await self.conversation_repo.get_conversations_by_user(
+                user_id, limit=limit
+            )
 
         self.__logger.info(f"Creating new cache for user {user_id}")
-        await self.__create_new_cache(user_id, conversations)
+        with time_stage("cache"):
+            await self.__create_new_cache(user_id, conversations)
         return conversations
 
     async def delete_user_conversations(self, user_id: int):
@@ -76,15 +89,24 @@ class ConversationService:
         self.__logger.info(f"Deleting conversations from database for user {user_id}")
         await self.conversation_repo.delete_conversations_by_user(user_id)
 
-    async def __add_entry_to_cache(self, user_id: int, pydantic_obj: ConversationRead):
-        """Add expiry to the cache entry"""
-        self.__logger.info(f"Adding entry to cache for user {user_id}")
-        redis_key = self.__get_cache_key(user_id)
-        await self.redis_client.lpush(redis_key, pydantic_obj.model_dump_json())
-        await self.redis_client.ltrim(redis_key, 0, self.redis_cache_size - 1)
-        await self.redis_client.expire(
-            redis_key, self.redis_entry_expiry_time_in_mins * 60
-        )
+    async def __add_entries_to_cache(self, pydantic_objs: list[ConversationRead]):
+        """Push the entries, oldest first, with one round trip to Redis"""
+        entries_by_user: dict[int, list[str]] = {}
+        for pydantic_obj in pydantic_objs:
+            entries_by_user.setdefault(pydantic_obj.user_id, []).append(
+                pydantic_obj.model_dump_json()
+            )
+
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for user_id, entries in entries_by_user.items():
+                self.__logger.info(
+                    f"Adding {len(entries)} entries to cache for user {user_id}"
+                )
+                redis_key = self.__get_cache_key(user_id)
+                pipe.lpush(redis_key, *entries)
+                pipe.ltrim(redis_key, 0, self.redis_cache_size - 1)
+                pipe.expire(redis_key, self.redis_entry_expiry_time_in_mins * 60)
+            await pipe.execute()
 
     async def __create_new_cache(self, user_id: int, conversations: list[Conversation]):
         """Prime the cache with the new conversations"""
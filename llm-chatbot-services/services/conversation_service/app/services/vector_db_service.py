@@ -18,19 +18,21 @@ class VectorDBService:
 
     def add_document(self, user_id: int, message_id: int, message: str):
         """Add a document to the vector database."""
-        self._logger.info(
-            f"Adding document to vector database for user {user_id} and message {message_id}"
-        )
-        vector = mock_embedding(message)
+        self.add_documents([(user_id, message_id, message)])
+
+    def add_documents(self, documents: list[tuple[int, int, str]]):
+        """Add (user_id, message_id, message) documents in one call."""
+        self._logger.info(f"Adding {len(documents)} documents to vector database")
         self.collection.add(
-            ids=[f"{user_id}-{message_id}"],
-            documents=[message],
-            metadatas=[{"user_id": user_id, "message_id": message_id}],
-            embeddings=[vector],
-        )
-        self._logger.info(
-            f"Document added to vector database for user {user_id} and message {message_id}"
+            ids=[f"{user_id}-{message_id}" for user_id, message_id, _ in documents],
+            documents=[message for _, _, message in documents],
+            metadatas=[
+                {"user_id": user_id, "message_id": message_id}
+                for user_id, message_id, _ in documents
+            ],
+            embeddings=[mock_embedding(message) for _, _, message in documents],
         )
+        self._logger.info(f"Added {len(documents)} documents to vector database")
 
     def search_similar(self, user_id: int, query: str, top_k: int = 5) -> list[str]:
         """Search for similar documents in the vector database."""
@@ -14,6 +14,7 @@ class AppConfig(BaseAppConfig):
     REDIS_CACHE_SIZE: int | None = None
     REDIS_ENTRY_EXPIRY_TIME_IN_MINS: int | None = None
     CHROMA_DB_URL: str | None = None
+    SERVER_TIMING_ENABLED: bool = False
 
     def __init__(self):
         self.set_config()
@@ -27,9 +28,13 @@ class AppConfig(BaseAppConfig):
             self.__get_redis_entry_expiry_time_in_mins()
         )
         self.CHROMA_DB_URL = os.getenv("CHROMA_DB_URL")
+        self.SERVER_TIMING_ENABLED = self.get_bool_env("SERVER_TIMING_ENABLED", False)
+        self.set_tracing_config()
 
     def validate_config(self):
         """Validate the configuration values"""
+        self.validate_tracing_config()
+
         if self.REDIS_URL is None:
             raise ConfigError(
                 "REDIS_URL is required but not set in environment variables/ docker-compose."
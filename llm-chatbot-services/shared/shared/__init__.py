@@ -6,6 +6,23 @@ from .database import Database
 from .redis import RedisClient
 from .config_error import ConfigError
 from .base_config import BaseAppConfig
+from .ttl_cache import TTLCache
+from .health_prober import HealthCheckError, HealthProber, HealthResult
+from .retry_budget import RetryBudget
+from .hedger import Hedger
+from .instrumentation import (
+    InstrumentationMiddleware,
+    metrics_router,
+    record_stage,
+    time_stage,
+)
+from .tracing import (
+    Tracer,
+    TracingMiddleware,
+    get_current_span,
+    get_tracer,
+    set_tracer,
+)
 
 
 __all__ = [
@@ -15,4 +32,19 @@ __all__ = [
     "RedisClient",
     "ConfigError",
     "BaseAppConfig",
+    "TTLCache",
+    "HealthCheckError",
+    "HealthProber",
+    "HealthResult",
+    "RetryBudget",
+    "Hedger",
+    "InstrumentationMiddleware",
+    "metrics_router",
+    "record_stage",
+    "time_stage",
+    "Tracer",
+    "TracingMiddleware",
+    "get_current_span",
+    "get_tracer",
+    "set_tracer",
 ]
@@ -1,11 +1,18 @@
 """Configuration module for the all services"""
 
+import os
 from abc import ABC, abstractmethod
+from .config_error import ConfigError
 
 
 class BaseAppConfig(ABC):
     """Configuration class for the all services"""
 
+    TRACING_EXPORTER: str | None = None
+    TRACING_FILE_PATH: str | None = None
+    TRACING_OTLP_ENDPOINT: str | None = None
+    TRACING_SAMPLE_RATIO: float | None = None
+
     @abstractmethod
     def set_config(self):
         """Set the configuration values"""
@@ -15,3 +22,48 @@ class BaseAppConfig(ABC):
     def validate_config(self):
         """Validate the configuration values"""
         pass
+
+    def set_tracing_config(self):
+        """Set the tracing config shared by every service"""
+        self.TRACING_EXPORTER = os.getenv("TRACING_EXPORTER", "none").lower()
+        self.TRACING_FILE_PATH = os.getenv("TRACING_FILE_PATH", "spans.jsonl")
+        self.TRACING_OTLP_ENDPOINT = os.getenv(
+            "TRACING_OTLP_ENDPOINT", "http://localhost:4318/v1/traces"
+        )
+        self.TRACING_SAMPLE_RATIO = self.get_float_env("TRACING_SAMPLE_RATIO", 1.0)
+
+    def validate_tracing_config(self):
+        """Validate the tracing config shared by every service"""
+        if self.TRACING_EXPORTER not in ("none", "file", "otlp"):
+            raise ConfigError("TRACING_EXPORTER must be one of none, file, otlp")
+
+        if not 0 <= self.TRACING_SAMPLE_RATIO <= 1:
+            raise ConfigError("TRACING_SAMPLE_RATIO must be in [0, 1]")
+
+    @staticmethod
+    def get_int_env(name: str, default: int | None = None) -> int | None:
+        """Get an integer environment variable"""
+        value = os.getenv(name)
+        return int(value) if value else default
+
+    @staticmethod
+    def get_float_env(name: str, default: float | None = None) -> float | None:
+        """Get a float environment variable"""
+        value = os.getenv(name)
+        return float(value) if value else default
+
+    @staticmethod
+    def get_bool_env(name: str, default: bool = False) -> bool:
+        """Get a boolean environment variable"""
+        value = os.getenv(name)
+        if not value:
+            return default
+        return value.strip().lower() in ("1", "true", "yes", "on")
+
+    @staticmethod
+    def get_list_env(name: str, default: list[str] | None = None) -> list[str] | None:
+        """Get a comma separated environment variable as a list"""
+        value = os.getenv(name)
+        if not value:
+            return default
+        return [item.strip() for item in value.split(",") if item.strip()]
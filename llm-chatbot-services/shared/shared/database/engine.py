@@ -3,6 +3,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from shared.database.config import DatabaseConfig
+from shared.tracing import instrument_engine
 
 
 class DatabaseEngine:
@@ -16,3 +17,4 @@ class DatabaseEngine:
             class_=AsyncSession,
             expire_on_commit=False,
         )
+        instrument_engine(self.engine)
@@ -0,0 +1,147 @@
+"""Concurrent, cached dependency health checks for the all services."""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+from .logger import get_logger
+
+logger = get_logger(service_name="health_prober")
+
+
+class HealthCheckError(Exception):
+    """Raised by a health check whose dependency answered but is unhealthy"""
+
+    def __init__(self, detail: dict):
+        super().__init__(str(detail))
+        self.detail = detail
+
+
+@dataclass(frozen=True)
+class HealthResult:
+    """Outcome of one health check"""
+
+    healthy: bool
+    detail: dict
+    latency: float
+    checked_at: float
+
+
+class HealthProber:
+    """Runs health checks concurrently, each under a timeout, and caches them
+
+    Every check is a coroutine returning the dependency's health detail and
+    raising when it is unhealthy. Once started, the prober refreshes the
+    results in the background every interval, so a health endpoint only
+    reads them. Without the background loop, results older than the
+    interval are probed again on demand, with concurrent callers sharing
+    one probe.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        checks: dict[str, Callable[[], Awaitable[dict]]],
+        interval: float,
+        timeout: float,
+    ):
+        """Initialize the health prober"""
+        self.name = name
+        self.checks = checks
+        self.interval = interval
+        self.timeout = timeout
+        self._results: dict[str, HealthResult] = {}
+        self._probed_at = float("-inf")
+        self._in_flight: asyncio.Task | None = None
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Start probing in the background"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop probing in the background"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def get_results(self) -> dict[str, HealthResult]:
+        """Get the latest results, probing first when they are stale"""
+        # Allow for the background probe still running when the results turn stale
+        if time.monotonic() - self._probed_at >= self.interval + self.timeout:
+            await self.probe()
+        return self._results
+
+    async def probe(self) -> dict[str, HealthResult]:
+        """Run every check now, joining a probe already in flight"""
+        if self._in_flight is None:
+            self._in_flight = asyncio.create_task(self._probe_all())
+            self._in_flight.add_done_callback(self._forget_probe)
+        # A cancelled caller must not cancel the probe other callers share
+        return await asyncio.shield(self._in_flight)
+
+    async def _run(self) -> None:
+        """Probe every interval until stopped"""
+        while True:
+            try:
+                await self.probe()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error(f"{self.name} health probe failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def _probe_all(self) -> dict[str, HealthResult]:
+        """Run the checks concurrently and store their results"""
+        names = list(self.checks)
+        results = await asyncio.gather(
+            *(self._run_check(name, self.checks[name]) for name in names)
+        )
+        self._results = dict(zip(names, results))
+        self._probed_at = time.monotonic()
+        return self._results
+
+    async def _run_check(
+        self, name: str, check: Callable[[], Awaitable[dict]]
+    ) -> HealthResult:
+        """Run one check under the timeout"""
+        started_at = time.monotonic()
+        try:
+            detail = await asyncio.wait_for(check(), self.timeout)
+            healthy = True
+        except asyncio.TimeoutError:
+            detail = {
+                "status": "error",
+                "detail": f"Health check timed out after {self.timeout}s",
+            }
+            healthy = False
+        except HealthCheckError as e:
+            detail = e.detail
+            healthy = False
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            detail = {"status": "error", "detail": str(e)}
+            healthy = False
+
+        if not healthy:
+            logger.error(f"{self.name} health check {name} failed: {detail}")
+        finished_at = time.monotonic()
+        return HealthResult(
+            healthy=healthy,
+            detail=detail,
+            latency=finished_at - started_at,
+            checked_at=finished_at,
+        )
+
+    def _forget_probe(self, done: asyncio.Task) -> None:
+        """Drop the finished probe so the next caller starts a fresh one"""
+        if self._in_flight is done:
+            self._in_flight = None
+        if not done.cancelled():
+            # Mark the exception as retrieved even if every caller went away
+            done.exception()
@@ -0,0 +1,136 @@
+"""Request hedging for the all services."""
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Awaitable, Callable, TypeVar
+from .logger import get_logger
+from .retry_budget import RetryBudget
+
+logger = get_logger(service_name="hedger")
+
+T = TypeVar("T")
+
+
+class Hedger:
+    """Sends a second attempt when the first is slower than usual
+
+    The hedge goes out once the first attempt has run for the given
+    percentile of recent latencies, clamped to [min_delay, max_delay], and
+    max_delay until minimum_samples latencies were seen. The first attempt
+    to succeed wins and the other is cancelled. Hedges are paid from a
+    budget, normally shared by every hedger of the process, so they cannot
+    add more than a fraction of extra load to a struggling dependency.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        budget: RetryBudget,
+        percentile: float = 0.95,
+        min_delay: float = 0.05,
+        max_delay: float = 1.0,
+        window_size: int = 200,
+        minimum_samples: int = 20,
+    ):
+        """Initialize the hedger"""
+        self.name = name
+        self.budget = budget
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.minimum_samples = minimum_samples
+        self._latencies: deque[float] = deque(maxlen=window_size)
+        self._losers: set[asyncio.Task] = set()
+        self.requests = 0
+        self.hedges = 0
+        self.hedges_won = 0
+        self.hedges_denied = 0
+
+    def delay(self) -> float:
+        """Time to wait on the first attempt before hedging"""
+        if len(self._latencies) < self.minimum_samples:
+            return self.max_delay
+        latencies = sorted(self._latencies)
+        index = math.ceil(self.percentile * len(latencies)) - 1
+        return min(self.max_delay, max(self.min_delay, latencies[index]))
+
+    async def run(
+        self,
+        attempt: Callable[[int], Awaitable[T]],
+        discard: Callable[[T], Awaitable[None]] | None = None,
+    ) -> T:
+        """Run attempt(0), racing it against attempt(1) once it runs late
+
+        discard is awaited with the result of an attempt that succeeded but
+        lost the race, so it can release what the result holds.
+        """
+        self.requests += 1
+        self.budget.deposit()
+        started_at = time.monotonic()
+        tasks = [asyncio.ensure_future(attempt(0))]
+        winner = None
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.delay())
+            if not done:
+                if self.budget.try_withdraw():
+                    self.hedges += 1
+                    tasks.append(asyncio.ensure_future(attempt(1)))
+                else:
+                    self.hedges_denied += 1
+
+            pending = set(tasks)
+            while winner is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is None and not pending:
+                    # Every attempt failed, surface the first attempt's error
+                    return tasks[0].result()
+        finally:
+            for task in tasks:
+                if task is not winner:
+                    self._cancel_loser(task, discard)
+
+        if winner is not tasks[0]:
+            self.hedges_won += 1
+        self._latencies.append(time.monotonic() - started_at)
+        return winner.result()
+
+    def snapshot(self) -> dict:
+        """Describe the hedger for admin endpoints"""
+        return {
+            "delay": round(self.delay(), 4),
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedges_won": self.hedges_won,
+            "hedges_denied": self.hedges_denied,
+        }
+
+    def _cancel_loser(
+        self, task: asyncio.Task, discard: Callable[[T], Awaitable[None]] | None
+    ) -> None:
+        """Cancel an attempt that lost and release its result once it settles"""
+        task.cancel()
+        self._losers.add(task)
+
+        def settle(done: asyncio.Task):
+            self._losers.discard(done)
+            if done.cancelled() or done.exception() is not None:
+                return
+            if discard is not None:
+                cleanup = asyncio.ensure_future(discard(done.result()))
+                self._losers.add(cleanup)
+                cleanup.add_done_callback(self._forget_cleanup)
+
+        task.add_done_callback(settle)
+
+    def _forget_cleanup(self, cleanup: asyncio.Task) -> None:
+        """Drop a finished cleanup, logging its failure"""
+        self._losers.discard(cleanup)
+        if not cleanup.cancelled() and cleanup.exception() is not None:
+            logger.error(
+                f"{self.name} failed to discard a hedge: {cleanup.exception()}"
+            )
@@ -0,0 +1,137 @@
+"""Request latency instrumentation for the all services."""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, Histogram, generate_latest
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from .tracing.tracer import get_tracer
+
+# Chat turns wait seconds on the LLM, so the buckets go past the defaults
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    20.0,
+    30.0,
+    60.0,
+)
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time from receiving a request to starting its response",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+STAGE_DURATION = Histogram(
+    "request_stage_duration_seconds",
+    "Time spent in each stage of a request",
+    ["stage"],
+    buckets=LATENCY_BUCKETS,
+)
+
+_stage_timings: ContextVar[dict[str, float] | None] = ContextVar(
+    "stage_timings", default=None
+)
+
+metrics_router = APIRouter(tags=["Metrics"])
+
+
+@metrics_router.get("/metrics")
+async def metrics() -> Response:
+    """Expose the service metrics in the Prometheus text format"""
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+def record_stage(stage: str, duration: float) -> None:
+    """Record the duration of a stage of the current request"""
+    STAGE_DURATION.labels(stage).observe(duration)
+    timings = _stage_timings.get()
+    if timings is not None:
+        timings[stage] = timings.get(stage, 0.0) + duration
+
+
+@contextmanager
+def time_stage(stage: str) -> Iterator[None]:
+    """Time the wrapped block as a stage of the current request, in a span"""
+    started_at = time.perf_counter()
+    try:
+        with get_tracer().span(stage):
+            yield
+    finally:
+        record_stage(stage, time.perf_counter() - started_at)
+
+
+class InstrumentationMiddleware:
+    """Times requests and collects the stages recorded while serving them
+
+    Stages recorded more than once in a request, such as two saves, are
+    summed. With server_timing, the stages and the total time to the
+    response start are sent back in a Server-Timing header, next to any
+    the upstream already sent, so the client sees the breakdown of every
+    hop.
+    """
+
+    def __init__(self, app: ASGIApp, service_name: str, server_timing: bool = False):
+        """Initialize the instrumentation middleware"""
+        self.app = app
+        self.service_name = service_name
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Time the request and its stages"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        timings: dict[str, float] = {}
+        token = _stage_timings.set(timings)
+        observed = False
+
+        def observe(status: int) -> float:
+            nonlocal observed
+            observed = True
+            duration = time.perf_counter() - started_at
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            REQUEST_DURATION.labels(scope["method"], route, status).observe(duration)
+            return duration
+
+        async def send_with_timings(message: Message):
+            if message["type"] == "http.response.start" and not observed:
+                duration = observe(message["status"])
+                if self.server_timing:
+                    header = self._format_server_timing(timings, duration)
+                    message = {
+                        **message,
+                        "headers": [
+                            *message.get("headers", []),
+                            (b"server-timing", header.encode("latin-1")),
+                        ],
+                    }
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timings)
+        finally:
+            if not observed:
+                observe(500)
+            _stage_timings.reset(token)
+
+    def _format_server_timing(self, timings: dict[str, float], total: float) -> str:
+        """Format the stages and the total as a Server-Timing header"""
+        entries = [
+            f"{stage};dur={duration * 1000:.1f}" for stage, duration in timings.items()
+        ]
+        entries.append(f'{self.service_name};desc="total";dur={total * 1000:.1f}')
+        return ", ".join(entries)
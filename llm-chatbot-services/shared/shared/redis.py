@@ -2,6 +2,7 @@
 
 import redis.asyncio as redis
 from .base_config import BaseAppConfig
+from .tracing import TracedRedis
 import threading
 
 
@@ -24,7 +25,7 @@ class RedisClient:
 
     def get_redis_client(self) -> redis.Redis:
         if not self.redis_client:
-            self.redis_client = redis.Redis.from_url(
+            self.redis_client = TracedRedis.from_url(
                 self.app_config.REDIS_URL, decode_responses=True
             )
         return self.redis_client
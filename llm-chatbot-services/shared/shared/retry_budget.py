@@ -0,0 +1,52 @@
+"""Retry budget for the all services."""
+
+import math
+import time
+from collections import deque
+
+
+class RetryBudget:
+    """Caps retries at a ratio of recent requests
+
+    Requests and retries are counted in one-second buckets over the last ttl
+    seconds. A retry is allowed while the retries in that span stay below
+    ratio times the requests plus min_retries_per_sec for every second of
+    ttl, so a quiet upstream can still be retried while a struggling one
+    never sees more than a fraction of extra load.
+    """
+
+    def __init__(
+        self, ratio: float = 0.2, min_retries_per_sec: float = 5.0, ttl: float = 10.0
+    ):
+        """Initialize the retry budget"""
+        self.ratio = ratio
+        self.min_retries = min_retries_per_sec * ttl
+        self.ttl = ttl
+        self._buckets: deque[list[int]] = deque()
+        self._requests = 0
+        self._retries = 0
+
+    def deposit(self):
+        """Record a first attempt"""
+        self._current_bucket()[1] += 1
+        self._requests += 1
+
+    def try_withdraw(self) -> bool:
+        """Spend a retry if the budget allows it"""
+        bucket = self._current_bucket()
+        if self._retries >= self.ratio * self._requests + self.min_retries:
+            return False
+        bucket[2] += 1
+        self._retries += 1
+        return True
+
+    def _current_bucket(self) -> list[int]:
+        """Get the bucket of the current second, dropping expired ones"""
+        second = math.floor(time.monotonic())
+        while self._buckets and self._buckets[0][0] <= second - self.ttl:
+            _, requests, retries = self._buckets.popleft()
+            self._requests -= requests
+            self._retries -= retries
+        if not self._buckets or self._buckets[-1][0] != second:
+            self._buckets.append([second, 0, 0])
+        return self._buckets[-1]
@@ -0,0 +1,23 @@
+"""Token revocation events shared between the auth service and the api gateway."""
+
+import json
+
+TOKEN_REVOCATION_CHANNEL = "auth:token-revocations"
+
+
+def build_token_revocation_message(
+    subject: str, revoked_at: float | None = None
+) -> str:
+    """Build the pub/sub payload evicting the cached validations of subject
+
+    With revoked_at, every token issued to subject up to that time, in
+    seconds with millisecond precision, is rejected as well.
+    """
+    return json.dumps({"sub": subject, "revoked_at": revoked_at})
+
+
+def parse_token_revocation_message(data: str | bytes) -> tuple[str, float | None]:
+    """Parse a pub/sub payload into (subject, revoked_at)"""
+    message = json.loads(data)
+    revoked_at = message.get("revoked_at")
+    return message["sub"], None if revoked_at is None else float(revoked_at)
@@ -0,0 +1,26 @@
+"""W3C trace context propagation and spans for the all services.
+
+TracingTransport lives in shared.tracing.http_client so services without
+httpx can still import the rest.
+"""
+
+from .span import Span, SpanContext
+from .exporters import FileSpanExporter, OTLPHttpSpanExporter, SpanExporter
+from .tracer import Tracer, get_current_span, get_tracer, set_tracer
+from .middleware import TracingMiddleware
+from .clients import TracedRedis, instrument_engine
+
+__all__ = [
+    "Span",
+    "SpanContext",
+    "SpanExporter",
+    "FileSpanExporter",
+    "OTLPHttpSpanExporter",
+    "Tracer",
+    "get_current_span",
+    "get_tracer",
+    "set_tracer",
+    "TracingMiddleware",
+    "TracedRedis",
+    "instrument_engine",
+]
@@ -0,0 +1,53 @@
+"""Database and Redis spans for the all services."""
+
+import redis.asyncio as redis
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from .tracer import get_tracer
+
+
+class TracedRedis(redis.Redis):
+    """Redis client recording a client span around every command"""
+
+    async def execute_command(self, *args, **options):
+        """Execute a command in a span named after it"""
+        command = str(args[0]).upper() if args else "UNKNOWN"
+        with get_tracer().span(
+            f"redis {command}",
+            "client",
+            {"db.system": "redis", "db.operation": command},
+        ):
+            return await super().execute_command(*args, **options)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Record a client span around every statement the engine executes"""
+    sync_engine = engine.sync_engine
+    db_system = sync_engine.dialect.name
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _start_span(_conn, _cursor, statement, _params, context, _executemany):
+        operation = statement.lstrip().split(" ", 1)[0].upper()
+        context.trace_span = get_tracer().start_span(
+            f"{db_system} {operation}",
+            "client",
+            {
+                "db.system": db_system,
+                "db.operation": operation,
+                "db.statement": statement,
+            },
+        )
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _end_span(_conn, _cursor, _statement, _params, context, _executemany):
+        span = getattr(context, "trace_span", None)
+        if span is not None:
+            get_tracer().end_span(span)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _fail_span(exception_context):
+        context = exception_context.execution_context
+        span = getattr(context, "trace_span", None) if context is not None else None
+        if span is not None:
+            span.record_error(exception_context.original_exception)
+            get_tracer().end_span(span)
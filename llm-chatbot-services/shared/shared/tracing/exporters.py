@@ -0,0 +1,119 @@
+"""Span exporters for the all services."""
+
+import asyncio
+import json
+import urllib.request
+from abc import ABC, abstractmethod
+from .span import Span
+
+# OTLP span kinds
+SPAN_KINDS = {"internal": 1, "server": 2, "client": 3}
+
+
+class SpanExporter(ABC):
+    """Sends finished spans somewhere"""
+
+    @abstractmethod
+    async def export(self, service_name: str, spans: list[Span]) -> None:
+        """Export a batch of spans"""
+
+    async def close(self) -> None:
+        """Release the exporter's resources"""
+
+
+class FileSpanExporter(SpanExporter):
+    """Appends spans to a file, one OTLP-JSON request per line
+
+    The lines are what an OTLP collector's file exporter writes, so they can
+    be replayed into a collector later or read with jq while offline.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the exporter"""
+        self.path = path
+
+    async def export(self, service_name: str, spans: list[Span]) -> None:
+        """Append the spans to the file"""
+        line = json.dumps(to_otlp_json(service_name, spans), separators=(",", ":"))
+        await asyncio.to_thread(self._append, line)
+
+    def _append(self, line: str) -> None:
+        """Append a line to the file"""
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(line + "\n")
+
+
+class OTLPHttpSpanExporter(SpanExporter):
+    """Posts spans to an OTLP/HTTP collector in the JSON encoding"""
+
+    def __init__(self, endpoint: str, timeout: float = 5.0):
+        """Initialize the exporter"""
+        self.endpoint = endpoint
+        self.timeout = timeout
+
+    async def export(self, service_name: str, spans: list[Span]) -> None:
+        """Post the spans to the collector"""
+        body = json.dumps(to_otlp_json(service_name, spans)).encode()
+        await asyncio.to_thread(self._post, body)
+
+    def _post(self, body: bytes) -> None:
+        """Post a request body to the collector"""
+        request = urllib.request.Request(
+            self.endpoint,
+            data=body,
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+def to_otlp_json(service_name: str, spans: list[Span]) -> dict:
+    """Encode spans as an OTLP ExportTraceServiceRequest"""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [_to_otlp_attribute("service.name", service_name)]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "shared.tracing"},
+                        "spans": [_to_otlp_span(span) for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+def _to_otlp_span(span: Span) -> dict:
+    """Encode one span"""
+    encoded = {
+        "traceId": span.context.trace_id,
+        "spanId": span.context.span_id,
+        "name": span.name,
+        "kind": SPAN_KINDS.get(span.kind, 1),
+        "startTimeUnixNano": str(span.start_time_ns),
+        "endTimeUnixNano": str(span.end_time_ns),
+        "attributes": [
+            _to_otlp_attribute(key, value) for key, value in span.attributes.items()
+        ],
+        "status": {"code": 2, "message": span.error} if span.error else {},
+    }
+    if span.parent_id is not None:
+        encoded["parentSpanId"] = span.parent_id
+    return encoded
+
+
+def _to_otlp_attribute(key: str, value) -> dict:
+    """Encode one attribute"""
+    if isinstance(value, bool):
+        encoded = {"boolValue": value}
+    elif isinstance(value, int):
+        encoded = {"intValue": str(value)}
+    elif isinstance(value, float):
+        encoded = {"doubleValue": value}
+    else:
+        encoded = {"stringValue": str(value)}
+    return {"key": key, "value": encoded}
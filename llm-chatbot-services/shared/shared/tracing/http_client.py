@@ -0,0 +1,40 @@
+"""Outbound HTTP spans and traceparent propagation for the all services."""
+
+import httpx
+from .tracer import get_tracer
+
+
+class TracingTransport(httpx.AsyncBaseTransport):
+    """Wraps an httpx transport to send every request in a client span
+
+    The request carries the span as its traceparent, replacing any the
+    caller set, so the next hop continues this service's trace. A streamed
+    response's span ends once its headers arrive.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None):
+        """Initialize the transport"""
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request in a client span"""
+        with get_tracer().span(
+            f"{request.method} {request.url.host}",
+            "client",
+            {
+                "http.request.method": request.method,
+                "server.address": request.url.host,
+                "server.port": request.url.port or 0,
+                "url.path": request.url.path,
+            },
+        ) as span:
+            request.headers["traceparent"] = span.context.to_traceparent()
+            response = await self.transport.handle_async_request(request)
+            span.set_attribute("http.response.status_code", response.status_code)
+            if response.status_code >= 500:
+                span.record_error(f"HTTP {response.status_code}")
+            return response
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport"""
+        await self.transport.aclose()
@@ -0,0 +1,47 @@
+"""Tracing middleware for the all services."""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from .span import SpanContext
+from .tracer import get_tracer
+
+
+class TracingMiddleware:
+    """Serves every request in a server span continuing the caller's trace"""
+
+    def __init__(self, app: ASGIApp):
+        """Initialize the tracing middleware"""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Trace the request"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        parent = None
+        for key, value in scope["headers"]:
+            if key == b"traceparent":
+                parent = SpanContext.from_traceparent(value.decode("latin-1"))
+                break
+
+        attributes = {
+            "http.request.method": scope["method"],
+            "url.path": scope["path"],
+        }
+        with get_tracer().span(scope["method"], "server", attributes, parent) as span:
+
+            async def send_with_status(message: Message):
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.response.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.record_error(f"HTTP {message['status']}")
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                # The route is only known once the request was routed
+                route = getattr(scope.get("route"), "path", None)
+                if route is not None:
+                    span.name = f"{scope['method']} {route}"
+                    span.set_attribute("http.route", route)
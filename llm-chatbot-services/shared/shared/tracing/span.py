@@ -0,0 +1,79 @@
+"""Spans and W3C trace context for the all services."""
+
+import re
+import secrets
+import time
+from dataclasses import dataclass, field
+
+TRACEPARENT_PATTERN = re.compile(
+    r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})(-.*)?$"
+)
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    """Identifies a span within its trace, as carried by traceparent"""
+
+    trace_id: str
+    span_id: str
+    sampled: bool
+
+    @classmethod
+    def from_traceparent(cls, traceparent: str | None) -> "SpanContext | None":
+        """Parse a traceparent header, None when it is missing or invalid"""
+        if not traceparent:
+            return None
+        match = TRACEPARENT_PATTERN.match(traceparent.strip().lower())
+        if match is None:
+            return None
+        version, trace_id, span_id, flags, rest = match.groups()
+        # Version 00 has no trailing fields and ff is forbidden
+        if version == "ff" or (version == "00" and rest):
+            return None
+        if trace_id == "0" * 32 or span_id == "0" * 16:
+            return None
+        return cls(trace_id, span_id, bool(int(flags, 16) & 1))
+
+    def to_traceparent(self) -> str:
+        """Format the context as a traceparent header"""
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+
+def new_trace_id() -> str:
+    """Generate a random trace id"""
+    return secrets.token_hex(16)
+
+
+def new_span_id() -> str:
+    """Generate a random span id"""
+    return secrets.token_hex(8)
+
+
+@dataclass
+class Span:
+    """A timed operation of a trace"""
+
+    name: str
+    context: SpanContext
+    parent_id: str | None
+    kind: str = "internal"
+    attributes: dict = field(default_factory=dict)
+    start_time_ns: int = field(default_factory=time.time_ns)
+    end_time_ns: int | None = None
+    error: str | None = None
+
+    def set_attribute(self, key: str, value) -> None:
+        """Set an attribute of the span"""
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException | str) -> None:
+        """Mark the span as failed"""
+        if isinstance(error, BaseException):
+            self.attributes["exception.type"] = type(error).__name__
+            error = str(error) or type(error).__name__
+        self.error = error
+
+    @property
+    def duration(self) -> float:
+        """Duration of an ended span in seconds"""
+        return ((self.end_time_ns or time.time_ns()) - self.start_time_ns) / 1e9
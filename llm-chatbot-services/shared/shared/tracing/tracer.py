@@ -0,0 +1,178 @@
+"""Tracer for the all services."""
+
+import asyncio
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+from ..base_config import BaseAppConfig
+from ..logger import get_logger
+from .exporters import FileSpanExporter, OTLPHttpSpanExporter, SpanExporter
+from .span import Span, SpanContext, new_span_id, new_trace_id
+
+logger = get_logger(service_name="tracer")
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """Creates spans and exports the sampled ones in batches
+
+    Spans are always created so trace context keeps propagating, but only
+    spans of sampled traces are queued for the exporter. The queue is
+    bounded, so a slow or unreachable exporter drops spans rather than
+    growing memory or slowing requests down.
+    """
+
+    def __init__(
+        self,
+        service_name: str,
+        exporter: SpanExporter | None = None,
+        sample_ratio: float = 1.0,
+        export_interval: float = 2.0,
+        max_batch_size: int = 512,
+        max_queue_size: int = 4096,
+    ):
+        """Initialize the tracer"""
+        self.service_name = service_name
+        self.exporter = exporter
+        self.sample_ratio = sample_ratio
+        self.export_interval = export_interval
+        self.max_batch_size = max_batch_size
+        self.max_queue_size = max_queue_size
+        self.dropped = 0
+        self._queue: list[Span] = []
+        self._batch_ready = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @classmethod
+    def from_config(cls, service_name: str, app_config: BaseAppConfig) -> "Tracer":
+        """Build the tracer from the service's tracing config"""
+        exporter = None
+        if app_config.TRACING_EXPORTER == "file":
+            exporter = FileSpanExporter(app_config.TRACING_FILE_PATH)
+        elif app_config.TRACING_EXPORTER == "otlp":
+            exporter = OTLPHttpSpanExporter(app_config.TRACING_OTLP_ENDPOINT)
+        return cls(service_name, exporter, app_config.TRACING_SAMPLE_RATIO)
+
+    async def start(self) -> None:
+        """Start exporting in the background"""
+        if self.exporter is not None and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop exporting and flush the spans still queued"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self.flush()
+        await self.exporter.close()
+
+    def start_span(
+        self,
+        name: str,
+        kind: str = "internal",
+        attributes: dict | None = None,
+        parent: SpanContext | None = None,
+    ) -> Span:
+        """Start a child of parent, or of the current span, without activating it"""
+        if parent is None:
+            current = _current_span.get()
+            parent = current.context if current is not None else None
+        if parent is None:
+            context = SpanContext(
+                new_trace_id(), new_span_id(), random.random() < self.sample_ratio
+            )
+        else:
+            context = SpanContext(parent.trace_id, new_span_id(), parent.sampled)
+        return Span(
+            name=name,
+            context=context,
+            parent_id=parent.span_id if parent is not None else None,
+            kind=kind,
+            attributes=attributes or {},
+        )
+
+    def end_span(self, span: Span) -> None:
+        """End a span and queue it for export if its trace is sampled"""
+        if span.end_time_ns is not None:
+            return
+        span.end_time_ns = time.time_ns()
+        if self.exporter is None or not span.context.sampled:
+            return
+        if len(self._queue) >= self.max_queue_size:
+            self.dropped += 1
+            return
+        self._queue.append(span)
+        if len(self._queue) >= self.max_batch_size:
+            self._batch_ready.set()
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        kind: str = "internal",
+        attributes: dict | None = None,
+        parent: SpanContext | None = None,
+    ) -> Iterator[Span]:
+        """Run the wrapped block in a new current span"""
+        span = self.start_span(name, kind, attributes, parent)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except asyncio.CancelledError:
+            span.set_attribute("cancelled", True)
+            raise
+        except Exception as e:
+            span.record_error(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span)
+
+    async def flush(self) -> None:
+        """Export every queued span"""
+        while self._queue:
+            batch = self._queue[: self.max_batch_size]
+            del self._queue[: self.max_batch_size]
+            try:
+                await self.exporter.export(self.service_name, batch)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error(f"Failed to export {len(batch)} spans: {e}")
+
+    async def _run(self) -> None:
+        """Export queued spans every interval, or as soon as a batch is full"""
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._batch_ready.wait(), timeout=self.export_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._batch_ready.clear()
+            await self.flush()
+
+
+_tracer = Tracer("unknown")
+
+
+def get_current_span() -> Span | None:
+    """Get the span of the running request or operation"""
+    return _current_span.get()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer"""
+    return _tracer
+
+
+def set_tracer(tracer: Tracer) -> None:
+    """Replace the process-wide tracer"""
+    global _tracer  # pylint: disable=global-statement
+    _tracer = tracer
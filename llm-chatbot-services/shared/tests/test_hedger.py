@@ -0,0 +1,132 @@
+"""Tests for request hedging"""
+
+import asyncio
+import pytest
+from shared import Hedger, RetryBudget
+
+pytestmark = pytest.mark.anyio
+
+
+def _build_hedger(min_retries_per_sec: float = 100.0) -> Hedger:
+    """A hedger that hedges after 10ms"""
+    return Hedger(
+        "test",
+        RetryBudget(ratio=0.0, min_retries_per_sec=min_retries_per_sec, ttl=1.0),
+        min_delay=0.01,
+        max_delay=0.01,
+    )
+
+
+async def test_fast_attempt_is_not_hedged():
+    """An attempt finishing before the delay is the only one"""
+    hedger = _build_hedger()
+    started = []
+
+    async def attempt(index: int) -> int:
+        started.append(index)
+        return index
+
+    assert await hedger.run(attempt) == 0
+    assert started == [0]
+    assert hedger.hedges == 0
+
+
+async def test_hedge_wins_and_cancels_slow_attempt():
+    """A late first attempt is cancelled once the hedge succeeds"""
+    hedger = _build_hedger()
+    cancelled = asyncio.Event()
+
+    async def attempt(index: int) -> int:
+        if index == 0:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return index
+
+    assert await hedger.run(attempt) == 1
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    assert hedger.hedges == 1
+    assert hedger.hedges_won == 1
+
+
+async def test_loser_that_succeeded_is_discarded():
+    """A result the losing attempt still produced is handed to discard"""
+    hedger = _build_hedger()
+    discarded = asyncio.Queue()
+
+    async def attempt(index: int) -> str:
+        if index == 0:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                # Already holding a response when the cancellation came
+                return "late"
+        return "hedge"
+
+    assert await hedger.run(attempt, discarded.put) == "hedge"
+    assert await asyncio.wait_for(discarded.get(), timeout=1) == "late"
+    await asyncio.sleep(0)
+    assert not hedger._losers
+
+
+async def test_failed_hedge_does_not_win():
+    """A hedge that fails leaves the slow first attempt to finish"""
+    hedger = _build_hedger()
+
+    async def attempt(index: int) -> int:
+        if index == 1:
+            raise ConnectionError("hedge failed")
+        await asyncio.sleep(0.05)
+        return index
+
+    assert await hedger.run(attempt) == 0
+    assert hedger.hedges == 1
+    assert hedger.hedges_won == 0
+
+
+async def test_every_attempt_failing_raises_first_error():
+    """When both attempts fail the caller sees the first attempt's error"""
+    hedger = _build_hedger()
+
+    async def attempt(index: int) -> int:
+        if index == 0:
+            await asyncio.sleep(0.05)
+        raise ConnectionError(f"attempt {index} failed")
+
+    with pytest.raises(ConnectionError, match="attempt 0 failed"):
+        await hedger.run(attempt)
+
+
+async def test_exhausted_budget_denies_hedge():
+    """Without budget the slow attempt runs alone"""
+    hedger = _build_hedger(min_retries_per_sec=0.0)
+    started = []
+
+    async def attempt(index: int) -> int:
+        started.append(index)
+        await asyncio.sleep(0.05)
+        return index
+
+    assert await hedger.run(attempt) == 0
+    assert started == [0]
+    assert hedger.hedges_denied == 1
+
+
+def test_delay_follows_latency_percentile():
+    """The delay is max_delay until enough samples, then the clamped percentile"""
+    hedger = Hedger(
+        "test",
+        RetryBudget(),
+        percentile=0.9,
+        min_delay=0.05,
+        max_delay=1.0,
+        minimum_samples=10,
+    )
+    hedger._latencies.extend([0.1] * 9)
+    assert hedger.delay() == 1.0
+    hedger._latencies.append(0.5)
+    assert hedger.delay() == 0.1
+    hedger._latencies.extend([2.0] * 10)
+    assert hedger.delay() == 1.0
@@ -0,0 +1,36 @@
+"""Tests for the retry budget"""
+
+import time
+import pytest
+from shared import RetryBudget
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the monotonic clock with one the test moves by hand"""
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_min_retries_allowed_without_requests(clock):
+    """A quiet upstream can still be retried up to the floor"""
+    budget = RetryBudget(ratio=0.1, min_retries_per_sec=0.2, ttl=10.0)
+    assert [budget.try_withdraw() for _ in range(3)] == [True, True, False]
+
+
+def test_retries_scale_with_requests(clock):
+    """Each request adds ratio of a retry to the budget"""
+    budget = RetryBudget(ratio=0.5, min_retries_per_sec=0.0, ttl=10.0)
+    for _ in range(4):
+        budget.deposit()
+    assert [budget.try_withdraw() for _ in range(3)] == [True, True, False]
+
+
+def test_old_buckets_expire(clock):
+    """Requests and retries older than ttl no longer count"""
+    budget = RetryBudget(ratio=0.0, min_retries_per_sec=0.1, ttl=10.0)
+    assert budget.try_withdraw()
+    assert not budget.try_withdraw()
+    clock[0] += 10.0
+    assert budget.try_withdraw()
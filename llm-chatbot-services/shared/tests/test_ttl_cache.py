@@ -0,0 +1,68 @@
+"""Tests for the TTL cache"""
+
+import time
+import pytest
+from shared import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the monotonic clock with one the test moves by hand"""
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entry_expires_after_ttl(clock):
+    """An entry is served until its ttl and dropped after"""
+    cache = TTLCache(max_size=10, ttl=5.0)
+    cache.set("a", 1)
+    clock[0] += 4.9
+    assert cache.get("a") == 1
+    clock[0] += 0.1
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_entry_ttl_is_capped_by_cache_ttl(clock):
+    """A per-entry ttl can shorten but not extend the cache ttl"""
+    cache = TTLCache(max_size=10, ttl=5.0)
+    cache.set("short", 1, ttl=1.0)
+    cache.set("long", 2, ttl=60.0)
+    clock[0] += 1.0
+    assert "short" not in cache
+    clock[0] += 3.9
+    assert cache.get("long") == 2
+    clock[0] += 0.1
+    assert "long" not in cache
+
+
+def test_non_positive_ttl_removes_entry(clock):
+    """Setting an already expired entry drops the one cached before"""
+    cache = TTLCache(max_size=10, ttl=5.0)
+    cache.set("a", 1)
+    cache.set("a", 2, ttl=0.0)
+    assert "a" not in cache
+
+
+def test_overflow_evicts_least_recently_used(clock):
+    """A read marks an entry as used so the oldest unread one goes first"""
+    cache = TTLCache(max_size=2, ttl=5.0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+
+def test_evict_where_removes_matching_entries(clock):
+    """evict_where drops the matching entries and reports how many"""
+    cache = TTLCache(max_size=10, ttl=5.0)
+    cache.set(("alice", "/a"), 1)
+    cache.set(("alice", "/b"), 2)
+    cache.set(("bob", "/a"), 3)
+    assert cache.evict_where(lambda key, _: key[0] == "alice") == 2
+    assert len(cache) == 1
+    assert cache.get(("bob", "/a")) == 3